@@ -16,11 +16,17 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 sys.path.append(os.path.join(os.path.dirname(__file__), "backend"))
 
 # Import custom modules
+from data_collectors.intraday_bars import INTERVALS, IntradayBarAggregator
 from data_collectors.news_sentiment_collector import NewsSentimentCollector
 from data_collectors.stock_data_collector import StockDataCollector
+from data_collectors.synthetic_market import MarketReplay, generate_symbols
 from ml_models.ensemble_predictor import EnsemblePredictor
+from ml_models.technical_indicators import IndicatorEngine
+from utils.background import PeriodicTask
+from utils.circuit_breaker import get_circuit_breaker_stats
 from utils.config import Config
 from utils.database_manager import DatabaseManager
+from utils.rate_limiter import get_rate_limiter_stats
 
 # Configure logging
 log_level = getattr(logging, Config.LOG_LEVEL.upper(), logging.INFO)
@@ -54,14 +60,30 @@ socketio = SocketIO(
 
 # Initialize components
 db_manager = DatabaseManager()
-stock_collector = StockDataCollector()
-sentiment_collector = NewsSentimentCollector()
-ensemble_predictor = EnsemblePredictor()
+stock_collector = StockDataCollector(db_manager=db_manager)
+sentiment_collector = NewsSentimentCollector(db_manager=db_manager)
+indicator_engine = IndicatorEngine(
+    lambda symbol: stock_collector.get_recorded_history(
+        symbol, Config.INDICATOR_BACKFILL_DAYS
+    )
+)
+ensemble_predictor = EnsemblePredictor(
+    price_history=stock_collector.price_history, indicators=indicator_engine
+)
+intraday_bars = IntradayBarAggregator(
+    db_manager,
+    max_bars=Config.INTRADAY_MAX_BARS,
+    flush_batch_size=Config.INTRADAY_FLUSH_BATCH_SIZE,
+    timezone=Config.MARKET_TIMEZONE,
+)
 
 # Global variables
 active_stocks = Config.DEFAULT_STOCKS
+if Config.MARKET_DATA_PROVIDER == "synthetic" and Config.SYNTHETIC_SYMBOL_COUNT > 0:
+    active_stocks = active_stocks + generate_symbols(Config.SYNTHETIC_SYMBOL_COUNT)
+# Per-symbol news and sentiment state is only kept for the active stocks
+active_symbols = set(active_stocks)
 prediction_cache = {}
-sentiment_cache = {}
 
 logger.info(f"Starting Real-time ML Stock Dashboard...")
 logger.info(f"Active stocks: {active_stocks}")
@@ -82,12 +104,14 @@ def get_stocks():
 @app.route("/api/stock/<symbol>")
 def get_stock_data(symbol):
     """Get current stock data and predictions"""
+    if symbol not in active_symbols:
+        return jsonify({"error": "Unknown symbol"}), 404
     try:
         # Get current stock data
         stock_data = stock_collector.get_current_data(symbol)
 
-        # Get sentiment analysis
-        sentiment_data = sentiment_collector.get_sentiment_for_stock(symbol)
+        # Get sentiment analysis (time-decayed aggregate, refreshed in background)
+        sentiment_data = sentiment_collector.get_current_sentiment(symbol)
 
         # Get price prediction
         if symbol not in prediction_cache or _is_cache_expired(symbol):
@@ -122,7 +146,11 @@ def get_historical_data(symbol):
     """Get historical data for charts"""
     try:
         days = request.args.get("days", 30, type=int)
-        data = stock_collector.get_historical_data(symbol, days)
+        layout = request.args.get("format", "rows")
+        if layout not in ("rows", "columns"):
+            return jsonify({"error": "format must be 'rows' or 'columns'"}), 400
+
+        data = stock_collector.get_historical_data(symbol, days, layout=layout)
         return jsonify(data)
     except Exception as e:
         safe_symbol = (symbol or "").replace("\r", "").replace("\n", "")
@@ -130,11 +158,48 @@ def get_historical_data(symbol):
         return jsonify({"error": "An internal error has occurred."}), 500
 
 
+@app.route("/api/intraday/<symbol>")
+def get_intraday_data(symbol):
+    """Get intraday OHLCV bars built from the live quote stream"""
+    try:
+        interval = request.args.get("interval", "1m")
+        if interval not in INTERVALS:
+            return (
+                jsonify({"error": f"interval must be one of {list(INTERVALS)}"}),
+                400,
+            )
+
+        limit = request.args.get("limit", type=int)
+        bars = intraday_bars.get_bars(symbol, interval, limit=limit)
+        return jsonify({"symbol": symbol, "interval": interval, "bars": bars})
+    except Exception:
+        safe_symbol = (symbol or "").replace("\r", "").replace("\n", "")
+        logger.exception(f"Exception in get_intraday_data for symbol '{safe_symbol}'")
+        return jsonify({"error": "An internal error has occurred."}), 500
+
+
+@app.route("/api/indicators/<symbol>")
+def get_indicators(symbol):
+    """Get technical indicators (SMA, EMA, RSI, MACD, Bollinger bands)"""
+    try:
+        indicators = indicator_engine.get(symbol)
+        if indicators is None:
+            return jsonify({"error": "No price history available"}), 404
+        return jsonify(indicators)
+    except Exception:
+        safe_symbol = (symbol or "").replace("\r", "").replace("\n", "")
+        logger.exception(f"Exception in get_indicators for symbol '{safe_symbol}'")
+        return jsonify({"error": "An internal error has occurred."}), 500
+
+
 @app.route("/api/sentiment/<symbol>")
 def get_sentiment_analysis(symbol):
     """Get detailed sentiment analysis"""
+    if symbol not in active_symbols:
+        return jsonify({"error": "Unknown symbol"}), 404
     try:
-        sentiment_data = sentiment_collector.get_detailed_sentiment(symbol)
+        days = request.args.get("days", 7, type=int)
+        sentiment_data = sentiment_collector.get_detailed_sentiment(symbol, days)
         return jsonify(sentiment_data)
     except Exception as e:
         safe_symbol = (symbol or "").replace("\r", "").replace("\n", "")
@@ -159,25 +224,85 @@ def get_predictions(symbol):
 @app.route("/api/news/<symbol>")
 def get_news(symbol):
     """Get news articles for a specific stock"""
+    if symbol not in active_symbols:
+        return jsonify({"error": "Unknown symbol"}), 404
     try:
         # Get news articles (this would come from the news collector)
         news_articles = sentiment_collector._get_news_api_data(symbol)
         rss_news = sentiment_collector._get_rss_news(symbol)
 
-        all_news = news_articles + rss_news
+        all_news, duplicates = sentiment_collector.dedupe_articles(
+            news_articles + rss_news
+        )
 
         # Sort by date and limit to recent articles
         all_news = sorted(
             all_news, key=lambda x: x.get("published_date", ""), reverse=True
         )[:10]
 
-        return jsonify({"symbol": symbol, "articles": all_news, "count": len(all_news)})
+        return jsonify(
+            {
+                "symbol": symbol,
+                "articles": all_news,
+                "count": len(all_news),
+                "duplicates_dropped": duplicates,
+            }
+        )
     except Exception as e:
         safe_symbol = (symbol or "").replace("\r", "").replace("\n", "")
         logger.error(f"Error getting news for {safe_symbol}: {e}")
         return jsonify({"symbol": symbol, "articles": [], "count": 0})
 
 
+@app.route("/api/market/overview")
+def get_market_overview():
+    """Get the latest market index snapshot"""
+    try:
+        return jsonify(stock_collector.get_market_overview())
+    except Exception:
+        logger.exception("Exception in get_market_overview")
+        return jsonify({"error": "An internal error has occurred."}), 500
+
+
+@app.route("/api/market/sentiment")
+def get_market_sentiment():
+    """Get the latest market-wide sentiment snapshot
+
+    The ETag names the snapshot version, so polling clients get a 304 until
+    the background refresher publishes a new one.
+    """
+    try:
+        snapshot = sentiment_collector.get_market_sentiment_overview()
+        response = jsonify(snapshot)
+        response.set_etag(f"{snapshot['version']}-{snapshot['as_of']}")
+        return response.make_conditional(request)
+    except Exception:
+        logger.exception("Exception in get_market_sentiment")
+        return jsonify({"error": "An internal error has occurred."}), 500
+
+
+@app.route("/api/status")
+def get_status():
+    """Get runtime status of caches and data providers"""
+    return jsonify(
+        {
+            "quote_cache": stock_collector.get_cache_stats(),
+            "quote_providers": stock_collector.get_provider_stats(),
+            "rate_limiters": get_rate_limiter_stats(),
+            "circuit_breakers": get_circuit_breaker_stats(),
+            "intraday_bars": intraday_bars.stats(),
+            "price_history": stock_collector.price_history.stats(),
+            "indicators": indicator_engine.stats(),
+            "feed_cache": sentiment_collector.get_feed_cache_stats(),
+            "sentiment_memo": sentiment_collector.get_sentiment_memo_stats(),
+            "sentiment_pool": sentiment_collector.get_sentiment_pool_stats(),
+            "nltk": sentiment_collector.get_nltk_status(),
+            "article_dedup": sentiment_collector.get_article_dedup_stats(),
+            "sentiment_aggregates": sentiment_collector.get_sentiment_aggregate_stats(),
+        }
+    )
+
+
 @app.route("/api/portfolio", methods=["GET", "POST"])
 def handle_portfolio():
     """Handle portfolio operations"""
@@ -231,10 +356,17 @@ def broadcast_updates():
     """Broadcast real-time updates to all clients"""
     while True:
         try:
+            # Get latest data for every symbol in batched provider calls
+            quotes = stock_collector.get_current_data_batch(active_stocks)
+
+            # Simulated fallback prices are broadcast but never stored as bars
+            recorded = stock_collector.recordable_quotes(quotes)
+            intraday_bars.add_quotes(recorded)
+            indicator_engine.on_quotes(recorded)
+
             for symbol in active_stocks:
-                # Get latest data
-                stock_data = stock_collector.get_current_data(symbol)
-                sentiment_data = sentiment_collector.get_sentiment_for_stock(symbol)
+                stock_data = quotes[symbol]
+                sentiment_data = sentiment_collector.get_current_sentiment(symbol)
 
                 # Prepare update
                 update = {
@@ -256,6 +388,27 @@ def broadcast_updates():
             time.sleep(30)
 
 
+def broadcast_replay_ticks(quotes):
+    """Broadcast one tick of synthetic market replay to all clients"""
+    stock_collector.price_history.append_quotes(quotes)
+    intraday_bars.add_quotes(quotes)
+    indicator_engine.on_quotes(quotes)
+    timestamp = datetime.now().isoformat()
+    for symbol, stock_data in quotes.items():
+        sentiment_data = sentiment_collector.sentiment_aggregates.get(symbol) or {}
+        socketio.emit(
+            "stock_update",
+            {
+                "symbol": symbol,
+                "price": stock_data["current_price"],
+                "change": stock_data["change_percent"],
+                "volume": stock_data["volume"],
+                "sentiment_score": sentiment_data.get("compound", 0.0),
+                "timestamp": timestamp,
+            },
+        )
+
+
 def schedule_model_retraining():
     """Schedule periodic model retraining"""
     try:
@@ -279,11 +432,46 @@ if __name__ == "__main__":
     except Exception as e:
         logger.error(f"Database initialization failed: {e}")
 
+    # Fork the sentiment scoring workers while this is the only thread
+    sentiment_collector.start_sentiment_pool()
+
     # Start background threads
-    update_thread = threading.Thread(target=broadcast_updates)
-    update_thread.daemon = True
-    update_thread.start()
-    logger.info("Background update thread started")
+    threading.Thread(
+        target=sentiment_collector.warm_up, name="sentiment-warm-up", daemon=True
+    ).start()
+    logger.info("Sentiment analyzer warm-up started")
+
+    sentiment_collector.start_sentiment_refresh(active_stocks)
+    logger.info("Sentiment and market sentiment refresher started")
+
+    stock_collector.start_fundamentals_refresh(active_stocks)
+    logger.info("Fundamentals refresher started")
+
+    stock_collector.start_market_overview_refresh()
+    logger.info("Market overview refresher started")
+
+    PeriodicTask(
+        "intraday-bar-flush",
+        Config.INTRADAY_FLUSH_INTERVAL,
+        intraday_bars.seal_and_flush,
+        initial_delay=Config.INTRADAY_FLUSH_INTERVAL,
+    ).start()
+    logger.info("Intraday bar flusher started")
+
+    if Config.MARKET_DATA_PROVIDER == "synthetic" and Config.SYNTHETIC_REPLAY_RATE > 0:
+        # Load-testing mode: push synthetic ticks at a fixed rate
+        MarketReplay(
+            stock_collector.synthetic_market,
+            active_stocks,
+            on_tick=broadcast_replay_ticks,
+            ticks_per_second=Config.SYNTHETIC_REPLAY_RATE,
+        ).start()
+        logger.info("Synthetic market replay started")
+    else:
+        update_thread = threading.Thread(target=broadcast_updates)
+        update_thread.daemon = True
+        update_thread.start()
+        logger.info("Background update thread started")
 
     schedule_thread = threading.Thread(target=schedule_model_retraining)
     schedule_thread.daemon = True
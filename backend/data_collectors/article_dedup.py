@@ -0,0 +1,228 @@
+import hashlib
+import threading
+from collections import OrderedDict, defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import numpy as np
+from data_collectors.keyword_matcher import TOKEN_RE
+
+# Query parameters that only track the referrer or campaign
+TRACKING_PARAMS = {
+    "cmpid",
+    "dclid",
+    "fbclid",
+    "gclid",
+    "guccounter",
+    "guce_referrer",
+    "guce_referrer_sig",
+    "mc_cid",
+    "mc_eid",
+    "msclkid",
+    "ncid",
+    "ref",
+    "ref_src",
+    "soc_src",
+    "soc_trk",
+    "src",
+    "taid",
+    "yptr",
+}
+
+SHINGLE_SIZE = 4
+
+# Descriptions shorter than this are teasers, too short to fingerprint
+MIN_DESCRIPTION_LENGTH = 60
+
+
+def canonical_url(url: str) -> str:
+    """URL without tracking parameters or fragment, query sorted"""
+    if not url:
+        return ""
+    parts = urlsplit(url.strip())
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith("utm_")
+    )
+    return urlunsplit(
+        (
+            parts.scheme.lower(),
+            parts.netloc.lower(),
+            parts.path.rstrip("/") or "/",
+            urlencode(query),
+            "",
+        )
+    )
+
+
+def url_key(url: str) -> str:
+    """Canonical URL with scheme and "www." dropped, for equality checks"""
+    url = canonical_url(url)
+    if not url:
+        return ""
+    key = url.split("://", 1)[-1]
+    return key[4:] if key.startswith("www.") else key
+
+
+def strip_source(title: str, source: Optional[str]) -> str:
+    """Title without a trailing " - Reuters" / " | MarketWatch" naming its source"""
+    if source:
+        for separator in (" - ", " | ", " -- "):
+            head, _, tail = title.rpartition(separator)
+            if head and tail.strip().lower() == source.strip().lower():
+                return head
+    return title
+
+
+def simhash(text: str) -> int:
+    """64-bit SimHash over character shingles of the normalized text"""
+    normalized = " ".join(TOKEN_RE.findall(text.lower()))
+    if not normalized:
+        return 0
+    shingles = {
+        normalized[i : i + SHINGLE_SIZE]
+        for i in range(max(1, len(normalized) - SHINGLE_SIZE + 1))
+    }
+    digests = b"".join(
+        hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest()
+        for shingle in shingles
+    )
+    bits = np.unpackbits(np.frombuffer(digests, dtype=np.uint8).reshape(-1, 8), axis=1)
+    majority = bits.sum(axis=0) * 2 > len(shingles)
+    return int.from_bytes(np.packbits(majority).tobytes(), "big")
+
+
+class SimHashIndex:
+    """Banded index of 64-bit fingerprints for Hamming-distance lookups
+
+    Fingerprints are split into ``max_distance + 1`` bands; two fingerprints
+    within ``max_distance`` bits agree exactly on at least one band, so only
+    entries sharing a band value are compared.
+    """
+
+    def __init__(self, max_distance: int = 3):
+        self.max_distance = max_distance
+        bands = max_distance + 1
+        edges = [round(64 * i / bands) for i in range(bands + 1)]
+        self._bands = [(lo, (1 << (hi - lo)) - 1) for lo, hi in zip(edges, edges[1:])]
+        self._tables = [defaultdict(set) for _ in self._bands]
+        self._fingerprints: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._fingerprints)
+
+    def find(self, fingerprint: int) -> Optional[int]:
+        """Id of an entry within max_distance bits, if any"""
+        for table, key in zip(self._tables, self._keys(fingerprint)):
+            for entry_id in table.get(key, ()):
+                distance = (self._fingerprints[entry_id] ^ fingerprint).bit_count()
+                if distance <= self.max_distance:
+                    return entry_id
+        return None
+
+    def add(self, entry_id: int, fingerprint: int):
+        self._fingerprints[entry_id] = fingerprint
+        for table, key in zip(self._tables, self._keys(fingerprint)):
+            table[key].add(entry_id)
+
+    def remove(self, entry_id: int):
+        fingerprint = self._fingerprints.pop(entry_id, None)
+        if fingerprint is None:
+            return
+        for table, key in zip(self._tables, self._keys(fingerprint)):
+            table[key].discard(entry_id)
+            if not table[key]:
+                del table[key]
+
+    def _keys(self, fingerprint: int) -> Iterable[int]:
+        return [(fingerprint >> shift) & mask for shift, mask in self._bands]
+
+
+class ArticleDeduplicator:
+    """Drops articles already seen from another source
+
+    An article is a duplicate when its canonical URL (tracking parameters
+    stripped) matches, or when its title or long-enough description is
+    within ``max_distance`` bits of a seen one by SimHash. Wire copies are
+    retitled or trimmed by each outlet, so either field can give them away.
+    The oldest entries are forgotten beyond ``max_size``.
+    """
+
+    def __init__(self, max_distance: int = 3, max_size: int = 5000):
+        self.max_size = max_size
+        self._urls: Dict[str, int] = {}
+        self._titles = SimHashIndex(max_distance)
+        self._descriptions = SimHashIndex(max_distance)
+        self._entries: "OrderedDict[int, str]" = OrderedDict()
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def filter(self, articles: List[Dict]) -> List[Dict]:
+        """Articles not seen before (first copy wins), remembering them"""
+        unique = []
+        with self._lock:
+            for article in articles:
+                fingerprints = self._fingerprints(article)
+                if self._is_duplicate(*fingerprints):
+                    self.dropped += 1
+                    continue
+                self._add(*fingerprints)
+                unique.append(article)
+        return unique
+
+    def seen(self, article: Dict) -> bool:
+        """Whether an article matches a remembered one (nothing is added)"""
+        fingerprints = self._fingerprints(article)
+        with self._lock:
+            return self._is_duplicate(*fingerprints)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            size = len(self._entries)
+        return {"size": size, "max_size": self.max_size, "dropped": self.dropped}
+
+    def _fingerprints(self, article: Dict) -> Tuple[str, int, Optional[int]]:
+        title = strip_source(article.get("title") or "", article.get("source"))
+        description = article.get("description") or ""
+        return (
+            url_key(article.get("url") or ""),
+            simhash(title),
+            (
+                simhash(description)
+                if len(description) >= MIN_DESCRIPTION_LENGTH
+                else None
+            ),
+        )
+
+    def _is_duplicate(self, url: str, title: int, description: Optional[int]) -> bool:
+        if url and url in self._urls:
+            return True
+        if title and self._titles.find(title) is not None:
+            return True
+        return (
+            description is not None and self._descriptions.find(description) is not None
+        )
+
+    def _add(self, url: str, title: int, description: Optional[int]):
+        entry_id = self._next_id
+        self._next_id += 1
+        self._entries[entry_id] = url
+        if url:
+            self._urls[url] = entry_id
+        if title:
+            self._titles.add(entry_id, title)
+        if description is not None:
+            self._descriptions.add(entry_id, description)
+
+        while len(self._entries) > self.max_size:
+            old_id, old_url = self._entries.popitem(last=False)
+            if self._urls.get(old_url) == old_id:
+                del self._urls[old_url]
+            self._titles.remove(old_id)
+            self._descriptions.remove(old_id)
@@ -0,0 +1,154 @@
+import logging
+import threading
+import time
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+BAR_COLUMNS = ["date", "open", "high", "low", "close", "volume"]
+
+# A fetch that returns no bars is only trusted as "no trading days" for short
+# ranges (weekends, holidays); longer empty ranges are treated as a provider
+# failure and fetched again next time.
+MAX_EMPTY_RANGE_DAYS = 4
+
+DateRange = Tuple[date, date]
+
+
+def bars_to_columns(bars: pd.DataFrame) -> Dict[str, List]:
+    """Columnar bar payload: one list per field, built with vectorized casts"""
+    return {
+        "date": bars["date"].astype(str).tolist(),
+        "open": bars["open"].to_numpy(dtype=float).tolist(),
+        "high": bars["high"].to_numpy(dtype=float).tolist(),
+        "low": bars["low"].to_numpy(dtype=float).tolist(),
+        "close": bars["close"].to_numpy(dtype=float).tolist(),
+        "volume": bars["volume"].to_numpy(dtype=np.int64).tolist(),
+    }
+
+
+def bars_to_rows(bars: pd.DataFrame) -> List[Dict]:
+    """Row bar payload (one dict per day) for the existing chart frontend"""
+    columns = bars_to_columns(bars)
+    return [dict(zip(BAR_COLUMNS, values)) for values in zip(*columns.values())]
+
+
+def merge_ranges(ranges: List[DateRange]) -> List[DateRange]:
+    """Merge overlapping or adjacent inclusive date ranges"""
+    merged = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + timedelta(days=1):
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def subtract_ranges(start: date, end: date, covered: List[DateRange]):
+    """Return the parts of [start, end] not included in the covered ranges"""
+    missing = []
+    cursor = start
+    for covered_start, covered_end in merge_ranges(covered):
+        if covered_end < cursor:
+            continue
+        if covered_start > end:
+            break
+        if covered_start > cursor:
+            missing.append((cursor, covered_start - timedelta(days=1)))
+        cursor = covered_end + timedelta(days=1)
+        if cursor > end:
+            break
+    if cursor <= end:
+        missing.append((cursor, end))
+    return missing
+
+
+class BarStore:
+    """Local daily OHLCV store that only fetches date ranges it has not seen
+
+    Bars live in SQLite keyed by symbol and date, alongside the date ranges
+    that have already been fetched. Closed days never change, so a request
+    only goes upstream for gaps in that coverage. The current (still open)
+    day is refetched once its in-memory freshness window has expired.
+    """
+
+    def __init__(
+        self,
+        db_manager,
+        fetcher: Callable[[str, date, date], Optional[pd.DataFrame]],
+        today_ttl: float = 60,
+        today: Callable[[], date] = date.today,
+    ):
+        self.db_manager = db_manager
+        self.fetcher = fetcher
+        self.today_ttl = today_ttl
+        self._today = today
+        self._today_fetched_at = {}
+        self._locks = defaultdict(threading.Lock)
+        self._locks_guard = threading.Lock()
+
+        self.upstream_fetches = 0
+
+    def get_bars(self, symbol: str, start: date, end: date) -> pd.DataFrame:
+        """Return daily bars for [start, end], filling gaps from upstream"""
+        with self._symbol_lock(symbol):
+            for gap_start, gap_end in self.missing_ranges(symbol, start, end):
+                self._fill(symbol, gap_start, gap_end)
+
+        return self.db_manager.get_daily_bars(
+            symbol, start.isoformat(), end.isoformat()
+        )
+
+    def missing_ranges(self, symbol: str, start: date, end: date) -> List[DateRange]:
+        """Work out which parts of [start, end] still need to be fetched"""
+        covered = [
+            (date.fromisoformat(a), date.fromisoformat(b))
+            for a, b in self.db_manager.get_bar_coverage(symbol)
+        ]
+
+        today = self._today()
+        fetched_at = self._today_fetched_at.get(symbol)
+        if fetched_at is not None and time.time() - fetched_at < self.today_ttl:
+            covered.append((today, today))
+
+        return subtract_ranges(start, end, covered)
+
+    def _fill(self, symbol: str, start: date, end: date):
+        try:
+            bars = self.fetcher(symbol, start, end)
+        except Exception as e:
+            logger.error(f"Error fetching bars for {symbol} {start}..{end}: {e}")
+            return
+
+        self.upstream_fetches += 1
+        bars = bars if bars is not None else pd.DataFrame(columns=BAR_COLUMNS)
+
+        if bars.empty and (end - start).days >= MAX_EMPTY_RANGE_DAYS:
+            return
+
+        if not bars.empty:
+            self.db_manager.upsert_daily_bars(symbol, bars[BAR_COLUMNS])
+
+        # Only closed days become permanent coverage
+        today = self._today()
+        if end >= today:
+            self._today_fetched_at[symbol] = time.time()
+        closed_end = min(end, today - timedelta(days=1))
+        if start <= closed_end:
+            covered = [
+                (date.fromisoformat(a), date.fromisoformat(b))
+                for a, b in self.db_manager.get_bar_coverage(symbol)
+            ]
+            merged = merge_ranges(covered + [(start, closed_end)])
+            self.db_manager.replace_bar_coverage(
+                symbol, [(a.isoformat(), b.isoformat()) for a, b in merged]
+            )
+
+    def _symbol_lock(self, symbol: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks[symbol]
@@ -0,0 +1,190 @@
+import logging
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Dict, List, Optional
+
+import feedparser
+from utils.circuit_breaker import get_circuit_breaker
+
+logger = logging.getLogger(__name__)
+
+
+class ParsedFeed:
+    """A feed parsed once into plain article dicts"""
+
+    def __init__(self, url: str, title: str, entries: List[Dict]):
+        self.url = url
+        self.title = title
+        self.entries = entries
+
+
+def parse_feed(url: str, content: bytes) -> Optional[ParsedFeed]:
+    """Parse a feed body; None if it is not a usable feed"""
+    feed = feedparser.parse(content)
+    if feed.bozo and not feed.entries:
+        return None
+
+    title = feed.feed.get("title", "RSS Feed")
+    entries = []
+    for entry in feed.entries:
+        entry_title = entry.get("title", "")
+        description = entry.get("description", "") or entry.get("summary", "")
+        entries.append(
+            {
+                "title": entry_title,
+                "description": description,
+                "url": entry.get("link", ""),
+                "source": title,
+                "published_date": entry.get("published", ""),
+                # Lowercased once here instead of once per symbol
+                "content": (entry_title + " " + description).lower(),
+            }
+        )
+    return ParsedFeed(url, title, entries)
+
+
+class _CachedFeed:
+    def __init__(self):
+        self.feed: Optional[ParsedFeed] = None
+        self.etag: Optional[str] = None
+        self.last_modified: Optional[str] = None
+        self.fetched_at: Optional[float] = None
+
+
+class FeedCache:
+    """Shared RSS feed cache: each feed is fetched at most once per max_age
+
+    Every collector and request reads the same parsed entries. When an entry
+    is older than ``max_age`` the feed is revalidated with a conditional GET
+    (``If-None-Match`` / ``If-Modified-Since``); a 304 keeps the parsed
+    entries without downloading or parsing the body again. Concurrent
+    readers of an expired feed wait for a single fetch, and a failed fetch
+    keeps serving the last good copy.
+    """
+
+    def __init__(
+        self, http_client, max_age: float = 300, clock=time.time, workers: int = 8
+    ):
+        self.http = http_client
+        self.max_age = max_age
+        self._clock = clock
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, workers), thread_name_prefix="rss-fetch"
+        )
+        self._feeds: Dict[str, _CachedFeed] = defaultdict(_CachedFeed)
+        self._locks = defaultdict(threading.Lock)
+        self._locks_guard = threading.Lock()
+
+        self.hits = 0
+        self.fetches = 0
+        self.not_modified = 0
+        self.errors = 0
+        self.late = 0
+
+    def get(self, url: str, timeout: Optional[float] = None) -> Optional[ParsedFeed]:
+        """Parsed feed for a URL, refreshed if older than max_age"""
+        with self._url_lock(url):
+            cached = self._feeds[url]
+            if self._is_fresh(cached):
+                self.hits += 1
+                return cached.feed
+
+            self._refresh(url, cached, timeout)
+            return cached.feed
+
+    def get_many(
+        self,
+        urls: List[str],
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ) -> Dict[str, ParsedFeed]:
+        """Parsed feeds for several URLs, fetched concurrently
+
+        Each HTTP request is bounded by ``timeout``; feeds still in flight
+        after ``deadline`` seconds are left to finish in the background
+        (updating the cache for the next read) and served from their last
+        good copy, if any.
+        """
+        futures = {self._executor.submit(self.get, url, timeout): url for url in urls}
+        done, pending = wait(futures, timeout=deadline)
+
+        feeds = {}
+        for future in done:
+            feed = future.result()
+            if feed is not None:
+                feeds[futures[future]] = feed
+        for future in pending:
+            url = futures[future]
+            self.late += 1
+            logger.warning(f"RSS feed {url} missed the {deadline}s deadline")
+            if self._feeds[url].feed is not None:
+                feeds[url] = self._feeds[url].feed
+
+        return {url: feeds[url] for url in urls if url in feeds}
+
+    def invalidate(self, url: Optional[str] = None):
+        """Force a revalidation of one feed (or all feeds) on next read"""
+        for cached in [self._feeds[url]] if url else list(self._feeds.values()):
+            cached.fetched_at = None
+
+    def _is_fresh(self, cached: _CachedFeed) -> bool:
+        return (
+            cached.fetched_at is not None
+            and self._clock() - cached.fetched_at < self.max_age
+        )
+
+    def _refresh(self, url: str, cached: _CachedFeed, timeout: Optional[float]):
+        breaker = get_circuit_breaker(f"rss:{url}")
+        if not breaker.allow():
+            return
+
+        headers = {}
+        if cached.feed is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
+        try:
+            response = self.http.get(url, headers=headers, timeout=timeout)
+        except Exception as e:
+            breaker.record_failure()
+            self.errors += 1
+            logger.error(f"RSS feed error for {url}: {e}")
+            return
+
+        self.fetches += 1
+        if response.status_code == 304 and cached.feed is not None:
+            breaker.record_success()
+            self.not_modified += 1
+            cached.fetched_at = self._clock()
+            return
+
+        feed = parse_feed(url, response.content) if response.ok else None
+        if feed is None:
+            breaker.record_failure()
+            self.errors += 1
+            logger.error(f"RSS feed error for {url}: status {response.status_code}")
+            return
+
+        breaker.record_success()
+        cached.feed = feed
+        cached.etag = response.headers.get("ETag")
+        cached.last_modified = response.headers.get("Last-Modified")
+        cached.fetched_at = self._clock()
+
+    def stats(self) -> Dict:
+        return {
+            "feeds": len(self._feeds),
+            "hits": self.hits,
+            "fetches": self.fetches,
+            "not_modified": self.not_modified,
+            "errors": self.errors,
+            "late": self.late,
+        }
+
+    def _url_lock(self, url: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks[url]
@@ -0,0 +1,137 @@
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, Iterable, Optional
+
+from utils.background import PeriodicTask
+
+logger = logging.getLogger(__name__)
+
+FUNDAMENTAL_FIELDS = ("market_cap", "pe_ratio")
+
+
+class FundamentalsStore:
+    """Slow-moving per-symbol fundamentals kept off the quote hot path
+
+    Values such as market cap and P/E change at most daily, so they are
+    fetched by a background refresher, persisted to SQLite and merged into
+    quotes from memory.
+    """
+
+    def __init__(
+        self,
+        fetcher: Callable[[str], Optional[Dict]],
+        db_manager=None,
+        max_age: float = 86400,
+    ):
+        self.fetcher = fetcher
+        self.db_manager = db_manager
+        self.max_age = max_age
+        self._values = {}  # symbol -> fundamentals dict
+        self._fetched_at = {}  # symbol -> epoch seconds
+        self._tracked = set()
+        self._lock = threading.Lock()
+        self._task: Optional[PeriodicTask] = None
+
+    def get(self, symbol: str) -> Dict:
+        """Return cached fundamentals and track the symbol for refreshes"""
+        with self._lock:
+            self._tracked.add(symbol)
+            return self._values.get(symbol, {})
+
+    def merge_into(self, quote: Dict) -> Dict:
+        """Add cached fundamentals to a quote dict in place
+
+        Missing or zero values never replace what the quote already carries.
+        """
+        fundamentals = self.get(quote["symbol"])
+        for field in FUNDAMENTAL_FIELDS:
+            if fundamentals.get(field):
+                quote[field] = fundamentals[field]
+            else:
+                quote.setdefault(field, 0)
+        return quote
+
+    def load(self):
+        """Load persisted fundamentals from the database"""
+        if self.db_manager is None:
+            return
+
+        try:
+            rows = self.db_manager.get_fundamentals()
+        except Exception as e:
+            logger.warning(f"Could not load persisted fundamentals: {e}")
+            return
+
+        with self._lock:
+            for row in rows:
+                updated_at = datetime.fromisoformat(row["updated_at"]).timestamp()
+                if updated_at < self._fetched_at.get(row["symbol"], 0):
+                    continue
+                self._values[row["symbol"]] = {
+                    field: row[field] for field in FUNDAMENTAL_FIELDS
+                }
+                self._fetched_at[row["symbol"]] = updated_at
+
+        logger.info(f"Loaded fundamentals for {len(rows)} symbols")
+
+    def refresh(self, symbols: Optional[Iterable[str]] = None, force: bool = False):
+        """Fetch fundamentals for stale symbols and persist them"""
+        now = time.time()
+        with self._lock:
+            if symbols is not None:
+                self._tracked.update(symbols)
+            stale = [
+                symbol
+                for symbol in sorted(self._tracked)
+                if force or now - self._fetched_at.get(symbol, 0) >= self.max_age
+            ]
+
+        updated = []
+        for symbol in stale:
+            try:
+                data = self.fetcher(symbol)
+            except Exception as e:
+                logger.error(f"Fundamentals fetch error for {symbol}: {e}")
+                continue
+
+            if not data:
+                continue
+
+            values = {field: data.get(field) or 0 for field in FUNDAMENTAL_FIELDS}
+            with self._lock:
+                self._values[symbol] = values
+                self._fetched_at[symbol] = time.time()
+
+            updated.append(
+                {
+                    "symbol": symbol,
+                    **values,
+                    "updated_at": datetime.now().isoformat(),
+                }
+            )
+
+        if updated and self.db_manager is not None:
+            try:
+                self.db_manager.upsert_fundamentals(updated)
+            except Exception as e:
+                logger.error(f"Error persisting fundamentals: {e}")
+
+        return len(updated)
+
+    def start(self, symbols: Iterable[str], interval: float) -> PeriodicTask:
+        """Load persisted values and refresh in the background"""
+        with self._lock:
+            self._tracked.update(symbols)
+
+        if self._task is None:
+
+            def run():
+                if self._task.run_count == 0:
+                    self.load()
+                self.refresh()
+
+            self._task = PeriodicTask("fundamentals-refresh", interval, run)
+
+        return self._task.start()
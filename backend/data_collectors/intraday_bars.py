@@ -0,0 +1,227 @@
+import logging
+import threading
+from collections import deque
+from datetime import datetime
+from typing import Dict, List, Optional
+from zoneinfo import ZoneInfo
+
+logger = logging.getLogger(__name__)
+
+# Bar interval name -> length in seconds
+INTERVALS = {"1m": 60, "5m": 300, "1h": 3600}
+
+# Only finished 1-minute bars are persisted; coarser bars can be rebuilt
+PERSISTED_INTERVAL = "1m"
+
+
+class _Bar:
+    """An OHLCV bar being built from quote samples"""
+
+    __slots__ = ("start", "open", "high", "low", "close", "volume", "change_percent")
+
+    def __init__(self, start: float, price: float, volume: int, change_percent):
+        self.start = start
+        self.open = self.high = self.low = self.close = price
+        self.volume = volume
+        self.change_percent = change_percent
+
+    def update(self, price: float, volume: int, change_percent):
+        if price > self.high:
+            self.high = price
+        if price < self.low:
+            self.low = price
+        self.close = price
+        self.volume += volume
+        self.change_percent = change_percent
+
+    def to_dict(self) -> Dict:
+        return {
+            "timestamp": datetime.fromtimestamp(self.start).isoformat(),
+            "open": self.open,
+            "high": self.high,
+            "low": self.low,
+            "close": self.close,
+            "volume": self.volume,
+        }
+
+
+class _SymbolBars:
+    """Open and recently finished bars of every interval for one symbol"""
+
+    def __init__(self, max_bars: int):
+        self.last_timestamp: Optional[float] = None
+        self.last_volume: Optional[int] = None
+        self.current: Dict[str, _Bar] = {}
+        self.finished = {interval: deque(maxlen=max_bars) for interval in INTERVALS}
+
+
+class IntradayBarAggregator:
+    """Folds polled quotes into 1m/5m/1h OHLCV bars per symbol as they arrive
+
+    Each quote updates the open bar of every interval in O(1); a bar is
+    finished when the first quote of a later bucket arrives (or when
+    ``seal`` runs past its end). Recent finished bars stay in memory for
+    the intraday chart and finished 1-minute bars are queued for a batched
+    insert into ``stock_data``.
+
+    Buckets follow the exchange's wall clock in ``timezone``, so hourly
+    bars start on the local hour even where its UTC offset is not a whole
+    hour. Quote volume is the provider's cumulative session volume, so a
+    bar's volume is the increase between consecutive samples. Samples with
+    the same timestamp as the previous one (cached quotes) are ignored.
+    """
+
+    def __init__(
+        self,
+        db_manager=None,
+        max_bars: int = 500,
+        flush_batch_size: int = 200,
+        timezone: str = "America/New_York",
+    ):
+        self.db_manager = db_manager
+        self.timezone = ZoneInfo(timezone)
+        self.max_bars = max_bars
+        self.flush_batch_size = flush_batch_size
+        self._symbols: Dict[str, _SymbolBars] = {}
+        self._pending: List[tuple] = []
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+
+        self.samples = 0
+        self.flushed_bars = 0
+
+    def add_quotes(self, quotes: Dict[str, Dict]):
+        """Fold a batch of quotes (symbol -> quote) into the bars"""
+        with self._lock:
+            for symbol, quote in quotes.items():
+                if quote:
+                    self._add(symbol, quote)
+            flush_due = len(self._pending) >= self.flush_batch_size
+
+        if flush_due:
+            self.flush()
+
+    def add_quote(self, symbol: str, quote: Dict):
+        self.add_quotes({symbol: quote})
+
+    def _add(self, symbol: str, quote: Dict):
+        timestamp = quote.get("timestamp") or datetime.now()
+        if isinstance(timestamp, str):
+            timestamp = datetime.fromisoformat(timestamp)
+        ts = timestamp.timestamp()
+
+        state = self._symbols.get(symbol)
+        if state is None:
+            state = self._symbols[symbol] = _SymbolBars(self.max_bars)
+        elif state.last_timestamp is not None and ts <= state.last_timestamp:
+            return
+
+        price = float(quote["current_price"])
+        total_volume = int(quote.get("volume") or 0)
+        if state.last_volume is None:
+            volume = 0
+        elif total_volume >= state.last_volume:
+            volume = total_volume - state.last_volume
+        else:
+            # Session volume reset (new trading day)
+            volume = total_volume
+        state.last_timestamp = ts
+        state.last_volume = total_volume
+        change_percent = quote.get("change_percent")
+        offset = datetime.fromtimestamp(ts, self.timezone).utcoffset()
+        local_ts = ts + offset.total_seconds()
+
+        for interval, seconds in INTERVALS.items():
+            start = ts - local_ts % seconds
+            bar = state.current.get(interval)
+            if bar is not None and bar.start == start:
+                bar.update(price, volume, change_percent)
+                continue
+            if bar is not None:
+                self._finish(symbol, state, interval, bar)
+            elif (
+                state.finished[interval] and state.finished[interval][-1].start >= start
+            ):
+                # Late sample for a bar that was already sealed
+                continue
+            state.current[interval] = _Bar(start, price, volume, change_percent)
+
+        self.samples += 1
+
+    def _finish(self, symbol: str, state: _SymbolBars, interval: str, bar: _Bar):
+        state.finished[interval].append(bar)
+        if interval == PERSISTED_INTERVAL and self.db_manager is not None:
+            self._pending.append(
+                (
+                    symbol,
+                    datetime.fromtimestamp(bar.start).isoformat(sep=" "),
+                    bar.open,
+                    bar.close,
+                    bar.high,
+                    bar.low,
+                    bar.volume,
+                    bar.change_percent,
+                )
+            )
+
+    def seal(self, now: Optional[datetime] = None):
+        """Finish open bars whose interval has already ended"""
+        ts = (now or datetime.now()).timestamp()
+        with self._lock:
+            for symbol, state in self._symbols.items():
+                for interval, seconds in INTERVALS.items():
+                    bar = state.current.get(interval)
+                    if bar is not None and bar.start + seconds <= ts:
+                        self._finish(symbol, state, interval, bar)
+                        del state.current[interval]
+
+    def flush(self) -> int:
+        """Write queued finished 1-minute bars to the database in one batch"""
+        with self._flush_lock:
+            with self._lock:
+                rows, self._pending = self._pending, []
+            if not rows:
+                return 0
+
+            try:
+                self.db_manager.insert_stock_data_batch(rows)
+            except Exception as e:
+                logger.error(f"Error flushing {len(rows)} intraday bars: {e}")
+                with self._lock:
+                    self._pending = rows + self._pending
+                return 0
+
+            self.flushed_bars += len(rows)
+            return len(rows)
+
+    def seal_and_flush(self):
+        self.seal()
+        self.flush()
+
+    def get_bars(
+        self, symbol: str, interval: str = "1m", limit: Optional[int] = None
+    ) -> List[Dict]:
+        """Finished bars plus the open bar for a symbol, oldest first"""
+        if interval not in INTERVALS:
+            raise ValueError(f"Unknown interval {interval}")
+
+        with self._lock:
+            state = self._symbols.get(symbol)
+            if state is None:
+                return []
+            bars = list(state.finished[interval])
+            current = state.current.get(interval)
+            if current is not None:
+                bars.append(current)
+            if limit:
+                bars = bars[-limit:]
+            return [bar.to_dict() for bar in bars]
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "symbols": len(self._symbols),
+                "samples": self.samples,
+                "pending_bars": len(self._pending),
+                "flushed_bars": self.flushed_bars,
+            }
@@ -0,0 +1,81 @@
+import re
+import threading
+from typing import Dict, Iterable, List, Set
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Trie nodes are dicts keyed by token; this key (never a token) holds the
+# symbols whose keyword phrase ends at the node
+_SYMBOLS = ""
+
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_RE.findall(text.lower())
+
+
+def phrase_variants(tokens: List[str]) -> List[List[str]]:
+    """A keyword phrase and its simple plural ("iphone" -> "iphones")
+
+    Only keywords are pluralized; text is matched as written, so a keyword
+    that is itself a plural ("windows") never matches its singular.
+    """
+    variants = [tokens]
+    last = tokens[-1]
+    if last.isalpha() and len(last) > 1 and not last.endswith("s"):
+        variants.append(tokens[:-1] + [last + "s"])
+    return variants
+
+
+class KeywordMatcher:
+    """Token-boundary trie that tags text with every matching symbol in one scan
+
+    Keyword phrases ("tim cook", "model 3") are stored as token paths, so a
+    keyword only matches whole words: "ev" does not match "every". Each
+    keyword also matches its simple plural. Matching walks the trie
+    from each token of the text, so its cost depends on the text length and
+    the longest phrase, not on the number of symbols or keywords.
+    """
+
+    def __init__(self, keywords: Dict[str, Iterable[str]] = None):
+        self._root: Dict = {}
+        self._symbols: Set[str] = set()
+        self._lock = threading.Lock()
+        self.version = 0
+        for symbol, phrases in (keywords or {}).items():
+            self.add(symbol, phrases)
+
+    def add(self, symbol: str, phrases: Iterable[str]):
+        """Register keyword phrases for a symbol"""
+        with self._lock:
+            for phrase in phrases:
+                tokens = tokenize(phrase)
+                if not tokens:
+                    continue
+                for variant in phrase_variants(tokens):
+                    node = self._root
+                    for token in variant:
+                        node = node.setdefault(token, {})
+                    node.setdefault(_SYMBOLS, set()).add(symbol)
+            self._symbols.add(symbol)
+            self.version += 1
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._symbols
+
+    def match(self, text: str) -> Set[str]:
+        """All symbols with at least one keyword phrase in the text"""
+        tokens = tokenize(text)
+        found = set()
+        root = self._root
+        for i in range(len(tokens)):
+            node = root.get(tokens[i])
+            j = i + 1
+            while node is not None:
+                symbols = node.get(_SYMBOLS)
+                if symbols:
+                    found.update(symbols)
+                if j == len(tokens):
+                    break
+                node = node.get(tokens[j])
+                j += 1
+        return found
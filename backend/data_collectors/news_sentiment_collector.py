@@ -1,162 +1,325 @@
+import itertools
 import json
 import logging
 import os
-import re
 import sys
-from datetime import datetime, timedelta
-from typing import Dict, List
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timezone
+from typing import Dict, List, Optional, Tuple
 
-import feedparser
-import nltk
 import numpy as np
-from nltk.corpus import stopwords
-from nltk.stem import WordNetLemmatizer
-from nltk.tokenize import word_tokenize
-from textblob import TextBlob
-from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
-
-# Download required NLTK data
-try:
-    nltk.download("stopwords", quiet=True)
-    nltk.download("punkt", quiet=True)
-    nltk.download("wordnet", quiet=True)
-    nltk.download("vader_lexicon", quiet=True)
-except Exception as e:
-    # NLTK data may already be installed; log the failure and continue.
-    logging.warning("Failed to download some NLTK data resources: %s", e)
 
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from data_collectors.article_dedup import ArticleDeduplicator, canonical_url
+from data_collectors.feed_cache import FeedCache
+from data_collectors.keyword_matcher import KeywordMatcher
+from data_collectors.sentiment_accumulator import (
+    SentimentAccumulator,
+    published_timestamp,
+)
+from data_collectors.sentiment_memo import SentimentMemo
+from data_collectors.sentiment_scorer import (
+    NEUTRAL_SCORES,
+    SentimentProcessPool,
+    SentimentScorer,
+)
+from utils.background import PeriodicTask
+from utils.circuit_breaker import get_circuit_breaker
 from utils.config import Config
+from utils.http_client import HttpClient, get_http_client
+from utils.nltk_resources import get_nltk_resources
+from utils.rate_limiter import get_rate_limiter
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format=Config.LOG_FORMAT)
 logger = logging.getLogger(__name__)
 
+# Part of the sentiment memo key, with the scorer's effective text pipeline
+# (which depends on the NLTK data installed); bump when scoring changes
+SENTIMENT_MODEL_VERSION = "1"
+
+# Days of daily sentiment history served by get_detailed_sentiment
+MIN_HISTORY_DAYS = 7
+MAX_HISTORY_DAYS = 365
+
+# Fitted change in compound score across the history window for a trend
+TREND_THRESHOLD = 0.12
+
+
+def sentiment_label(compound: float) -> str:
+    """Overall sentiment label for a compound score"""
+    if compound >= 0.05:
+        return "positive"
+    elif compound <= -0.05:
+        return "negative"
+    return "neutral"
+
 
 class NewsSentimentCollector:
     """Collects news and performs sentiment analysis"""
 
-    def __init__(self):
+    def __init__(self, db_manager=None, http_client: Optional[HttpClient] = None):
         self.config = Config()
+        self.http = http_client or get_http_client()
         self.news_api_key = self.config.get_api_key("news_api")
         self.twitter_token = self.config.get_api_key("twitter")
-
-        # Initialize sentiment analyzers
-        self.vader_analyzer = SentimentIntensityAnalyzer()
-        self.lemmatizer = WordNetLemmatizer()
-
-        # Initialize stopwords
-        try:
-            self.stop_words = set(stopwords.words("english"))
-        except:
-            self.stop_words = set(
-                [
-                    "the",
-                    "a",
-                    "an",
-                    "and",
-                    "or",
-                    "but",
-                    "in",
-                    "on",
-                    "at",
-                    "to",
-                    "for",
-                    "of",
-                    "with",
-                    "by",
-                ]
+        self.db_manager = db_manager
+
+        # Sentiment analyzers load on first use or in warm_up()
+        self.nltk_resources = get_nltk_resources()
+        self.scorer = SentimentScorer(
+            fast_tokenizer=self.config.SENTIMENT_FAST_TOKENIZER
+        )
+
+        # Large batches are scored on a process pool (see start_sentiment_pool)
+        self.sentiment_pool = None
+        if self.config.SENTIMENT_POOL_WORKERS > 1:
+            self.sentiment_pool = SentimentProcessPool(
+                self.config.SENTIMENT_POOL_WORKERS,
+                fast_tokenizer=self.config.SENTIMENT_FAST_TOKENIZER,
             )
 
+        # Scores are memoized per normalized text, in memory and in SQLite
+        self.sentiment_memo = SentimentMemo(
+            self.scorer.score,
+            db_manager=db_manager,
+            max_size=self.config.SENTIMENT_MEMO_SIZE,
+            version=self._memo_version,
+            batch_scorer=self._score_batch,
+        )
+
         # Stock-related keywords
         self.stock_keywords = {
             "AAPL": ["apple", "iphone", "ios", "mac", "tim cook", "cupertino"],
             "GOOGL": ["google", "alphabet", "android", "chrome", "sundar pichai"],
             "MSFT": ["microsoft", "windows", "azure", "satya nadella", "office"],
             "AMZN": ["amazon", "aws", "prime", "jeff bezos", "andy jassy"],
-            "TSLA": ["tesla", "elon musk", "electric vehicle", "ev", "model"],
+            "TSLA": [
+                "tesla",
+                "elon musk",
+                "electric vehicle",
+                "ev",
+                "model 3",
+                "model y",
+                "model s",
+                "model x",
+                "cybertruck",
+            ],
             "META": ["meta", "facebook", "instagram", "whatsapp", "mark zuckerberg"],
             "NVDA": ["nvidia", "gpu", "graphics", "jensen huang", "cuda"],
             "NFLX": ["netflix", "streaming", "reed hastings", "content"],
         }
 
-        # RSS feeds for financial news
-        self.rss_feeds = [
-            "https://feeds.finance.yahoo.com/rss/2.0/headline",
-            "https://www.marketwatch.com/rss/topstories",
-            "https://feeds.bloomberg.com/markets/news.rss",
-            "https://www.cnbc.com/id/100003114/device/rss/rss.html",
-            "https://feeds.reuters.com/news/wealth",
-        ]
+        # RSS feeds for financial news, fetched through one shared cache
+        self.rss_feeds = list(self.config.RSS_FEEDS)
+        self.feed_cache = FeedCache(
+            self.http,
+            max_age=self.config.NEWS_UPDATE_INTERVAL,
+            workers=self.config.RSS_FETCH_WORKERS,
+        )
+
+        # Article relevance: whole-word keyword matching for all symbols at once
+        self.keyword_matcher = KeywordMatcher(self.stock_keywords)
+        self._feed_tags = {}
+
+        # Cross-source duplicates: dropped before scoring, and articles already
+        # folded into the aggregates / written to news_articles, per symbol
+        self.duplicates_dropped = 0
+        self._folded_articles: Dict[str, ArticleDeduplicator] = {}
+        self._stored_articles: Dict[str, ArticleDeduplicator] = {}
+        self._article_indexes_lock = threading.Lock()
+
+        # Time-decayed sentiment per symbol, refreshed in the background
+        self.sentiment_aggregates = SentimentAccumulator(
+            half_life=self.config.SENTIMENT_HALF_LIFE
+        )
+        self._refreshed = set()
+        self._sentiment_task = None
+        self._refresh_executor = ThreadPoolExecutor(
+            max_workers=max(1, self.config.SENTIMENT_REFRESH_WORKERS),
+            thread_name_prefix="sentiment-collect",
+        )
+
+        # Market-wide sentiment, served from a versioned snapshot
+        self._market_sentiment = None
+        self._market_sentiment_lock = threading.Lock()
+        self._market_sentiment_versions = itertools.count(1)
 
     def get_sentiment_for_stock(self, symbol: str) -> Dict:
         """Get sentiment analysis for a specific stock"""
         try:
-            # Collect news from multiple sources
-            news_articles = []
+            # Fold newly published articles into the symbol's aggregate
+            duplicates = self.refresh_sentiment(symbol)
 
-            # Get news from APIs
-            api_news = self._get_news_api_data(symbol)
-            if api_news:
-                news_articles.extend(api_news)
-
-            # Get news from RSS feeds
-            rss_news = self._get_rss_news(symbol)
-            if rss_news:
-                news_articles.extend(rss_news)
-
-            # If no real news found, generate simulated sentiment
-            if not news_articles:
+            sentiment = self._aggregate_sentiment(symbol)
+            if sentiment is None:
+                # If no real news found, generate simulated sentiment
                 return self._generate_simulated_sentiment(symbol)
 
-            # Analyze sentiment
-            sentiment_scores = []
-            for article in news_articles:
-                sentiment = self._analyze_sentiment(
-                    article["title"] + " " + article.get("description", "")
-                )
-                sentiment_scores.append(sentiment)
-
-            # Aggregate sentiment
-            if sentiment_scores:
-                avg_compound = np.mean([s["compound"] for s in sentiment_scores])
-                avg_positive = np.mean([s["positive"] for s in sentiment_scores])
-                avg_negative = np.mean([s["negative"] for s in sentiment_scores])
-                avg_neutral = np.mean([s["neutral"] for s in sentiment_scores])
-
-                # Determine overall sentiment label
-                if avg_compound >= 0.05:
-                    label = "positive"
-                elif avg_compound <= -0.05:
-                    label = "negative"
-                else:
-                    label = "neutral"
-
-                return {
-                    "symbol": symbol,
-                    "compound_score": round(avg_compound, 3),
-                    "positive_score": round(avg_positive, 3),
-                    "negative_score": round(avg_negative, 3),
-                    "neutral_score": round(avg_neutral, 3),
-                    "sentiment_label": label,
-                    "news_count": len(news_articles),
-                    "timestamp": datetime.now(),
-                    "source": "aggregated",
-                }
-            else:
-                return self._generate_simulated_sentiment(symbol)
+            sentiment["duplicates_dropped"] = duplicates
+            return sentiment
 
         except Exception as e:
             logger.error(f"Error getting sentiment for {symbol}: {e}")
             return self._generate_simulated_sentiment(symbol)
 
+    def get_current_sentiment(self, symbol: str) -> Dict:
+        """Current time-decayed sentiment, collecting news only on first use"""
+        if symbol not in self._refreshed:
+            return self.get_sentiment_for_stock(symbol)
+
+        sentiment = self._aggregate_sentiment(symbol)
+        if sentiment is None:
+            return self._generate_simulated_sentiment(symbol)
+        return sentiment
+
+    def refresh_sentiment(self, symbol: str) -> int:
+        """Score articles not seen before and fold them into the aggregate
+
+        Returns how many cross-source duplicates were dropped.
+        """
+        new_articles, duplicates = self._collect_new_articles(symbol)
+        if new_articles:
+            scores = self.analyze_batch(self._article_texts(new_articles))
+            self._fold_articles(symbol, new_articles, scores)
+        return duplicates
+
+    def refresh_all_sentiment(self, symbols: List[str]):
+        """Refresh the sentiment aggregates of many symbols at once
+
+        Feeds are fetched and tagged once for all symbols, news is collected
+        for several symbols concurrently, and the new articles of every
+        symbol are scored as one batch (big enough for the process pool).
+        """
+        # Register every symbol first so feeds are tagged once, not per symbol
+        for symbol in symbols:
+            if symbol not in self.keyword_matcher:
+                self.keyword_matcher.add(symbol, [symbol])
+        self.feed_cache.get_many(
+            self.rss_feeds,
+            timeout=self.config.RSS_FEED_TIMEOUT,
+            deadline=self.config.RSS_FETCH_DEADLINE,
+        )
+
+        collected = [
+            (symbol, articles)
+            for symbol, articles in zip(
+                symbols, self._refresh_executor.map(self._collect_for_refresh, symbols)
+            )
+            if articles
+        ]
+        if not collected:
+            return
+
+        scores = self.analyze_batch(
+            [
+                text
+                for _, articles in collected
+                for text in self._article_texts(articles)
+            ]
+        )
+        start = 0
+        for symbol, articles in collected:
+            end = start + len(articles)
+            try:
+                self._fold_articles(symbol, articles, scores[start:end])
+            except Exception as e:
+                logger.error(f"Error refreshing sentiment for {symbol}: {e}")
+            start = end
+
+    def start_sentiment_refresh(self, symbols: List[str]):
+        """Start the background refresh of per-symbol sentiment aggregates
+        and the market sentiment snapshot"""
+        if self._sentiment_task is None:
+            self._sentiment_task = PeriodicTask(
+                "sentiment-refresh",
+                self.config.SENTIMENT_UPDATE_INTERVAL,
+                lambda: self.refresh_market_sentiment(symbols),
+            )
+        return self._sentiment_task.start()
+
+    def _collect_new_articles(self, symbol: str) -> Tuple[List[Dict], int]:
+        """Articles not folded into the symbol's aggregate yet, and how many
+        cross-source copies of those new stories were dropped"""
+        self._refreshed.add(symbol)
+
+        # Collect news from multiple sources
+        news_articles = self._get_news_api_data(symbol) + self._get_rss_news(symbol)
+        if not news_articles:
+            return [], 0
+
+        # Score each story once, however many sources or polls carry it; stories
+        # folded in by an earlier poll go first so their copies are not recounted
+        folded = self._folded_index(symbol)
+        news_articles = [
+            article for article in news_articles if not folded.seen(article)
+        ]
+        news_articles, duplicates = self.dedupe_articles(news_articles)
+        with self._article_indexes_lock:
+            self.duplicates_dropped += duplicates
+        return folded.filter(news_articles), duplicates
+
+    def _collect_for_refresh(self, symbol: str) -> List[Dict]:
+        try:
+            return self._collect_new_articles(symbol)[0]
+        except Exception as e:
+            logger.error(f"Error collecting news for {symbol}: {e}")
+            return []
+
+    def _article_texts(self, articles: List[Dict]) -> List[str]:
+        return [
+            article["title"] + " " + (article.get("description") or "")
+            for article in articles
+        ]
+
+    def _fold_articles(self, symbol: str, articles: List[Dict], scores: List[Dict]):
+        """Add scored articles to the symbol's aggregate and store them"""
+        now = time.time()
+        published = [
+            published_timestamp(article.get("published_date"), now)
+            for article in articles
+        ]
+        self.sentiment_aggregates.add_many(symbol, list(zip(scores, published)))
+        self._store_articles(symbol, articles, scores, published)
+
+    def _aggregate_sentiment(self, symbol: str) -> Optional[Dict]:
+        aggregate = self.sentiment_aggregates.get(symbol)
+        if aggregate is None:
+            return None
+
+        return {
+            "symbol": symbol,
+            "compound_score": round(aggregate["compound"], 3),
+            "positive_score": round(aggregate["positive"], 3),
+            "negative_score": round(aggregate["negative"], 3),
+            "neutral_score": round(aggregate["neutral"], 3),
+            "sentiment_label": sentiment_label(aggregate["compound"]),
+            "news_count": aggregate["count"],
+            "news_weight": round(aggregate["weight"], 3),
+            "timestamp": datetime.now(),
+            "source": "aggregated",
+        }
+
     def _get_news_api_data(self, symbol: str) -> List[Dict]:
         """Get news from News API"""
         try:
             if self.news_api_key == "your_news_api_key":
                 return []
 
+            breaker = get_circuit_breaker("news_api")
+            if not breaker.allow():
+                return []
+
+            if not get_rate_limiter("news_api").acquire(
+                timeout=self.config.RATE_LIMIT_MAX_WAIT
+            ):
+                logger.warning(f"News API rate limit reached, skipping {symbol}")
+                return []
+
             # Search for stock-related news
             keywords = self.stock_keywords.get(symbol, [symbol])
             query = " OR ".join(keywords)
@@ -170,11 +333,18 @@ class NewsSentimentCollector:
                 "apiKey": self.news_api_key,
             }
 
-            response = requests.get(url, params=params, timeout=10)
+            try:
+                response = self.http.get(url, params=params, timeout=10)
+            except Exception:
+                breaker.record_failure()
+                raise
 
+            # 401/426/429 mean the provider is unusable for now, not just empty
             if response.status_code != 200:
+                breaker.record_failure()
                 return []
 
+            breaker.record_success()
             data = response.json()
 
             articles = []
@@ -197,38 +367,31 @@ class NewsSentimentCollector:
             return []
 
     def _get_rss_news(self, symbol: str) -> List[Dict]:
-        """Get news from RSS feeds"""
+        """Get news from RSS feeds (shared feed cache, tagged per symbol)"""
         try:
-            articles = []
-            keywords = self.stock_keywords.get(symbol, [symbol])
-
-            for feed_url in self.rss_feeds[:2]:  # Limit to 2 feeds to avoid being slow
-                try:
-                    feed = feedparser.parse(feed_url)
-
-                    for entry in feed.entries[:5]:  # Limit to 5 entries per feed
-                        title = entry.get("title", "")
-                        description = entry.get("description", "") or entry.get(
-                            "summary", ""
-                        )
-
-                        # Check if article is relevant to the stock
-                        content = (title + " " + description).lower()
-                        if any(keyword.lower() in content for keyword in keywords):
-                            articles.append(
-                                {
-                                    "title": title,
-                                    "description": description,
-                                    "url": entry.get("link", ""),
-                                    "source": feed.feed.get("title", "RSS Feed"),
-                                    "published_date": entry.get("published", ""),
-                                    "symbol": symbol,
-                                }
-                            )
+            if symbol not in self.keyword_matcher:
+                self.keyword_matcher.add(symbol, [symbol])
+
+            # All feeds are fetched concurrently, bounded by a global deadline
+            feeds = self.feed_cache.get_many(
+                self.rss_feeds,
+                timeout=self.config.RSS_FEED_TIMEOUT,
+                deadline=self.config.RSS_FETCH_DEADLINE,
+            )
 
-                except Exception as e:
-                    logger.error(f"RSS feed error for {feed_url}: {e}")
-                    continue
+            articles = []
+            for feed in feeds.values():
+                for entry in self._tag_feed(feed).get(symbol, []):
+                    articles.append(
+                        {
+                            "title": entry["title"],
+                            "description": entry["description"],
+                            "url": entry["url"],
+                            "source": entry["source"],
+                            "published_date": entry["published_date"],
+                            "symbol": symbol,
+                        }
+                    )
 
             return articles
 
@@ -236,76 +399,162 @@ class NewsSentimentCollector:
             logger.error(f"RSS news error for {symbol}: {e}")
             return []
 
-    def _analyze_sentiment(self, text: str) -> Dict:
-        """Analyze sentiment of a text using multiple methods"""
-        try:
-            # Clean the text
-            cleaned_text = self._clean_text(text)
-
-            # VADER sentiment analysis
-            vader_scores = self.vader_analyzer.polarity_scores(cleaned_text)
-
-            # TextBlob sentiment analysis
-            blob = TextBlob(cleaned_text)
-            textblob_polarity = blob.sentiment.polarity
-
-            # Combine both methods (weighted average)
-            compound_score = (vader_scores["compound"] * 0.7) + (
-                textblob_polarity * 0.3
-            )
-
-            return {
-                "compound": compound_score,
-                "positive": vader_scores["pos"],
-                "negative": vader_scores["neg"],
-                "neutral": vader_scores["neu"],
-                "textblob_polarity": textblob_polarity,
-            }
-
-        except Exception as e:
-            logger.error(f"Sentiment analysis error: {e}")
-            return {
-                "compound": 0.0,
-                "positive": 0.0,
-                "negative": 0.0,
-                "neutral": 1.0,
-                "textblob_polarity": 0.0,
-            }
+    def dedupe_articles(self, articles: List[Dict]) -> Tuple[List[Dict], int]:
+        """Drop cross-source copies of the same story (first copy wins)
+
+        Article URLs are canonicalized (tracking parameters removed) in place.
+        Returns the unique articles and how many duplicates were dropped.
+        """
+        for article in articles:
+            article["url"] = canonical_url(article.get("url") or "")
+
+        unique = ArticleDeduplicator(self.config.ARTICLE_DEDUP_DISTANCE).filter(
+            articles
+        )
+        return unique, len(articles) - len(unique)
+
+    def _store_articles(
+        self,
+        symbol: str,
+        articles: List[Dict],
+        scores: List[Dict],
+        published: List[float],
+    ):
+        """Write articles and their scores to the database, skipping stories
+        stored before (sentiment_data inserts also update the daily rollup)"""
+        if self.db_manager is None:
+            return
+
+        scored = [
+            dict(article, scores=score, published=timestamp)
+            for article, score, timestamp in zip(articles, scores, published)
+        ]
+        new_articles = self._stored_index(symbol).filter(scored)
+        if not new_articles:
+            return
 
-    def _clean_text(self, text: str) -> str:
-        """Clean and preprocess text"""
         try:
-            # Remove HTML tags
-            text = re.sub(r"<[^>]+>", "", text)
-
-            # Remove URLs
-            text = re.sub(
-                r"http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+",
-                "",
-                text,
+            self.db_manager.insert_news_articles(
+                [
+                    (
+                        symbol,
+                        article["title"],
+                        article["url"],
+                        article["source"],
+                        article["published_date"],
+                        article.get("description"),
+                        article["scores"]["compound"],
+                    )
+                    for article in new_articles
+                ]
             )
+            self.db_manager.insert_sentiment_data_batch(
+                [
+                    (
+                        symbol,
+                        datetime.fromtimestamp(
+                            article["published"], timezone.utc
+                        ).strftime("%Y-%m-%d %H:%M:%S"),
+                        article["source"],
+                        article["title"],
+                        article["scores"]["compound"],
+                        sentiment_label(article["scores"]["compound"]),
+                        article["scores"]["compound"],
+                        article["scores"]["positive"],
+                        article["scores"]["negative"],
+                        article["scores"]["neutral"],
+                    )
+                    for article in new_articles
+                ]
+            )
+        except Exception as e:
+            logger.warning(f"Could not store news articles for {symbol}: {e}")
+
+    def _folded_index(self, symbol: str) -> ArticleDeduplicator:
+        """Per-symbol index of articles already in the sentiment aggregate"""
+        with self._article_indexes_lock:
+            index = self._folded_articles.get(symbol)
+            if index is None:
+                index = ArticleDeduplicator(
+                    self.config.ARTICLE_DEDUP_DISTANCE,
+                    max_size=self.config.ARTICLE_DEDUP_SIZE,
+                )
+                self._folded_articles[symbol] = index
+            return index
+
+    def _stored_index(self, symbol: str) -> ArticleDeduplicator:
+        """Per-symbol index of stored articles, seeded from the database"""
+        with self._article_indexes_lock:
+            index = self._stored_articles.get(symbol)
+            if index is None:
+                index = ArticleDeduplicator(
+                    self.config.ARTICLE_DEDUP_DISTANCE,
+                    max_size=self.config.ARTICLE_DEDUP_SIZE,
+                )
+                try:
+                    index.filter(
+                        self.db_manager.get_recent_news(
+                            symbol, limit=self.config.ARTICLE_DEDUP_SIZE
+                        )
+                    )
+                except Exception as e:
+                    logger.warning(f"Could not load stored news for {symbol}: {e}")
+                index.dropped = 0
+                self._stored_articles[symbol] = index
+            return index
+
+    def _tag_feed(self, feed) -> Dict[str, List[Dict]]:
+        """Feed entries grouped by matching symbol, one matcher scan per entry
+
+        Computed once per parsed feed and matcher version, then shared by
+        every symbol.
+        """
+        version = self.keyword_matcher.version
+        cached = self._feed_tags.get(feed.url)
+        if cached and cached[0] is feed and cached[1] == version:
+            return cached[2]
+
+        by_symbol = defaultdict(list)
+        for entry in feed.entries[:5]:  # Limit to 5 entries per feed
+            for symbol in self.keyword_matcher.match(entry["content"]):
+                by_symbol[symbol].append(entry)
+
+        self._feed_tags[feed.url] = (feed, version, by_symbol)
+        return by_symbol
 
-            # Remove special characters and digits
-            text = re.sub(r"[^a-zA-Z\s]", "", text)
-
-            # Convert to lowercase
-            text = text.lower()
-
-            # Tokenize
-            tokens = word_tokenize(text)
-
-            # Remove stopwords and lemmatize
-            filtered_tokens = [
-                self.lemmatizer.lemmatize(token)
-                for token in tokens
-                if token not in self.stop_words and len(token) > 2
-            ]
+    def _analyze_sentiment(self, text: str) -> Dict:
+        """Analyze sentiment of a text (memoized by normalized text hash)"""
+        return self.analyze_batch([text])[0]
 
-            return " ".join(filtered_tokens)
+    def analyze_batch(self, texts: List[str]) -> List[Dict]:
+        """Analyze sentiment of many texts, in order
 
+        Texts already seen come from the sentiment memo. The rest are scored
+        on the process pool (once started) when there are at least
+        SENTIMENT_POOL_MIN_BATCH of them, otherwise in this process.
+        """
+        try:
+            scores = self.sentiment_memo.get_or_score_many(texts)
         except Exception as e:
-            logger.error(f"Text cleaning error: {e}")
-            return text
+            logger.error(f"Sentiment analysis error: {e}")
+            scores = [None] * len(texts)
+        return [score or dict(NEUTRAL_SCORES) for score in scores]
+
+    def _memo_version(self) -> str:
+        return f"{SENTIMENT_MODEL_VERSION}:{self.scorer.pipeline_key()}"
+
+    def _score_batch(self, texts: List[str]) -> List[Optional[Dict]]:
+        if (
+            self.sentiment_pool is not None
+            and self.sentiment_pool.running
+            and len(texts) >= self.config.SENTIMENT_POOL_MIN_BATCH
+        ):
+            try:
+                return self.sentiment_pool.score_many(texts)
+            except Exception as e:
+                logger.error(f"Sentiment pool error, scoring in process: {e}")
+                self.sentiment_pool.close()
+        return self.scorer.score_many(texts)
 
     def _generate_simulated_sentiment(self, symbol: str) -> Dict:
         """Generate simulated sentiment data for demo purposes"""
@@ -366,31 +615,18 @@ class NewsSentimentCollector:
             "source": "simulated",
         }
 
-    def get_detailed_sentiment(self, symbol: str) -> Dict:
-        """Get detailed sentiment analysis with historical data"""
+    def get_detailed_sentiment(self, symbol: str, days: int = MIN_HISTORY_DAYS) -> Dict:
+        """Get detailed sentiment analysis with daily history (7-365 days)"""
         try:
-            current_sentiment = self.get_sentiment_for_stock(symbol)
-
-            # Generate historical sentiment trend (simulated)
-            historical_data = []
-            for i in range(7):  # Last 7 days
-                date = datetime.now() - timedelta(days=i)
-                base_score = current_sentiment["compound_score"]
-
-                # Add some variation for historical data
-                variation = np.random.normal(0, 0.1)
-                historical_score = np.clip(base_score + variation, -1, 1)
+            current_sentiment = self.get_current_sentiment(symbol)
 
-                historical_data.append(
-                    {
-                        "date": date.strftime("%Y-%m-%d"),
-                        "compound_score": round(historical_score, 3),
-                    }
-                )
+            days = min(max(days, MIN_HISTORY_DAYS), MAX_HISTORY_DAYS)
+            historical_data = self._get_sentiment_history(symbol, days)
 
             return {
                 "current_sentiment": current_sentiment,
                 "historical_sentiment": historical_data,
+                "history_days": days,
                 "sentiment_trend": self._calculate_sentiment_trend(historical_data),
                 "news_sources": self._get_news_sources_summary(symbol),
             }
@@ -404,20 +640,44 @@ class NewsSentimentCollector:
                 "news_sources": [],
             }
 
+    def _get_sentiment_history(self, symbol: str, days: int) -> List[Dict]:
+        """Daily sentiment for the last ``days`` days, oldest first"""
+        if self.db_manager is None:
+            return []
+
+        return [
+            {
+                "date": day["date"],
+                "count": day["count"],
+                "compound_score": round(day["compound_score"], 3),
+                "compound_min": round(day["compound_min"], 3),
+                "compound_max": round(day["compound_max"], 3),
+                "positive_score": round(day["positive_score"], 3),
+                "negative_score": round(day["negative_score"], 3),
+                "neutral_score": round(day["neutral_score"], 3),
+            }
+            for day in self.db_manager.get_sentiment_daily(symbol, days)
+        ]
+
     def _calculate_sentiment_trend(self, historical_data: List[Dict]) -> str:
-        """Calculate sentiment trend from historical data"""
+        """Calculate sentiment trend from daily history (oldest first)"""
         if len(historical_data) < 3:
             return "stable"
 
         scores = [item["compound_score"] for item in historical_data]
 
-        # Calculate linear regression slope
-        x = np.arange(len(scores))
-        slope = np.polyfit(x, scores, 1)[0]
+        # Linear regression over calendar days (days without news are gaps),
+        # judged by the fitted change across the whole window so 7-day and
+        # 365-day trends are comparable (0.02 per day on a week of data)
+        first = date.fromisoformat(historical_data[0]["date"])
+        x = [
+            (date.fromisoformat(item["date"]) - first).days for item in historical_data
+        ]
+        change = np.polyfit(x, scores, 1)[0] * max(x[-1], 1)
 
-        if slope > 0.02:
+        if change > TREND_THRESHOLD:
             return "improving"
-        elif slope < -0.02:
+        elif change < -TREND_THRESHOLD:
             return "declining"
         else:
             return "stable"
@@ -432,18 +692,47 @@ class NewsSentimentCollector:
         ]
 
     def get_market_sentiment_overview(self) -> Dict:
-        """Get overall market sentiment"""
+        """Get overall market sentiment from the latest snapshot
+
+        Requests never collect news once a snapshot exists; the background
+        refresher replaces it. Only the very first call computes one inline.
+        """
+        snapshot = self._market_sentiment
+        if snapshot is None:
+            with self._market_sentiment_lock:
+                if self._market_sentiment is None:
+                    self.refresh_market_sentiment()
+                snapshot = self._market_sentiment
+
+        age = (datetime.now() - snapshot["as_of"]).total_seconds()
+        return {
+            "version": snapshot["version"],
+            "overall_sentiment": snapshot["overall_sentiment"],
+            "average_compound_score": snapshot["average_compound_score"],
+            "individual_sentiments": snapshot["individual_sentiments"],
+            "as_of": snapshot["as_of"].isoformat(),
+            "age_seconds": round(age, 1),
+            "stale": age > 2 * self.config.SENTIMENT_UPDATE_INTERVAL,
+        }
+
+    def refresh_market_sentiment(self, symbols: Optional[List[str]] = None):
+        """Refresh sentiment for the market symbols (and ``symbols``) in
+        parallel and swap the market snapshot"""
+        market_symbols = list(self.config.DEFAULT_STOCKS)
         try:
-            symbols = self.config.DEFAULT_STOCKS
-            sentiments = {}
+            self.refresh_all_sentiment(
+                list(dict.fromkeys(market_symbols + (symbols or [])))
+            )
 
-            for symbol in symbols:
-                sentiment = self.get_sentiment_for_stock(symbol)
-                sentiments[symbol] = sentiment
+            sentiments = {
+                symbol: self._aggregate_sentiment(symbol)
+                or self._generate_simulated_sentiment(symbol)
+                for symbol in market_symbols
+            }
 
             # Calculate market-wide sentiment
             compound_scores = [s["compound_score"] for s in sentiments.values()]
-            avg_compound = np.mean(compound_scores)
+            avg_compound = float(np.mean(compound_scores)) if compound_scores else 0.0
 
             if avg_compound >= 0.05:
                 market_sentiment = "bullish"
@@ -452,21 +741,85 @@ class NewsSentimentCollector:
             else:
                 market_sentiment = "neutral"
 
-            return {
+            self._market_sentiment = {
+                "version": next(self._market_sentiment_versions),
                 "overall_sentiment": market_sentiment,
                 "average_compound_score": round(avg_compound, 3),
                 "individual_sentiments": sentiments,
-                "timestamp": datetime.now(),
+                "as_of": datetime.now(),
             }
 
         except Exception as e:
             logger.error(f"Error getting market sentiment overview: {e}")
-            return {
-                "overall_sentiment": "neutral",
-                "average_compound_score": 0.0,
-                "individual_sentiments": {},
-                "timestamp": datetime.now(),
-            }
+            if self._market_sentiment is None:
+                self._market_sentiment = {
+                    "version": next(self._market_sentiment_versions),
+                    "overall_sentiment": "neutral",
+                    "average_compound_score": 0.0,
+                    "individual_sentiments": {},
+                    "as_of": datetime.now(),
+                }
+
+    def start_sentiment_pool(self):
+        """Check NLTK data and fork the sentiment scoring workers
+
+        Must run before the process starts any thread: a worker forked while
+        another thread holds a lock (logging, sqlite, the HTTP pool) can
+        deadlock. Until it runs, and after a pool failure, batches are
+        scored in this process.
+        """
+        if self.sentiment_pool is not None:
+            self.nltk_resources.ensure()
+            self.sentiment_pool.start()
+            logger.info(
+                f"Sentiment pool started: {self.sentiment_pool.workers} workers"
+            )
+
+    def warm_up(self):
+        """Check NLTK data and load the in-process analyzers"""
+        self.nltk_resources.ensure()
+        self.scorer.warm_up()
+        logger.info(f"Sentiment analyzers ready: {self.scorer.stats()}")
+
+    def get_nltk_status(self) -> Dict:
+        """Get NLTK data availability and how the scorer was set up"""
+        return {
+            "resources": self.nltk_resources.stats(),
+            "scorer": self.scorer.stats(),
+        }
+
+    def get_sentiment_memo_stats(self) -> Dict:
+        """Get sentiment memo size and hit-rate counters"""
+        return self.sentiment_memo.stats()
+
+    def get_sentiment_pool_stats(self) -> Dict:
+        """Get sentiment process pool counters"""
+        if self.sentiment_pool is None:
+            return {"workers": 0}
+        return self.sentiment_pool.stats()
+
+    def get_article_dedup_stats(self) -> Dict:
+        """Get how many cross-source copies of newly scored stories were
+        dropped and how many stored articles are indexed"""
+        with self._article_indexes_lock:
+            indexes = list(self._stored_articles.values())
+        return {
+            "dropped": self.duplicates_dropped,
+            "dropped_before_storing": sum(index.dropped for index in indexes),
+            "stored_indexed": sum(len(index) for index in indexes),
+        }
+
+    def get_sentiment_aggregate_stats(self) -> Dict:
+        """Get how many symbols and articles the sentiment aggregates cover,
+        and the market sentiment snapshot version"""
+        stats = self.sentiment_aggregates.stats()
+        snapshot = self._market_sentiment
+        stats["market_snapshot_version"] = snapshot["version"] if snapshot else None
+        return stats
+
+    def get_feed_cache_stats(self) -> Dict:
+        """Get RSS feed cache hit/fetch/304 counters"""
+        return self.feed_cache.stats()
 
     def update_sentiment_models(self):
         """Update sentiment analysis models (placeholder for future enhancement)"""
@@ -486,7 +839,7 @@ class NewsSentimentCollector:
                     "pageSize": 1,
                     "apiKey": self.news_api_key,
                 }
-                response = requests.get(url, params=params, timeout=10)
+                response = self.http.get(url, params=params, timeout=10)
                 results["news_api"] = response.status_code == 200
             else:
                 results["news_api"] = False
@@ -495,8 +848,8 @@ class NewsSentimentCollector:
 
         # Test RSS feeds
         try:
-            feed = feedparser.parse(self.rss_feeds[0])
-            results["rss_feeds"] = len(feed.entries) > 0
+            feed = self.feed_cache.get(self.rss_feeds[0])
+            results["rss_feeds"] = bool(feed and feed.entries)
         except Exception:
             results["rss_feeds"] = False
 
@@ -0,0 +1,196 @@
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional, Tuple
+
+from utils.latency_histogram import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+ProviderFn = Callable[[str], Optional[Dict]]
+
+
+class ProviderSkipped(Exception):
+    """Raised by a provider that returned without calling upstream (circuit
+    open, rate limited); such calls are not timed"""
+
+
+class HedgedProviderChain:
+    """Ordered provider fallback with hedging and an overall latency budget
+
+    The first provider is called straight away. If it has not answered
+    within its hedge delay (the configured percentile of its latency over
+    the last ``latency_window`` seconds), or it fails, the next provider is
+    started alongside it. The first non-empty answer wins. Once the budget
+    is spent the chain gives up and returns None. Skipped calls are counted
+    but not timed, so an open circuit cannot drag the hedge delay down.
+
+    Each provider runs on its own pool of ``workers`` threads, so calls
+    abandoned on a slow fallback cannot hold up the next primary. Attempts
+    still queued when the chain returns are cancelled; ones already running
+    finish in the background and their latency is still recorded. A
+    provider whose pool is busy with such calls is passed over.
+    """
+
+    def __init__(
+        self,
+        providers: List[Tuple[str, ProviderFn]],
+        workers: int = 8,
+        budget: float = 5.0,
+        hedge_percentile: float = 95.0,
+        default_hedge_delay: float = 1.0,
+        min_hedge_delay: float = 0.05,
+        min_samples: int = 20,
+        latency_window: float = 300.0,
+    ):
+        self.providers = providers
+        self.workers = max(1, workers)
+        self.budget = budget
+        self.hedge_percentile = hedge_percentile
+        self.default_hedge_delay = default_hedge_delay
+        self.min_hedge_delay = min_hedge_delay
+        self.min_samples = min_samples
+
+        self.executors = {
+            name: ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix=f"provider-{name}"
+            )
+            for name, _ in providers
+        }
+        self.histograms = {
+            name: LatencyHistogram(window=latency_window) for name, _ in providers
+        }
+        self.in_flight = {name: 0 for name, _ in providers}
+        self.wins = {name: 0 for name, _ in providers}
+        self.errors = {name: 0 for name, _ in providers}
+        self.skipped = {name: 0 for name, _ in providers}
+        self.saturated = {name: 0 for name, _ in providers}
+        self.hedges = 0
+        self.budget_exceeded = 0
+        self.abandoned = 0
+        self._lock = threading.Lock()
+
+    def hedge_delay(self, name: str) -> float:
+        """How long to wait on a provider before hedging to the next one"""
+        histogram = self.histograms[name]
+        if histogram.count < self.min_samples:
+            return self.default_hedge_delay
+        delay = histogram.percentile(self.hedge_percentile)
+        return min(max(delay, self.min_hedge_delay), self.budget)
+
+    def fetch(self, symbol: str) -> Optional[Dict]:
+        """Return the first good answer from the chain within the budget"""
+        start = time.monotonic()
+        deadline = start + self.budget
+        pending = {}
+        next_index = 0
+        hedge_at = start
+
+        while True:
+            now = time.monotonic()
+            can_launch = next_index < len(self.providers)
+
+            if can_launch and (not pending or now >= hedge_at):
+                name, fn = self.providers[next_index]
+                next_index += 1
+                future = self._submit(name, fn, symbol)
+                if future is None:
+                    continue
+                pending[future] = name
+                if next_index > 1:
+                    with self._lock:
+                        self.hedges += 1
+                hedge_at = now + self.hedge_delay(name)
+                continue
+
+            if now >= deadline or not pending:
+                break
+
+            wait_until = min(deadline, hedge_at) if can_launch else deadline
+            done, _ = wait(
+                list(pending),
+                timeout=max(0.0, wait_until - now),
+                return_when=FIRST_COMPLETED,
+            )
+            for future in done:
+                name = pending.pop(future)
+                result = future.result()
+                if result:
+                    with self._lock:
+                        self.wins[name] += 1
+                    self._abandon(pending)
+                    return result
+
+        if pending:
+            with self._lock:
+                self.budget_exceeded += 1
+            logger.warning(
+                f"Quote budget of {self.budget}s exceeded for {symbol} "
+                f"(waiting on {', '.join(pending.values())})"
+            )
+            self._abandon(pending)
+        return None
+
+    def _submit(self, name: str, fn: ProviderFn, symbol: str):
+        """Start a provider call, or None if its pool has no idle worker"""
+        with self._lock:
+            if self.in_flight[name] >= self.workers:
+                self.saturated[name] += 1
+                return None
+            self.in_flight[name] += 1
+
+        future = self.executors[name].submit(self._call, name, fn, symbol)
+        future.add_done_callback(lambda _: self._release(name))
+        return future
+
+    def _release(self, name: str):
+        with self._lock:
+            self.in_flight[name] -= 1
+
+    def _abandon(self, pending: Dict):
+        """Cancel attempts that have not started; the rest run to completion"""
+        running = [future for future in pending if not future.cancel()]
+        if running:
+            with self._lock:
+                self.abandoned += len(running)
+
+    def _call(self, name: str, fn: ProviderFn, symbol: str) -> Optional[Dict]:
+        start = time.monotonic()
+        try:
+            result = fn(symbol)
+        except ProviderSkipped:
+            with self._lock:
+                self.skipped[name] += 1
+            return None
+        except Exception as e:
+            with self._lock:
+                self.errors[name] += 1
+            logger.error(f"Provider {name} error for {symbol}: {e}")
+            result = None
+
+        self.histograms[name].record(time.monotonic() - start)
+        return result
+
+    def stats(self) -> Dict:
+        with self._lock:
+            providers = {
+                name: {
+                    "latency": self.histograms[name].snapshot(),
+                    "hedge_delay": round(self.hedge_delay(name), 4),
+                    "wins": self.wins[name],
+                    "errors": self.errors[name],
+                    "skipped": self.skipped[name],
+                    "saturated": self.saturated[name],
+                    "in_flight": self.in_flight[name],
+                }
+                for name, _ in self.providers
+            }
+            return {
+                "budget_seconds": self.budget,
+                "hedge_percentile": self.hedge_percentile,
+                "hedges": self.hedges,
+                "budget_exceeded": self.budget_exceeded,
+                "abandoned": self.abandoned,
+                "providers": providers,
+            }
@@ -0,0 +1,143 @@
+import logging
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional
+
+import pandas as pd
+import yfinance as yf
+
+logger = logging.getLogger(__name__)
+
+
+def quote_from_history(symbol: str, hist: pd.DataFrame, source: str) -> Optional[Dict]:
+    """Build a quote dict from a daily OHLCV history frame"""
+    hist = hist.dropna(subset=["Close"])
+    if hist.empty:
+        return None
+
+    current_price = hist["Close"].iloc[-1]
+    previous_price = hist["Close"].iloc[-2] if len(hist) > 1 else current_price
+
+    change = current_price - previous_price
+    change_percent = (change / previous_price) * 100 if previous_price != 0 else 0
+
+    volume = hist["Volume"].iloc[-1]
+
+    return {
+        "symbol": symbol,
+        "current_price": float(current_price),
+        "open_price": float(hist["Open"].iloc[-1]),
+        "high_price": float(hist["High"].iloc[-1]),
+        "low_price": float(hist["Low"].iloc[-1]),
+        "volume": int(volume) if pd.notna(volume) else 0,
+        "change": float(change),
+        "change_percent": float(change_percent),
+        "trading_day": hist.index[-1].date().isoformat(),
+        "timestamp": datetime.now(),
+        "source": source,
+    }
+
+
+class QuoteProvider:
+    """Interface for sources that can quote many symbols in one round trip
+
+    Implementations return a dict keyed by symbol; symbols the provider could
+    not quote are simply left out so the caller can fall back per symbol.
+    """
+
+    name = "provider"
+
+    def fetch_quotes(self, symbols: List[str]) -> Dict[str, Dict]:
+        raise NotImplementedError
+
+    def fetch_fundamentals(self, symbol: str) -> Optional[Dict]:
+        """Slow-moving values (market cap, P/E); None if unsupported"""
+        return None
+
+    def fetch_daily_bars(
+        self, symbol: str, start: date, end: date
+    ) -> Optional[pd.DataFrame]:
+        """Daily bars for [start, end] with date/open/high/low/close/volume"""
+        return None
+
+
+class YahooQuoteProvider(QuoteProvider):
+    """Batch quotes from Yahoo Finance using a single multi-ticker download
+
+    Yahoo serves one ticker per HTTP request, so the download fetches the
+    batch's tickers on up to ``max_threads`` threads rather than one after
+    another.
+    """
+
+    name = "yahoo_finance"
+
+    def __init__(self, period: str = "5d", timeout: float = 10, max_threads: int = 8):
+        self.period = period
+        self.timeout = timeout
+        self.max_threads = max(1, max_threads)
+
+    def fetch_quotes(self, symbols: List[str]) -> Dict[str, Dict]:
+        if not symbols:
+            return {}
+
+        hist = yf.download(
+            tickers=" ".join(symbols),
+            period=self.period,
+            interval="1d",
+            group_by="ticker",
+            auto_adjust=False,
+            progress=False,
+            threads=min(len(symbols), self.max_threads),
+            timeout=self.timeout,
+        )
+
+        if hist is None or hist.empty:
+            return {}
+
+        quotes = {}
+        for symbol in symbols:
+            try:
+                if isinstance(hist.columns, pd.MultiIndex):
+                    if symbol not in hist.columns.get_level_values(0):
+                        continue
+                    frame = hist[symbol]
+                elif len(symbols) == 1:
+                    frame = hist
+                else:
+                    continue
+
+                quote = quote_from_history(symbol, frame, self.name)
+                if quote:
+                    quotes[symbol] = quote
+
+            except Exception as e:
+                logger.error(f"Yahoo Finance batch parse error for {symbol}: {e}")
+
+        return quotes
+
+    def fetch_fundamentals(self, symbol: str) -> Optional[Dict]:
+        info = yf.Ticker(symbol).info
+        return {
+            "market_cap": info.get("marketCap", 0),
+            "pe_ratio": info.get("trailingPE", 0),
+        }
+
+    def fetch_daily_bars(
+        self, symbol: str, start: date, end: date
+    ) -> Optional[pd.DataFrame]:
+        # Yahoo treats end as exclusive
+        hist = yf.Ticker(symbol).history(
+            start=start, end=end + timedelta(days=1), timeout=self.timeout
+        )
+        if hist.empty:
+            return hist
+
+        return pd.DataFrame(
+            {
+                "date": hist.index.strftime("%Y-%m-%d"),
+                "open": hist["Open"].to_numpy(dtype=float),
+                "high": hist["High"].to_numpy(dtype=float),
+                "low": hist["Low"].to_numpy(dtype=float),
+                "close": hist["Close"].to_numpy(dtype=float),
+                "volume": hist["Volume"].fillna(0).to_numpy(dtype="int64"),
+            }
+        )
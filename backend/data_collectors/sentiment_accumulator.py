@@ -0,0 +1,114 @@
+import math
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Iterable, Optional, Tuple
+
+# Article scores averaged per symbol
+FIELDS = ("compound", "positive", "negative", "neutral")
+
+
+def published_timestamp(value, default: float) -> float:
+    """Epoch seconds of an ISO 8601 or RFC 822 date (``default`` if unparseable)"""
+    if isinstance(value, datetime):
+        parsed = value
+    else:
+        text = (value or "").strip()
+        try:
+            parsed = datetime.fromisoformat(text.replace("Z", "+00:00"))
+        except ValueError:
+            try:
+                parsed = parsedate_to_datetime(text)
+            except (TypeError, ValueError):
+                return default
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+class _SymbolSentiment:
+    __slots__ = ("as_of", "weight", "sums", "count")
+
+    def __init__(self):
+        self.as_of: Optional[float] = None
+        self.weight = 0.0
+        self.sums = [0.0] * len(FIELDS)
+        self.count = 0
+
+
+class SentimentAccumulator:
+    """Per-symbol sentiment averages with exponential time decay
+
+    Each article is folded in once, weighted by ``0.5 ** (age / half_life)``
+    from its publication time, so a day-old headline counts far less than
+    a fresh one. Sums are kept relative to the newest article seen; a newer
+    article rescales them once, so adding an article and reading the
+    averages are both O(1). The averages themselves do not change as time
+    passes (all weights decay alike); ``weight`` decays to report how much
+    recent news backs them.
+    """
+
+    def __init__(self, half_life: float = 21600, clock=time.time):
+        self.half_life = half_life
+        self._clock = clock
+        self._symbols: Dict[str, _SymbolSentiment] = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._symbols
+
+    def add(self, symbol: str, scores: Dict, published: float):
+        """Fold one article's scores in"""
+        self.add_many(symbol, [(scores, published)])
+
+    def add_many(self, symbol: str, articles: Iterable[Tuple[Dict, float]]):
+        """Fold (scores, published timestamp) pairs in"""
+        now = self._clock()
+        with self._lock:
+            state = self._symbols.get(symbol)
+            if state is None:
+                state = self._symbols[symbol] = _SymbolSentiment()
+
+            for scores, published in articles:
+                published = min(published, now)
+                if state.as_of is None:
+                    state.as_of = published
+                elif published > state.as_of:
+                    decay = self._decay(published - state.as_of)
+                    state.weight *= decay
+                    state.sums = [total * decay for total in state.sums]
+                    state.as_of = published
+
+                weight = self._decay(state.as_of - published)
+                state.weight += weight
+                for i, field in enumerate(FIELDS):
+                    state.sums[i] += weight * scores[field]
+                state.count += 1
+
+    def get(self, symbol: str) -> Optional[Dict]:
+        """Decayed averages for a symbol, or None if it has no articles"""
+        with self._lock:
+            state = self._symbols.get(symbol)
+            if state is None or state.weight <= 0:
+                return None
+            averages = {
+                field: total / state.weight for field, total in zip(FIELDS, state.sums)
+            }
+            averages["weight"] = state.weight * self._decay(
+                max(0.0, self._clock() - state.as_of)
+            )
+            averages["count"] = state.count
+            averages["as_of"] = state.as_of
+        return averages
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "symbols": len(self._symbols),
+                "articles": sum(state.count for state in self._symbols.values()),
+                "half_life": self.half_life,
+            }
+
+    def _decay(self, age: float) -> float:
+        return math.pow(0.5, age / self.half_life)
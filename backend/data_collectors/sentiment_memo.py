@@ -0,0 +1,145 @@
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+SCORE_FIELDS = ("compound", "positive", "negative", "neutral", "textblob_polarity")
+
+
+def text_key(text: str, version: str = "") -> str:
+    """Hash of the normalized text (case and whitespace insensitive)"""
+    normalized = " ".join(text.lower().split())
+    return hashlib.sha1(f"{version}\n{normalized}".encode("utf-8")).hexdigest()
+
+
+class SentimentMemo:
+    """Memoized sentiment scores keyed by a hash of the normalized text
+
+    Scores live in an in-memory LRU of ``max_size`` entries backed by the
+    ``sentiment_cache`` table, so a headline is scored once and then served
+    from memory (or from SQLite after a restart). ``version`` is part of the
+    key: bump it when the scoring pipeline changes so old scores are not
+    reused. It may be a callable, resolved on every lookup, when the
+    pipeline is only known once the scorer has loaded.
+
+    Texts that miss are scored together by ``batch_scorer`` when given
+    (one result per text, None for a text that could not be scored);
+    None results are returned as such and never memoized.
+    """
+
+    def __init__(
+        self,
+        scorer: Callable[[str], Dict],
+        db_manager=None,
+        max_size: int = 10000,
+        version: Union[str, Callable[[], str]] = "1",
+        batch_scorer: Callable[[List[str]], List[Optional[Dict]]] = None,
+    ):
+        self.scorer = scorer
+        self.batch_scorer = batch_scorer
+        self.db_manager = db_manager
+        self.max_size = max_size
+        self.version = version
+        self._entries: "OrderedDict[str, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.db_hits = 0
+        self.misses = 0
+
+    def get_or_score(self, text: str) -> Dict:
+        """Scores for one text, computed only if never seen before"""
+        return self.get_or_score_many([text])[0]
+
+    def get_or_score_many(self, texts: List[str]) -> List[Optional[Dict]]:
+        """Scores for many texts, in order; unseen texts are scored once each"""
+        version = self.version() if callable(self.version) else self.version
+        keys = [text_key(text, version) for text in texts]
+        results = {}
+
+        with self._lock:
+            for key in keys:
+                scores = self._entries.get(key)
+                if scores is not None:
+                    self._entries.move_to_end(key)
+                    results[key] = scores
+                    self.hits += 1
+
+        missing = [key for key in dict.fromkeys(keys) if key not in results]
+        if missing and self.db_manager is not None:
+            stored = self._load(missing)
+            with self._lock:
+                self.db_hits += len(stored)
+            results.update(stored)
+            self._remember(stored)
+
+        unscored = {}
+        for key, text in zip(keys, texts):
+            if key not in results and key not in unscored:
+                unscored[key] = text
+        if unscored:
+            with self._lock:
+                self.misses += len(unscored)
+            scored = dict(zip(unscored, self.score_texts(list(unscored.values()))))
+            results.update(scored)
+            scored = {key: value for key, value in scored.items() if value is not None}
+            self._remember(scored)
+            self._store(scored)
+
+        return [dict(results[key]) if results[key] else None for key in keys]
+
+    def score_texts(self, texts: List[str]) -> List[Optional[Dict]]:
+        """Score texts that missed the memo"""
+        if self.batch_scorer is not None:
+            return self.batch_scorer(texts)
+        return [self.scorer(text) for text in texts]
+
+    def stats(self) -> Dict:
+        with self._lock:
+            hits, db_hits, misses = self.hits, self.db_hits, self.misses
+            size = len(self._entries)
+        lookups = hits + db_hits + misses
+        return {
+            "size": size,
+            "max_size": self.max_size,
+            "hits": hits,
+            "db_hits": db_hits,
+            "misses": misses,
+            "hit_rate": round((hits + db_hits) / lookups, 4) if lookups else 0.0,
+        }
+
+    def _remember(self, scores: Dict[str, Dict]):
+        with self._lock:
+            for key, value in scores.items():
+                self._entries[key] = value
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def _load(self, keys: List[str]) -> Dict[str, Dict]:
+        stored = {}
+        try:
+            # Stay well below SQLite's bound parameter limit
+            for i in range(0, len(keys), 500):
+                stored.update(self.db_manager.get_sentiment_cache(keys[i : i + 500]))
+        except Exception as e:
+            logger.warning(f"Could not read sentiment cache: {e}")
+        return stored
+
+    def _store(self, scores: Dict[str, Dict]):
+        if self.db_manager is None:
+            return
+        now = datetime.now().isoformat(sep=" ")
+        try:
+            self.db_manager.upsert_sentiment_cache(
+                [
+                    (key, *(value[field] for field in SCORE_FIELDS), now)
+                    for key, value in scores.items()
+                ]
+            )
+        except Exception as e:
+            logger.warning(f"Could not persist sentiment scores: {e}")
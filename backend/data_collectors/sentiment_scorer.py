@@ -0,0 +1,313 @@
+import functools
+import logging
+import math
+import multiprocessing
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Set
+
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+
+logger = logging.getLogger(__name__)
+
+NEUTRAL_SCORES = {
+    "compound": 0.0,
+    "positive": 0.0,
+    "negative": 0.0,
+    "neutral": 1.0,
+    "textblob_polarity": 0.0,
+}
+
+HTML_TAG_RE = re.compile(r"<[^>]+>")
+URL_RE = re.compile(
+    r"http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+"
+)
+NON_ALPHA_RE = re.compile(r"[^a-zA-Z\s]")
+
+# Letters-only words that NLTK's Treebank tokenizer still splits in two
+TREEBANK_SPLITS = {
+    "cannot": ("can", "not"),
+    "gimme": ("gim", "me"),
+    "gonna": ("gon", "na"),
+    "gotta": ("got", "ta"),
+    "lemme": ("lem", "me"),
+    "wanna": ("wan", "na"),
+}
+
+LEMMA_CACHE_SIZE = 65536
+
+FALLBACK_STOP_WORDS = {
+    "the",
+    "a",
+    "an",
+    "and",
+    "or",
+    "but",
+    "in",
+    "on",
+    "at",
+    "to",
+    "for",
+    "of",
+    "with",
+    "by",
+}
+
+
+def fast_tokenize(text: str) -> List[str]:
+    """Whitespace tokenizer matching word_tokenize on lowercase letters-only text"""
+    tokens = []
+    for token in text.split():
+        split = TREEBANK_SPLITS.get(token)
+        if split:
+            tokens.extend(split)
+        else:
+            tokens.append(token)
+    return tokens
+
+
+def _keep_token(token: str) -> str:
+    return token
+
+
+class SentimentScorer:
+    """Text cleaning plus VADER/TextBlob scoring for one text at a time
+
+    ``fast_tokenizer`` swaps NLTK's ``word_tokenize`` for ``fast_tokenize``.
+    Cleaning leaves only lowercase letters and whitespace, where the two
+    produce the same tokens, without the punkt sentence splitter.
+
+    NLTK, TextBlob and the analyzers are loaded on first use (or by
+    ``warm_up``) from local data only. Without punkt the fast tokenizer is
+    used; without wordnet tokens are not lemmatized.
+    """
+
+    def __init__(self, fast_tokenizer: bool = False):
+        self.fast_tokenizer = fast_tokenizer
+        self._lock = threading.Lock()
+        self._loaded = False
+
+        # Set by _load
+        self.vader_analyzer: Optional[SentimentIntensityAnalyzer] = None
+        self.stop_words: Set[str] = set()
+        self.stop_word_source = None
+        self.tokenizer = None
+        self.lemmatize = False
+        self._tokenize = None
+        self._lemmatize = None
+        self._textblob = None
+
+    def warm_up(self):
+        """Load analyzers and NLTK data now instead of on the first request"""
+        self._load()
+        self.score("Markets rallied as strong earnings beat expectations")
+
+    def pipeline_key(self) -> str:
+        """The text pipeline actually in use (tokenizer, lemmatizer, stop
+        words); scores from different pipelines must not be mixed"""
+        if not self._loaded:
+            self._load()
+        lemmatizer = "wordnet" if self.lemmatize else "none"
+        return f"{self.tokenizer}/{lemmatizer}/{self.stop_word_source}"
+
+    def stats(self) -> Dict:
+        return {
+            "loaded": self._loaded,
+            "tokenizer": self.tokenizer,
+            "lemmatize": self.lemmatize,
+            "stop_words": len(self.stop_words),
+            "stop_word_source": self.stop_word_source,
+        }
+
+    def score(self, text: str) -> Dict:
+        """Score sentiment of a text using multiple methods"""
+        # Clean the text
+        cleaned_text = self.clean_text(text)
+
+        # VADER sentiment analysis
+        vader_scores = self.vader_analyzer.polarity_scores(cleaned_text)
+
+        # TextBlob sentiment analysis
+        blob = self._textblob(cleaned_text)
+        textblob_polarity = blob.sentiment.polarity
+
+        # Combine both methods (weighted average)
+        compound_score = (vader_scores["compound"] * 0.7) + (textblob_polarity * 0.3)
+
+        return {
+            "compound": compound_score,
+            "positive": vader_scores["pos"],
+            "negative": vader_scores["neg"],
+            "neutral": vader_scores["neu"],
+            "textblob_polarity": textblob_polarity,
+        }
+
+    def score_many(self, texts: List[str]) -> List[Optional[Dict]]:
+        """Score texts in order; a text that fails to score gives None"""
+        results = []
+        for text in texts:
+            try:
+                results.append(self.score(text))
+            except Exception as e:
+                logger.error(f"Sentiment analysis error: {e}")
+                results.append(None)
+        return results
+
+    def clean_text(self, text: str) -> str:
+        """Clean and preprocess text"""
+        if not self._loaded:
+            self._load()
+        try:
+            # Remove HTML tags and URLs, then everything but letters
+            text = HTML_TAG_RE.sub("", text)
+            text = URL_RE.sub("", text)
+            text = NON_ALPHA_RE.sub("", text).lower()
+
+            # Tokenize, remove stopwords and lemmatize
+            stop_words = self.stop_words
+            lemmatize = self._lemmatize
+            return " ".join(
+                lemmatize(token)
+                for token in self._tokenize(text)
+                if len(token) > 2 and token not in stop_words
+            )
+
+        except Exception as e:
+            logger.error(f"Text cleaning error: {e}")
+            return text
+
+    def _load(self):
+        with self._lock:
+            if self._loaded:
+                return
+
+            # Imported here: NLTK alone takes a few hundred ms to import
+            from nltk.corpus import stopwords
+            from nltk.stem import WordNetLemmatizer
+            from nltk.tokenize import word_tokenize
+            from textblob import TextBlob
+
+            # Initialize sentiment analyzers
+            self.vader_analyzer = SentimentIntensityAnalyzer()
+            self._textblob = TextBlob
+
+            # Initialize stopwords
+            try:
+                self.stop_words = set(stopwords.words("english"))
+                self.stop_word_source = "nltk"
+            except Exception:
+                self.stop_words = set(FALLBACK_STOP_WORDS)
+                self.stop_word_source = "fallback"
+
+            self.tokenizer = "fast"
+            self._tokenize = fast_tokenize
+            if not self.fast_tokenizer:
+                try:
+                    word_tokenize("Stocks rose.")
+                    self.tokenizer = "word_tokenize"
+                    self._tokenize = word_tokenize
+                except LookupError:
+                    logger.warning("NLTK punkt data missing; using the fast tokenizer")
+
+            # Headlines reuse a small vocabulary; lemmatize each word once
+            lemmatizer = WordNetLemmatizer()
+            try:
+                lemmatizer.lemmatize("stocks")
+                self.lemmatize = True
+                self._lemmatize = functools.lru_cache(maxsize=LEMMA_CACHE_SIZE)(
+                    lemmatizer.lemmatize
+                )
+            except LookupError:
+                logger.warning("NLTK wordnet data missing; tokens are not lemmatized")
+                self._lemmatize = _keep_token
+
+            self._loaded = True
+
+
+# Scorer owned by each pool worker process
+_worker_scorer: Optional[SentimentScorer] = None
+
+
+def _init_worker(fast_tokenizer: bool):
+    """Build and warm the worker's analyzers once, before any real batch"""
+    global _worker_scorer
+    _worker_scorer = SentimentScorer(fast_tokenizer=fast_tokenizer)
+    _worker_scorer.warm_up()
+
+
+def _score_chunk(texts: List[str]) -> List[Optional[Dict]]:
+    return _worker_scorer.score_many(texts)
+
+
+class SentimentProcessPool:
+    """Process pool that scores large text batches on several cores
+
+    Workers are all started by ``start`` and keep a warm ``SentimentScorer``
+    for their whole life. Each batch is split into a few chunks per worker
+    so slow texts do not leave cores idle.
+
+    Workers are forked where the platform supports it: ``spawn`` and
+    ``forkserver`` re-import the main module (app.py) in every worker. A
+    child forked while another thread holds a lock (logging, sqlite, the
+    HTTP pool) can deadlock, so ``start`` must run before the process starts
+    any thread, and a closed pool is never restarted lazily.
+    """
+
+    def __init__(
+        self, workers: int, fast_tokenizer: bool = False, chunks_per_worker: int = 4
+    ):
+        self.workers = workers
+        self.fast_tokenizer = fast_tokenizer
+        self.chunks_per_worker = chunks_per_worker
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+        self.batches = 0
+        self.texts = 0
+
+    @property
+    def running(self) -> bool:
+        return self._executor is not None
+
+    def start(self) -> "SentimentProcessPool":
+        """Start every worker now (call before starting any thread)"""
+        if self._executor is None:
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context("fork" if "fork" in methods else None)
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=context,
+                initializer=_init_worker,
+                initargs=(self.fast_tokenizer,),
+            )
+            # With fork, the first submit launches all workers at once
+            self._executor.submit(_score_chunk, [])
+        return self
+
+    def score_many(self, texts: List[str]) -> List[Optional[Dict]]:
+        """Score texts in order across the pool"""
+        if self._executor is None:
+            raise RuntimeError("Sentiment process pool is not running")
+        size = max(1, math.ceil(len(texts) / (self.workers * self.chunks_per_worker)))
+        chunks = [texts[i : i + size] for i in range(0, len(texts), size)]
+
+        results = []
+        for scores in self._executor.map(_score_chunk, chunks):
+            results.extend(scores)
+
+        self.batches += 1
+        self.texts += len(texts)
+        return results
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> Dict:
+        return {
+            "workers": self.workers,
+            "running": self.running,
+            "batches": self.batches,
+            "texts": self.texts,
+        }
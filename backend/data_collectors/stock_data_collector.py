@@ -1,17 +1,27 @@
 import logging
 import os
 import sys
-import time
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Union
 
-import numpy as np
-import requests
 import yfinance as yf
 
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from data_collectors.bar_store import BarStore, bars_to_columns, bars_to_rows
+from data_collectors.fundamentals_store import FundamentalsStore
+from data_collectors.provider_chain import HedgedProviderChain, ProviderSkipped
+from data_collectors.quote_providers import QuoteProvider, YahooQuoteProvider
+from data_collectors.synthetic_market import SyntheticMarket, SyntheticQuoteProvider
+from utils.background import PeriodicTask
+from utils.circuit_breaker import get_circuit_breaker
 from utils.config import Config
+from utils.http_client import HttpClient, get_http_client
+from utils.price_buffer import PriceHistory
+from utils.quote_cache import QuoteCache
+from utils.rate_limiter import get_rate_limiter
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format=Config.LOG_FORMAT)
@@ -21,91 +31,189 @@ logger = logging.getLogger(__name__)
 class StockDataCollector:
     """Collects real-time stock market data from multiple sources"""
 
-    def __init__(self):
+    def __init__(
+        self,
+        quote_provider: Optional[QuoteProvider] = None,
+        db_manager=None,
+        http_client: Optional[HttpClient] = None,
+    ):
         self.config = Config()
+        self.http = http_client or get_http_client()
         self.alpha_vantage_key = self.config.get_api_key("alpha_vantage")
         self.polygon_key = self.config.get_api_key("polygon")
-        self.last_request_time = {}
-        self.request_count = {}
 
-    def get_current_data(self, symbol: str) -> Dict:
-        """Get current stock data for a symbol"""
-        try:
-            # Try Yahoo Finance first (free and reliable)
-            data = self._get_yahoo_data(symbol)
-            if data:
-                return data
+        # Synthetic market for simulated data (or as the only provider)
+        self.synthetic_market = SyntheticMarket(
+            seed=self.config.SYNTHETIC_SEED,
+            tick_seconds=self.config.SYNTHETIC_TICK_SECONDS,
+        )
 
-            # Fallback to Alpha Vantage
-            data = self._get_alpha_vantage_data(symbol)
-            if data:
-                return data
+        # Batch quote fetching
+        if quote_provider is None:
+            if self.config.MARKET_DATA_PROVIDER == "synthetic":
+                quote_provider = SyntheticQuoteProvider(self.synthetic_market)
+            else:
+                quote_provider = YahooQuoteProvider(
+                    timeout=self.config.YAHOO_TIMEOUT,
+                    max_threads=self.config.QUOTE_DOWNLOAD_THREADS,
+                )
+        self.quote_provider = quote_provider
+        self.quote_batch_size = max(1, self.config.QUOTE_BATCH_SIZE)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, self.config.QUOTE_FETCH_WORKERS),
+            thread_name_prefix="quote-fetch",
+        )
 
-            # Fallback to simulated data for demo
-            return self._get_simulated_data(symbol)
+        # Hedged provider chain for single-symbol quotes
+        self.provider_chain = HedgedProviderChain(
+            [
+                (self.quote_provider.name, self._get_yahoo_data),
+                ("alpha_vantage", self._get_alpha_vantage_data),
+            ],
+            workers=self.config.QUOTE_HEDGE_WORKERS,
+            budget=self.config.QUOTE_LATENCY_BUDGET,
+            hedge_percentile=self.config.QUOTE_HEDGE_PERCENTILE,
+            default_hedge_delay=self.config.QUOTE_HEDGE_DEFAULT_DELAY,
+            latency_window=self.config.QUOTE_LATENCY_WINDOW,
+        )
+
+        # Fundamentals are refreshed in the background, never per quote
+        self.fundamentals = FundamentalsStore(
+            self.quote_provider.fetch_fundamentals,
+            db_manager=db_manager,
+            max_age=self.config.FUNDAMENTALS_MAX_AGE,
+        )
+
+        # Local daily bar store (needs a database)
+        self.bar_store = None
+        if db_manager is not None:
+            self.bar_store = BarStore(
+                db_manager,
+                self.quote_provider.fetch_daily_bars,
+                today_ttl=self.config.BAR_STORE_TODAY_TTL,
+            )
+
+        # Market overview snapshot, replaced by a background refresher
+        self._market_overview = None
+        self._market_overview_lock = threading.Lock()
+        self._market_overview_task = None
 
+        # Recent price samples per symbol for indicators and predictors
+        self.price_history = PriceHistory(self.config.PRICE_HISTORY_CAPACITY)
+
+        # Shared quote cache for API requests and the broadcast loop
+        self.quote_cache = QuoteCache(
+            ttl=self.config.QUOTE_CACHE_TTL,
+            max_size=self.config.QUOTE_CACHE_MAX_SIZE,
+        )
+
+    def get_current_data(self, symbol: str) -> Dict:
+        """Get current stock data for a symbol (served from the quote cache)"""
+        return self.quote_cache.get_or_load(symbol, self._fetch_current_data)
+
+    def _fetch_current_data(self, symbol: str) -> Dict:
+        """Fetch current stock data for a symbol from the providers"""
+        try:
+            # Yahoo Finance first, hedged to Alpha Vantage, within the budget
+            data = self.provider_chain.fetch(symbol)
         except Exception as e:
             logger.error(f"Error getting current data for {symbol}: {e}")
-            return self._get_simulated_data(symbol)
+            data = None
 
-    def _get_yahoo_data(self, symbol: str) -> Optional[Dict]:
-        """Get data from Yahoo Finance (Free)"""
-        try:
-            ticker = yf.Ticker(symbol)
-            info = ticker.info
-            hist = ticker.history(period="2d")
+        if not data:
+            # Fallback to simulated data for demo
+            data = self._get_simulated_data(symbol)
 
-            if hist.empty:
-                return None
+        if self.is_recordable(data):
+            self.price_history.append_quote(symbol, data)
+        return data
 
-            current_price = hist["Close"].iloc[-1]
-            previous_price = hist["Close"].iloc[-2] if len(hist) > 1 else current_price
+    def is_recordable(self, quote: Dict) -> bool:
+        """Whether a quote may feed price history, intraday bars and indicators
 
-            change = current_price - previous_price
-            change_percent = (
-                (change / previous_price) * 100 if previous_price != 0 else 0
-            )
+        Simulated fallback quotes only count as prices when the whole market
+        is synthetic; otherwise they would be stored as real bars.
+        """
+        return (
+            quote.get("source") != "simulated"
+            or self.config.MARKET_DATA_PROVIDER == "synthetic"
+        )
 
-            return {
-                "symbol": symbol,
-                "current_price": float(current_price),
-                "open_price": float(hist["Open"].iloc[-1]),
-                "high_price": float(hist["High"].iloc[-1]),
-                "low_price": float(hist["Low"].iloc[-1]),
-                "volume": int(hist["Volume"].iloc[-1]),
-                "change": float(change),
-                "change_percent": float(change_percent),
-                "market_cap": info.get("marketCap", 0),
-                "pe_ratio": info.get("trailingPE", 0),
-                "timestamp": datetime.now(),
-                "source": "yahoo_finance",
-            }
+    def recordable_quotes(self, quotes: Dict[str, Dict]) -> Dict[str, Dict]:
+        """The quotes that may be recorded (see is_recordable)"""
+        return {
+            symbol: quote
+            for symbol, quote in quotes.items()
+            if self.is_recordable(quote)
+        }
+
+    def _get_yahoo_data(self, symbol: str) -> Optional[Dict]:
+        """Get data from the quote provider (Yahoo Finance by default)
+
+        Raises ProviderSkipped while the provider's circuit is open.
+        """
+        breaker = get_circuit_breaker(self.quote_provider.name)
+        if not breaker.allow():
+            raise ProviderSkipped(f"{self.quote_provider.name} circuit open")
 
+        try:
+            data = self.quote_provider.fetch_quotes([symbol]).get(symbol)
         except Exception as e:
+            breaker.record_failure()
             logger.error(f"Yahoo Finance error for {symbol}: {e}")
             return None
 
+        # The provider answered; a symbol it does not quote is not a failure
+        breaker.record_success()
+        if not data:
+            return None
+        return self.fundamentals.merge_into(data)
+
     def _get_alpha_vantage_data(self, symbol: str) -> Optional[Dict]:
-        """Get data from Alpha Vantage API"""
-        try:
-            # Rate limiting check
-            if not self._check_rate_limit("alpha_vantage"):
-                return None
+        """Get data from Alpha Vantage API
+
+        Raises ProviderSkipped while the circuit is open or when rate limited.
+        """
+        breaker = get_circuit_breaker("alpha_vantage")
+        if not breaker.allow():
+            raise ProviderSkipped("alpha_vantage circuit open")
+
+        # Rate limiting check
+        if not self._check_rate_limit(
+            "alpha_vantage", timeout=self.config.RATE_LIMIT_MAX_WAIT
+        ):
+            logger.warning(f"Alpha Vantage rate limit reached, skipping {symbol}")
+            raise ProviderSkipped("alpha_vantage rate limited")
 
-            url = f"{self.config.ALPHA_VANTAGE_BASE_URL}?function=GLOBAL_QUOTE&symbol={symbol}&apikey={self.alpha_vantage_key}"
-            response = requests.get(url, timeout=10)
+        try:
+            response = self.http.get(
+                self.config.ALPHA_VANTAGE_BASE_URL,
+                params={
+                    "function": "GLOBAL_QUOTE",
+                    "symbol": symbol,
+                    "apikey": self.alpha_vantage_key,
+                },
+                timeout=10,
+            )
 
             if response.status_code != 200:
+                breaker.record_failure()
                 return None
 
             data = response.json()
 
+            # Missing key, invalid key and quota notes all come back without a quote
             if "Global Quote" not in data:
+                breaker.record_failure()
                 return None
 
+            # Unknown symbols get an empty quote: the provider itself is fine
             quote = data["Global Quote"]
+            if not quote:
+                breaker.record_success()
+                return None
 
-            return {
+            result = {
                 "symbol": symbol,
                 "current_price": float(quote["05. price"]),
                 "open_price": float(quote["02. open"]),
@@ -114,216 +222,232 @@ class StockDataCollector:
                 "volume": int(quote["06. volume"]),
                 "change": float(quote["09. change"]),
                 "change_percent": float(quote["10. change percent"].replace("%", "")),
+                "trading_day": quote.get("07. latest trading day"),
                 "timestamp": datetime.now(),
                 "source": "alpha_vantage",
             }
+            breaker.record_success()
+            return result
 
         except Exception as e:
+            breaker.record_failure()
             logger.error(f"Alpha Vantage error for {symbol}: {e}")
             return None
 
     def _get_simulated_data(self, symbol: str) -> Dict:
         """Generate simulated stock data for demo purposes"""
-        # Base prices for different stocks
-        base_prices = {
-            "AAPL": 150.0,
-            "GOOGL": 2800.0,
-            "MSFT": 330.0,
-            "AMZN": 3400.0,
-            "TSLA": 800.0,
-            "META": 320.0,
-            "NVDA": 450.0,
-            "NFLX": 400.0,
-        }
-
-        base_price = base_prices.get(symbol, 100.0)
-
-        # Add some random variation
-        variation = np.random.normal(0, 0.02)  # 2% standard deviation
-        current_price = base_price * (1 + variation)
-
-        # Generate other values
-        open_price = current_price * (1 + np.random.normal(0, 0.01))
-        high_price = max(current_price, open_price) * (
-            1 + abs(np.random.normal(0, 0.01))
-        )
-        low_price = min(current_price, open_price) * (
-            1 - abs(np.random.normal(0, 0.01))
-        )
-        volume = int(np.random.normal(1000000, 300000))
+        return self.synthetic_market.quotes([symbol])[symbol]
 
-        # Calculate change
-        previous_price = base_price
-        change = current_price - previous_price
-        change_percent = (change / previous_price) * 100
+    def get_historical_data(
+        self, symbol: str, days: int = 30, layout: str = "rows"
+    ) -> Union[List[Dict], Dict[str, List]]:
+        """Get historical stock data (served from the local bar store)
 
-        return {
-            "symbol": symbol,
-            "current_price": round(current_price, 2),
-            "open_price": round(open_price, 2),
-            "high_price": round(high_price, 2),
-            "low_price": round(low_price, 2),
-            "volume": max(volume, 100000),
-            "change": round(change, 2),
-            "change_percent": round(change_percent, 2),
-            "market_cap": int(current_price * 1000000000),  # Simulated market cap
-            "pe_ratio": round(np.random.normal(25, 5), 2),
-            "timestamp": datetime.now(),
-            "source": "simulated",
-        }
-
-    def get_historical_data(self, symbol: str, days: int = 30) -> List[Dict]:
-        """Get historical stock data"""
+        ``layout="rows"`` returns one dict per day; ``layout="columns"``
+        returns one list per field, which is much cheaper to build and
+        serialize for long ranges.
+        """
         try:
-            # Try Yahoo Finance first
-            ticker = yf.Ticker(symbol)
-            end_date = datetime.now()
+            end_date = date.today()
             start_date = end_date - timedelta(days=days)
 
-            hist = ticker.history(start=start_date, end=end_date)
-
-            if hist.empty:
-                return self._get_simulated_historical_data(symbol, days)
-
-            historical_data = []
-            for date, row in hist.iterrows():
-                historical_data.append(
-                    {
-                        "date": date.strftime("%Y-%m-%d"),
-                        "open": float(row["Open"]),
-                        "high": float(row["High"]),
-                        "low": float(row["Low"]),
-                        "close": float(row["Close"]),
-                        "volume": int(row["Volume"]),
-                    }
-                )
+            bars = self._get_daily_bars(symbol, start_date, end_date)
 
-            return historical_data
+            if bars is None or bars.empty:
+                bars = self._get_simulated_historical_bars(symbol, days)
 
         except Exception as e:
             logger.error(f"Error getting historical data for {symbol}: {e}")
-            return self._get_simulated_historical_data(symbol, days)
-
-    def _get_simulated_historical_data(self, symbol: str, days: int) -> List[Dict]:
-        """Generate simulated historical data"""
-        base_prices = {
-            "AAPL": 150.0,
-            "GOOGL": 2800.0,
-            "MSFT": 330.0,
-            "AMZN": 3400.0,
-            "TSLA": 800.0,
-            "META": 320.0,
-            "NVDA": 450.0,
-            "NFLX": 400.0,
-        }
-
-        base_price = base_prices.get(symbol, 100.0)
-        historical_data = []
-
-        for i in range(days):
-            date = datetime.now() - timedelta(days=days - i)
+            bars = self._get_simulated_historical_bars(symbol, days)
+
+        if layout == "columns":
+            return bars_to_columns(bars)
+        return bars_to_rows(bars)
+
+    def get_recorded_history(self, symbol: str, days: int) -> Optional[Dict[str, List]]:
+        """Columnar daily bars from the market data provider, None if it has none
+
+        Unlike ``get_historical_data`` this never falls back to simulated
+        bars, so indicators and predictor features are only seeded from
+        recorded prices. Provider errors propagate to the caller.
+        """
+        end_date = date.today()
+        bars = self._get_daily_bars(symbol, end_date - timedelta(days=days), end_date)
+        if bars is None or bars.empty:
+            return None
+        return bars_to_columns(bars)
 
-            # Create a trend with some randomness
-            trend = 0.001 * i  # Slight upward trend
-            noise = np.random.normal(0, 0.02)
+    def _get_daily_bars(self, symbol: str, start_date: date, end_date: date):
+        """Get daily bars, going upstream only for ranges not stored locally"""
+        if self.bar_store is not None:
+            return self.bar_store.get_bars(symbol, start_date, end_date)
 
-            close_price = base_price * (1 + trend + noise)
-            open_price = close_price * (1 + np.random.normal(0, 0.01))
-            high_price = max(close_price, open_price) * (
-                1 + abs(np.random.normal(0, 0.01))
-            )
-            low_price = min(close_price, open_price) * (
-                1 - abs(np.random.normal(0, 0.01))
-            )
-            volume = int(np.random.normal(1000000, 300000))
-
-            historical_data.append(
-                {
-                    "date": date.strftime("%Y-%m-%d"),
-                    "open": round(open_price, 2),
-                    "high": round(high_price, 2),
-                    "low": round(low_price, 2),
-                    "close": round(close_price, 2),
-                    "volume": max(volume, 100000),
-                }
-            )
+        return self.quote_provider.fetch_daily_bars(symbol, start_date, end_date)
 
-        return historical_data
+    def _get_simulated_historical_bars(self, symbol: str, days: int):
+        """Generate simulated historical bars"""
+        end_date = date.today()
+        return self.synthetic_market.daily_bars(
+            symbol, end_date - timedelta(days=days), end_date
+        )
 
     def get_multiple_stocks_data(self, symbols: List[str]) -> Dict[str, Dict]:
         """Get data for multiple stocks"""
-        results = {}
+        return self.get_current_data_batch(symbols)
+
+    def get_current_data_batch(self, symbols: List[str]) -> Dict[str, Dict]:
+        """Get current data for many symbols with batched provider calls
+
+        Fresh quotes come from the quote cache. The remaining symbols are split
+        into chunks of ``QUOTE_BATCH_SIZE`` and each chunk is fetched with a
+        single provider round trip on the worker pool. Symbols
+        the provider could not quote fall back to Alpha Vantage and then to
+        simulated data, so every requested symbol gets an entry.
+        """
+        symbols = list(dict.fromkeys(symbols))
+        if not symbols:
+            return {}
 
-        for symbol in symbols:
-            try:
-                data = self.get_current_data(symbol)
-                if data:
-                    results[symbol] = data
+        return self.quote_cache.get_or_load_many(
+            symbols, self._fetch_current_data_batch
+        )
 
-                # Add small delay to avoid rate limiting
-                time.sleep(0.1)
+    def _fetch_current_data_batch(self, symbols: List[str]) -> Dict[str, Dict]:
+        """Fetch quotes for symbols that missed the quote cache"""
+        chunks = [
+            symbols[i : i + self.quote_batch_size]
+            for i in range(0, len(symbols), self.quote_batch_size)
+        ]
 
-            except Exception as e:
-                logger.error(f"Error getting data for {symbol}: {e}")
-                continue
+        results = {}
+        for quotes in self._executor.map(self._fetch_quote_chunk, chunks):
+            results.update(quotes)
+
+        missing = [symbol for symbol in symbols if symbol not in results]
+        if missing:
+            for symbol, data in zip(
+                missing, self._executor.map(self._get_fallback_data, missing)
+            ):
+                results[symbol] = data
+
+        self.price_history.append_quotes(self.recordable_quotes(results))
+        return {symbol: results[symbol] for symbol in symbols}
+
+    def start_fundamentals_refresh(self, symbols: List[str]):
+        """Start the slow background refresh of market cap and P/E"""
+        return self.fundamentals.start(
+            symbols, self.config.FUNDAMENTALS_REFRESH_INTERVAL
+        )
 
-        return results
+    def get_provider_stats(self) -> Dict:
+        """Get per-provider latency histograms and hedging counters"""
+        return self.provider_chain.stats()
+
+    def get_cache_stats(self) -> Dict:
+        """Get quote cache hit/miss/coalesced counters"""
+        return self.quote_cache.stats()
 
-    def _check_rate_limit(self, service: str) -> bool:
-        """Check if we're within rate limits for a service"""
-        current_time = time.time()
+    def _fetch_quote_chunk(
+        self, symbols: List[str], with_fundamentals: bool = True
+    ) -> Dict[str, Dict]:
+        """Fetch one chunk of quotes from the batch provider"""
+        breaker = get_circuit_breaker(self.quote_provider.name)
+        if not breaker.allow():
+            return {}
 
-        # Initialize tracking for service
-        if service not in self.last_request_time:
-            self.last_request_time[service] = current_time
-            self.request_count[service] = 0
-            return True
+        try:
+            quotes = self.quote_provider.fetch_quotes(symbols)
+        except Exception as e:
+            breaker.record_failure()
+            logger.error(f"Batch quote error for {', '.join(symbols)}: {e}")
+            return {}
 
-        # Reset counter if a minute has passed
-        if current_time - self.last_request_time[service] > 60:
-            self.request_count[service] = 0
-            self.last_request_time[service] = current_time
+        # An empty answer means none of the symbols are quoted, not an outage
+        breaker.record_success()
+        if with_fundamentals:
+            for quote in quotes.values():
+                self.fundamentals.merge_into(quote)
+        return quotes
 
-        # Check if we're under the limit
-        if self.request_count[service] < 5:  # Conservative limit
-            self.request_count[service] += 1
-            return True
+    def _get_fallback_data(self, symbol: str) -> Dict:
+        """Per-symbol fallback when the batch provider has no quote"""
+        try:
+            data = self._get_alpha_vantage_data(symbol)
+            if data:
+                return data
+        except ProviderSkipped:
+            pass
+        except Exception as e:
+            logger.error(f"Error getting fallback data for {symbol}: {e}")
 
-        return False
+        return self._get_simulated_data(symbol)
+
+    def _check_rate_limit(self, service: str, timeout: float = 0.0) -> bool:
+        """Take a request token for a service, waiting up to timeout seconds"""
+        return get_rate_limiter(service).acquire(timeout=timeout)
 
     def get_market_overview(self) -> Dict:
-        """Get overall market overview"""
+        """Get overall market overview from the latest snapshot
+
+        Requests never go upstream once a snapshot exists; the background
+        refresher replaces it. Only the very first call computes one inline.
+        """
+        snapshot = self._market_overview
+        if snapshot is None:
+            with self._market_overview_lock:
+                if self._market_overview is None:
+                    self.refresh_market_overview()
+                snapshot = self._market_overview
+
+        age = (datetime.now() - snapshot["as_of"]).total_seconds()
+        return {
+            "indices": snapshot["indices"],
+            "as_of": snapshot["as_of"].isoformat(),
+            "age_seconds": round(age, 1),
+            "stale": age > 2 * self.config.MARKET_OVERVIEW_REFRESH_INTERVAL,
+        }
+
+    def refresh_market_overview(self):
+        """Fetch all market indices in one batched call and swap the snapshot"""
         try:
-            # Get major indices
-            indices = ["^GSPC", "^DJI", "^IXIC"]  # S&P 500, Dow Jones, NASDAQ
-            market_data = {}
+            indices = self.config.MARKET_OVERVIEW_INDICES
+            quotes = self._fetch_quote_chunk(indices, with_fundamentals=False)
 
+            market_data = {}
             for index in indices:
-                try:
-                    ticker = yf.Ticker(index)
-                    hist = ticker.history(period="2d")
-
-                    if not hist.empty:
-                        current = hist["Close"].iloc[-1]
-                        previous = hist["Close"].iloc[-2] if len(hist) > 1 else current
-                        change = current - previous
-                        change_percent = (
-                            (change / previous) * 100 if previous != 0 else 0
-                        )
-
-                        market_data[index] = {
-                            "value": round(current, 2),
-                            "change": round(change, 2),
-                            "change_percent": round(change_percent, 2),
-                        }
-                except Exception as e:
-                    logger.error(f"Error getting data for {index}: {e}")
-
-            return market_data
+                quote = quotes.get(index)
+                if quote:
+                    market_data[index] = {
+                        "value": round(quote["current_price"], 2),
+                        "change": round(quote["change"], 2),
+                        "change_percent": round(quote["change_percent"], 2),
+                    }
+                elif (
+                    self._market_overview and index in self._market_overview["indices"]
+                ):
+                    # Keep the last known value rather than dropping the index
+                    market_data[index] = self._market_overview["indices"][index]
+
+            if market_data or self._market_overview is None:
+                self._market_overview = {
+                    "indices": market_data,
+                    "as_of": datetime.now(),
+                }
 
         except Exception as e:
             logger.error(f"Error getting market overview: {e}")
-            return {}
+            if self._market_overview is None:
+                self._market_overview = {"indices": {}, "as_of": datetime.now()}
+
+    def start_market_overview_refresh(self):
+        """Start the background refresher for the market overview snapshot"""
+        if self._market_overview_task is None:
+            self._market_overview_task = PeriodicTask(
+                "market-overview-refresh",
+                self.config.MARKET_OVERVIEW_REFRESH_INTERVAL,
+                self.refresh_market_overview,
+            )
+        return self._market_overview_task.start()
 
     def test_connection(self) -> Dict[str, bool]:
         """Test connection to all data sources"""
@@ -340,8 +464,15 @@ class StockDataCollector:
         # Test Alpha Vantage
         try:
             if self.alpha_vantage_key != "demo":
-                url = f"{self.config.ALPHA_VANTAGE_BASE_URL}?function=GLOBAL_QUOTE&symbol=AAPL&apikey={self.alpha_vantage_key}"
-                response = requests.get(url, timeout=10)
+                response = self.http.get(
+                    self.config.ALPHA_VANTAGE_BASE_URL,
+                    params={
+                        "function": "GLOBAL_QUOTE",
+                        "symbol": "AAPL",
+                        "apikey": self.alpha_vantage_key,
+                    },
+                    timeout=10,
+                )
                 results["alpha_vantage"] = response.status_code == 200
             else:
                 results["alpha_vantage"] = False
@@ -0,0 +1,403 @@
+import logging
+import threading
+import time
+import zlib
+from datetime import date, datetime
+from typing import Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+from data_collectors.quote_providers import QuoteProvider
+
+logger = logging.getLogger(__name__)
+
+# Reference prices for the default tickers and indices; other symbols get a
+# stable pseudo-random base price derived from the ticker itself.
+DEFAULT_BASE_PRICES = {
+    "AAPL": 150.0,
+    "GOOGL": 2800.0,
+    "MSFT": 330.0,
+    "AMZN": 3400.0,
+    "TSLA": 800.0,
+    "META": 320.0,
+    "NVDA": 450.0,
+    "NFLX": 400.0,
+    "^GSPC": 4500.0,
+    "^DJI": 35000.0,
+    "^IXIC": 14000.0,
+}
+
+TRADING_DAYS_PER_YEAR = 252
+TRADING_SECONDS_PER_DAY = 6.5 * 3600
+
+
+def generate_symbols(count: int, prefix: str = "SYN") -> List[str]:
+    """Generate a universe of synthetic tickers for load testing"""
+    width = max(4, len(str(count)))
+    return [f"{prefix}{i:0{width}d}" for i in range(count)]
+
+
+def _symbol_unit(symbol: str, salt: str) -> float:
+    """Stable value in [0, 1) derived from a symbol"""
+    return zlib.crc32(f"{salt}:{symbol}".encode()) / 2**32
+
+
+class SyntheticMarket:
+    """Vectorized, seedable market simulator
+
+    Prices follow geometric Brownian motion with a one-factor correlation
+    model: every symbol loads on a shared market shock with weight
+    ``sqrt(correlation)``, so N symbols x T steps are drawn in a single NumPy
+    call without building an N x N covariance matrix. Per-symbol parameters
+    (base price, volatility, share count) are derived from the ticker, so the
+    same seed always produces the same market. Live quotes keep daily session
+    state: when ``today`` changes, the last price becomes the previous close
+    that ``change`` is measured against, and open/high/low/volume restart.
+    """
+
+    def __init__(
+        self,
+        seed: Optional[int] = None,
+        annual_drift: float = 0.05,
+        correlation: float = 0.3,
+        tick_seconds: float = 10.0,
+        base_prices: Optional[Dict[str, float]] = None,
+        today: Callable[[], date] = date.today,
+    ):
+        self.seed = (
+            seed if seed is not None else int(np.random.SeedSequence().entropy % 2**32)
+        )
+        self.annual_drift = annual_drift
+        self.correlation = float(np.clip(correlation, 0.0, 1.0))
+        self.tick_seconds = tick_seconds
+        self.base_prices = dict(DEFAULT_BASE_PRICES)
+        self.base_prices.update(base_prices or {})
+
+        self.rng = np.random.default_rng(self.seed)
+        self._today = today
+        self._session_day: Optional[date] = None
+        self._lock = threading.Lock()
+        self._index = {}
+        self._symbols = []
+        self._base = np.empty(0)
+        self._sigma = np.empty(0)
+        self._shares = np.empty(0)
+        self._eps = np.empty(0)
+        self._price = np.empty(0)
+        self._prev_close = np.empty(0)
+        self._open = np.empty(0)
+        self._high = np.empty(0)
+        self._low = np.empty(0)
+        self._volume = np.empty(0, dtype=np.int64)
+
+    # ------------------------------------------------------------------
+    # Symbol universe
+    # ------------------------------------------------------------------
+    def base_price(self, symbol: str) -> float:
+        if symbol in self.base_prices:
+            return self.base_prices[symbol]
+        # Log-uniform between $10 and $1000
+        return round(10.0 * 100.0 ** _symbol_unit(symbol, "price"), 2)
+
+    def volatility(self, symbol: str) -> float:
+        """Annualised volatility between 15% and 60%"""
+        return 0.15 + 0.45 * _symbol_unit(symbol, "vol")
+
+    def add_symbols(self, symbols: Iterable[str]) -> np.ndarray:
+        """Register symbols and return their row indexes"""
+        with self._lock:
+            return self._ensure(symbols)
+
+    def _ensure(self, symbols: Iterable[str]) -> np.ndarray:
+        symbols = list(symbols)
+        new = [s for s in dict.fromkeys(symbols) if s not in self._index]
+        if new:
+            base = np.array([self.base_price(s) for s in new])
+            sigma = np.array([self.volatility(s) for s in new])
+            shares = np.array(
+                [1e8 * 100 ** _symbol_unit(s, "shares") for s in new]
+            ).round()
+            eps = base / np.array([12 + 30 * _symbol_unit(s, "pe") for s in new])
+
+            for offset, symbol in enumerate(new):
+                self._index[symbol] = len(self._symbols) + offset
+            self._symbols.extend(new)
+
+            self._base = np.concatenate([self._base, base])
+            self._sigma = np.concatenate([self._sigma, sigma])
+            self._shares = np.concatenate([self._shares, shares])
+            self._eps = np.concatenate([self._eps, eps])
+            self._price = np.concatenate([self._price, base])
+            self._prev_close = np.concatenate([self._prev_close, base])
+            self._open = np.concatenate([self._open, base])
+            self._high = np.concatenate([self._high, base])
+            self._low = np.concatenate([self._low, base])
+            self._volume = np.concatenate([self._volume, np.zeros(len(new), np.int64)])
+
+        return np.fromiter((self._index[s] for s in symbols), dtype=np.intp)
+
+    def _roll_session(self):
+        """Close the previous trading session once the day has changed"""
+        today = self._today()
+        if today == self._session_day:
+            return
+        if self._session_day is not None:
+            self._prev_close = self._price.copy()
+            self._open = self._price.copy()
+            self._high = self._price.copy()
+            self._low = self._price.copy()
+            self._volume[:] = 0
+        self._session_day = today
+
+    # ------------------------------------------------------------------
+    # Path generation
+    # ------------------------------------------------------------------
+    def simulate_paths(
+        self,
+        symbols: List[str],
+        steps: int,
+        dt: float = 1.0 / TRADING_DAYS_PER_YEAR,
+        start_prices: Optional[np.ndarray] = None,
+        rng: Optional[np.random.Generator] = None,
+        shocks: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """Simulate correlated GBM price paths, shape (len(symbols), steps)
+
+        ``shocks`` (same shape, standard normal) replaces the random draw.
+        """
+        with self._lock:
+            rows = self._ensure(symbols)
+            sigma = self._sigma[rows][:, None]
+            if start_prices is None:
+                start_prices = self._base[rows]
+
+        if shocks is None:
+            shocks = self._correlated_shocks(rng or self.rng, len(rows), steps)
+        drift = (self.annual_drift - 0.5 * sigma**2) * dt
+        log_returns = drift + sigma * np.sqrt(dt) * shocks
+        start_prices = np.asarray(start_prices)[:, None]
+        return start_prices * np.exp(np.cumsum(log_returns, axis=1))
+
+    def _correlated_shocks(self, rng, n: int, steps: int) -> np.ndarray:
+        common = rng.standard_normal(steps)
+        idiosyncratic = rng.standard_normal((n, steps))
+        return self._mix_shocks(common, idiosyncratic)
+
+    def _mix_shocks(self, common: np.ndarray, idiosyncratic: np.ndarray):
+        return (
+            np.sqrt(self.correlation) * common
+            + np.sqrt(1.0 - self.correlation) * idiosyncratic
+        )
+
+    # ------------------------------------------------------------------
+    # Live quotes
+    # ------------------------------------------------------------------
+    def step(self, symbols: Optional[List[str]] = None, steps: int = 1):
+        """Advance the live price of symbols (all registered by default)"""
+        dt = self.tick_seconds / (TRADING_DAYS_PER_YEAR * TRADING_SECONDS_PER_DAY)
+
+        with self._lock:
+            self._roll_session()
+            rows = (
+                np.arange(len(self._symbols))
+                if symbols is None
+                else self._ensure(symbols)
+            )
+            if len(rows) == 0:
+                return rows
+
+            sigma = self._sigma[rows]
+            shocks = self._correlated_shocks(self.rng, len(rows), steps)
+            log_return = (
+                self.annual_drift - 0.5 * sigma**2
+            ) * dt * steps + sigma * np.sqrt(dt) * shocks.sum(axis=1)
+            price = self._price[rows] * np.exp(log_return)
+
+            self._price[rows] = price
+            self._high[rows] = np.maximum(self._high[rows], price)
+            self._low[rows] = np.minimum(self._low[rows], price)
+            self._volume[rows] += self.rng.poisson(2500 * steps, len(rows))
+            return rows
+
+    def quotes(self, symbols: List[str], advance: bool = True) -> Dict[str, Dict]:
+        """Current quotes in the collector's quote format"""
+        symbols = list(dict.fromkeys(symbols))
+        rows = self.step(symbols) if advance else self.add_symbols(symbols)
+
+        with self._lock:
+            self._roll_session()
+            price = self._price[rows].round(2)
+            prev_close = self._prev_close[rows]
+            open_price = self._open[rows].round(2)
+            high = self._high[rows].round(2)
+            low = self._low[rows].round(2)
+            volume = self._volume[rows] + 100000
+            market_cap = (self._price[rows] * self._shares[rows]).astype(np.int64)
+            pe_ratio = (self._price[rows] / self._eps[rows]).round(2)
+
+        change = (price - prev_close).round(2)
+        change_percent = (change / prev_close * 100).round(2)
+        now = datetime.now()
+
+        return {
+            symbol: {
+                "symbol": symbol,
+                "current_price": float(price[i]),
+                "open_price": float(open_price[i]),
+                "high_price": float(high[i]),
+                "low_price": float(low[i]),
+                "volume": int(volume[i]),
+                "change": float(change[i]),
+                "change_percent": float(change_percent[i]),
+                "market_cap": int(market_cap[i]),
+                "pe_ratio": float(pe_ratio[i]),
+                "timestamp": now,
+                "source": "simulated",
+            }
+            for i, symbol in enumerate(symbols)
+        }
+
+    def fundamentals(self, symbol: str) -> Dict:
+        with self._lock:
+            row = self._ensure([symbol])[0]
+            return {
+                "market_cap": int(self._price[row] * self._shares[row]),
+                "pe_ratio": round(float(self._price[row] / self._eps[row]), 2),
+            }
+
+    # ------------------------------------------------------------------
+    # Historical bars
+    # ------------------------------------------------------------------
+    def daily_bars(self, symbol: str, start: date, end: date) -> pd.DataFrame:
+        """Daily OHLCV bars for business days in [start, end]
+
+        The close path is simulated backwards from today's base price. Its
+        shocks mix a market stream shared by every symbol with a per-symbol
+        stream, both drawn most recent day first, so histories are
+        correlated across symbols and a given date always gets the same bar
+        regardless of the requested range.
+        """
+        today = pd.Timestamp(date.today())
+        days = pd.bdate_range(min(pd.Timestamp(start), today), today)
+        n = len(days)
+        if n == 0:
+            return pd.DataFrame(
+                columns=["date", "open", "high", "low", "close", "volume"]
+            )
+
+        seeds = np.random.SeedSequence([self.seed, zlib.crc32(symbol.encode())])
+        close_rng, open_rng, range_rng, volume_rng = [
+            np.random.default_rng(s) for s in seeds.spawn(4)
+        ]
+
+        market_rng = np.random.default_rng(np.random.SeedSequence([self.seed]))
+        shocks = self._mix_shocks(
+            market_rng.standard_normal(n - 1), close_rng.standard_normal((1, n - 1))
+        )
+
+        # growth[j] is the price growth over the last j + 1 days: today's
+        # close is the base price and each earlier close divides it out
+        growth = self.simulate_paths([symbol], n - 1, start_prices=[1.0], shocks=shocks)
+        close = self.base_price(symbol) / np.concatenate([[1.0], growth[0]])[::-1]
+
+        open_price = close * (1 + 0.01 * open_rng.standard_normal(n)[::-1])
+        spread = np.abs(0.01 * range_rng.standard_normal((n, 2)))[::-1].T
+        high = np.maximum(close, open_price) * (1 + spread[0])
+        low = np.minimum(close, open_price) * (1 - spread[1])
+        volume = np.maximum(volume_rng.normal(1000000, 300000, n)[::-1], 100000).astype(
+            np.int64
+        )
+
+        bars = pd.DataFrame(
+            {
+                "date": days.strftime("%Y-%m-%d"),
+                "open": open_price.round(2),
+                "high": high.round(2),
+                "low": low.round(2),
+                "close": close.round(2),
+                "volume": volume,
+            }
+        )
+        mask = (days >= pd.Timestamp(start)) & (days <= pd.Timestamp(end))
+        return bars[mask].reset_index(drop=True)
+
+
+class SyntheticQuoteProvider(QuoteProvider):
+    """Quote provider backed by a SyntheticMarket (offline, reproducible)"""
+
+    name = "synthetic"
+
+    def __init__(self, market: SyntheticMarket):
+        self.market = market
+
+    def fetch_quotes(self, symbols: List[str]) -> Dict[str, Dict]:
+        quotes = self.market.quotes(symbols)
+        for quote in quotes.values():
+            quote["source"] = self.name
+        return quotes
+
+    def fetch_fundamentals(self, symbol: str) -> Optional[Dict]:
+        return self.market.fundamentals(symbol)
+
+    def fetch_daily_bars(self, symbol: str, start: date, end: date) -> pd.DataFrame:
+        return self.market.daily_bars(symbol, start, end)
+
+
+class MarketReplay:
+    """Pushes synthetic ticks for a symbol universe at a fixed rate
+
+    Every tick advances all symbols with one vectorized step and hands the
+    resulting quotes to ``on_tick``. Ticks are scheduled against a fixed
+    clock, so a slow consumer causes dropped ticks rather than drift.
+    """
+
+    def __init__(
+        self,
+        market: SyntheticMarket,
+        symbols: List[str],
+        on_tick: Callable[[Dict[str, Dict]], None],
+        ticks_per_second: float = 1.0,
+    ):
+        self.market = market
+        self.symbols = list(symbols)
+        self.on_tick = on_tick
+        self.interval = 1.0 / ticks_per_second
+        self.ticks = 0
+        self.skipped_ticks = 0
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "MarketReplay":
+        self.market.add_symbols(self.symbols)
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="market-replay")
+        self._thread.daemon = True
+        self._thread.start()
+        logger.info(
+            f"Market replay started: {len(self.symbols)} symbols at "
+            f"{1.0 / self.interval:g} ticks/s"
+        )
+        return self
+
+    def stop(self, timeout: Optional[float] = None):
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout)
+
+    def _run(self):
+        next_tick = time.monotonic()
+        while not self._stop_event.is_set():
+            try:
+                self.on_tick(self.market.quotes(self.symbols))
+                self.ticks += 1
+            except Exception as e:
+                logger.error(f"Error in market replay tick: {e}")
+
+            next_tick += self.interval
+            now = time.monotonic()
+            if now > next_tick:
+                missed = int((now - next_tick) / self.interval) + 1
+                self.skipped_ticks += missed
+                next_tick += missed * self.interval
+
+            self._stop_event.wait(max(0.0, next_tick - now))
@@ -1,12 +1,60 @@
 import random
 
+import numpy as np
+
 
 class EnsemblePredictor:
     """A simple ensemble predictor class"""
 
+    def __init__(self, price_history=None, indicators=None, window: int = 60):
+        # Shared PriceHistory ring buffers filled by the stock data collector
+        self.price_history = price_history
+        # IndicatorEngine with streaming technical indicators per symbol
+        self.indicators = indicators
+        self.window = window
+
+    def recent_prices(self, symbol):
+        """Zero-copy view of the symbol's most recent prices (may be empty)"""
+        if self.price_history is None:
+            return np.empty(0)
+        return self.price_history.prices(symbol, self.window)
+
+    def get_features(self, symbol):
+        """Technical indicator features for a symbol (empty if unavailable)"""
+        if self.indicators is None:
+            return {}
+        snapshot = self.indicators.get(symbol)
+        return snapshot["indicators"] if snapshot else {}
+
+    def _indicator_signal(self, features):
+        """Small drift adjustment from RSI extremes and MACD momentum"""
+        signal = 0.0
+        rsi = features.get("rsi_14")
+        if rsi is not None:
+            if rsi > 70:
+                signal -= 0.005
+            elif rsi < 30:
+                signal += 0.005
+        histogram = features.get("macd_histogram")
+        if histogram:
+            signal += 0.0025 if histogram > 0 else -0.0025
+        return signal
+
     def predict_price(self, symbol, stock_data, sentiment_data):
         """Predict the future price of a stock"""
         print(f"Predicting price for {symbol}")
+        prices = self.recent_prices(symbol)
+        if len(prices) >= 2:
+            # Extrapolate the recent trend; confidence drops with volatility
+            returns = np.diff(prices) / prices[:-1]
+            drift = returns.sum() + self._indicator_signal(self.get_features(symbol))
+            drift = float(np.clip(drift, -0.02, 0.02))
+            volatility = float(returns.std())
+            return {
+                "predicted_price": stock_data["current_price"] * (1 + drift),
+                "confidence": float(np.clip(1.0 - volatility * 50, 0.5, 1.0)),
+            }
+
         # This is just a stub for demonstration purposes
         # Normally, you would use ML models to predict the price
         return {
@@ -0,0 +1,346 @@
+import logging
+import math
+import threading
+from collections import defaultdict, deque
+from datetime import date, datetime
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+SMA_PERIODS = (20, 50)
+EMA_PERIODS = (12, 26)
+RSI_PERIOD = 14
+MACD_FAST, MACD_SLOW, MACD_SIGNAL = 12, 26, 9
+BOLLINGER_PERIOD, BOLLINGER_WIDTH = 20, 2.0
+
+
+class _RollingWindow:
+    """Running sum and sum of squares over the last ``period`` values"""
+
+    def __init__(self, period: int):
+        self.period = period
+        self.values = deque(maxlen=period)
+        self.total = 0.0
+        self.total_sq = 0.0
+        self._updates = 0
+
+    def update(self, x: float):
+        if len(self.values) == self.period:
+            oldest = self.values[0]
+            self.total -= oldest
+            self.total_sq -= oldest * oldest
+        self.values.append(x)
+        self.total += x
+        self.total_sq += x * x
+
+        # Re-sum once per window to stop floating point drift (amortized O(1))
+        self._updates += 1
+        if self._updates % self.period == 0:
+            self.total = math.fsum(self.values)
+            self.total_sq = math.fsum(v * v for v in self.values)
+
+    def load(self, values: np.ndarray):
+        self.values = deque(values[-self.period :].tolist(), maxlen=self.period)
+        self.total = math.fsum(self.values)
+        self.total_sq = math.fsum(v * v for v in self.values)
+
+    def peek_stats(self, x: Optional[float] = None):
+        """(mean, std) including ``x`` as the newest value, None until full"""
+        total, total_sq, count = self.total, self.total_sq, len(self.values)
+        if x is not None:
+            if count == self.period:
+                oldest = self.values[0]
+                total -= oldest
+                total_sq -= oldest * oldest
+                count -= 1
+            total += x
+            total_sq += x * x
+            count += 1
+        if count < self.period:
+            return None
+        mean = total / count
+        return mean, math.sqrt(max(total_sq / count - mean * mean, 0.0))
+
+
+class _Ema:
+    def __init__(self, period: int = None, alpha: float = None):
+        self.alpha = alpha if alpha is not None else 2 / (period + 1)
+        self.value: Optional[float] = None
+
+    def update(self, x: float):
+        self.value = self.peek(x)
+
+    def peek(self, x: float) -> float:
+        if self.value is None:
+            return x
+        return self.value + self.alpha * (x - self.value)
+
+
+class IndicatorSet:
+    """Streaming SMA/EMA/RSI/MACD/Bollinger state for one price series
+
+    ``update`` commits a closed bar and ``peek`` evaluates every indicator
+    as if a price were the close of the bar still forming, both in O(1)
+    without touching the history. ``load`` initialises the state from a
+    close history using the vectorized batch path.
+    """
+
+    def __init__(self):
+        self._reset()
+
+    def _reset(self):
+        self.count = 0
+        self.last_close: Optional[float] = None
+        self.sma = {period: _RollingWindow(period) for period in SMA_PERIODS}
+        self.ema = {period: _Ema(period) for period in EMA_PERIODS}
+        self.rsi_gain = _Ema(alpha=1 / RSI_PERIOD)
+        self.rsi_loss = _Ema(alpha=1 / RSI_PERIOD)
+        self.macd_fast = _Ema(MACD_FAST)
+        self.macd_slow = _Ema(MACD_SLOW)
+        self.macd_signal = _Ema(MACD_SIGNAL)
+        self.bollinger = _RollingWindow(BOLLINGER_PERIOD)
+
+    def update(self, close: float):
+        close = float(close)
+        for window in self.sma.values():
+            window.update(close)
+        for ema in self.ema.values():
+            ema.update(close)
+        self.bollinger.update(close)
+        if self.last_close is not None:
+            delta = close - self.last_close
+            self.rsi_gain.update(max(delta, 0.0))
+            self.rsi_loss.update(max(-delta, 0.0))
+        self.macd_fast.update(close)
+        self.macd_slow.update(close)
+        self.macd_signal.update(self.macd_fast.value - self.macd_slow.value)
+        self.last_close = close
+        self.count += 1
+
+    def load(self, closes: np.ndarray):
+        """Replace the state with the result of a vectorized pass over closes"""
+        closes = np.asarray(closes, dtype=float)
+        self._reset()
+        if not len(closes):
+            return
+
+        series = pd.Series(closes)
+        for window in self.sma.values():
+            window.load(closes)
+        self.bollinger.load(closes)
+        for period, ema in self.ema.items():
+            ema.value = float(series.ewm(span=period, adjust=False).mean().iloc[-1])
+        if len(closes) > 1:
+            delta = series.diff().iloc[1:]
+            alpha = 1 / RSI_PERIOD
+            self.rsi_gain.value = float(
+                delta.clip(lower=0).ewm(alpha=alpha, adjust=False).mean().iloc[-1]
+            )
+            self.rsi_loss.value = float(
+                (-delta.clip(upper=0)).ewm(alpha=alpha, adjust=False).mean().iloc[-1]
+            )
+        fast = series.ewm(span=MACD_FAST, adjust=False).mean()
+        slow = series.ewm(span=MACD_SLOW, adjust=False).mean()
+        self.macd_fast.value = float(fast.iloc[-1])
+        self.macd_slow.value = float(slow.iloc[-1])
+        self.macd_signal.value = float(
+            (fast - slow).ewm(span=MACD_SIGNAL, adjust=False).mean().iloc[-1]
+        )
+        self.last_close = float(closes[-1])
+        self.count = len(closes)
+
+    def peek(self, price: Optional[float] = None) -> Dict[str, Optional[float]]:
+        """Indicator values, treating ``price`` as the forming bar's close"""
+        count = self.count + (1 if price is not None else 0)
+        values = {}
+
+        for period, window in self.sma.items():
+            stats = window.peek_stats(price)
+            values[f"sma_{period}"] = stats[0] if stats else None
+
+        for period, ema in self.ema.items():
+            value = ema.peek(price) if price is not None else ema.value
+            values[f"ema_{period}"] = value if count >= period else None
+
+        gain, loss = self.rsi_gain.value, self.rsi_loss.value
+        if price is not None and self.last_close is not None:
+            delta = price - self.last_close
+            gain = self.rsi_gain.peek(max(delta, 0.0))
+            loss = self.rsi_loss.peek(max(-delta, 0.0))
+        if count > RSI_PERIOD and gain is not None:
+            values["rsi_14"] = 100.0 if loss == 0 else 100 - 100 / (1 + gain / loss)
+        else:
+            values["rsi_14"] = None
+
+        if price is not None:
+            macd = self.macd_fast.peek(price) - self.macd_slow.peek(price)
+            signal = self.macd_signal.peek(macd)
+        elif self.count:
+            macd = self.macd_fast.value - self.macd_slow.value
+            signal = self.macd_signal.value
+        else:
+            macd = signal = None
+        if count < MACD_SLOW:
+            macd = None
+        if count < MACD_SLOW + MACD_SIGNAL - 1:
+            signal = None
+        values["macd"] = macd
+        values["macd_signal"] = signal
+        values["macd_histogram"] = (
+            macd - signal if macd is not None and signal is not None else None
+        )
+
+        stats = self.bollinger.peek_stats(price)
+        if stats:
+            middle, std = stats
+            values["bollinger_upper"] = middle + BOLLINGER_WIDTH * std
+            values["bollinger_middle"] = middle
+            values["bollinger_lower"] = middle - BOLLINGER_WIDTH * std
+        else:
+            values["bollinger_upper"] = None
+            values["bollinger_middle"] = None
+            values["bollinger_lower"] = None
+
+        return {
+            name: round(value, 4) if value is not None else None
+            for name, value in values.items()
+        }
+
+
+class _SymbolIndicators:
+    def __init__(self):
+        self.indicators = IndicatorSet()
+        self.last_bar_date: Optional[date] = None
+        self.pending_price: Optional[float] = None
+        self.pending_date: Optional[date] = None
+
+
+class IndicatorEngine:
+    """Per-symbol streaming technical indicators over daily closes
+
+    A symbol is backfilled from its daily history the first time it is
+    asked for; a symbol without recorded history stays unknown and is
+    retried on the next request. After that every quote only moves the
+    forming day's close: values are a ``peek`` of that price, and when the
+    first quote of a new day arrives the previous day's last price is
+    committed as its close. The day is the quote's ``trading_day`` (the
+    exchange date of its bar) when the provider reports one, otherwise the
+    quote's date if that is a business day, so weekend and holiday polls
+    never add bars. Quotes for symbols that have not been backfilled are
+    ignored.
+    """
+
+    def __init__(
+        self,
+        history_loader: Callable[[str], Optional[Dict[str, List]]],
+        today: Callable[[], date] = date.today,
+    ):
+        # history_loader(symbol) -> columnar daily bars (date/close lists),
+        # None when there is no recorded history
+        self.history_loader = history_loader
+        self._today = today
+        self._states: Dict[str, _SymbolIndicators] = {}
+        self._lock = threading.Lock()
+        self._locks = defaultdict(threading.Lock)
+        self._locks_guard = threading.Lock()
+
+        self.backfills = 0
+        self.quotes = 0
+
+    def get(self, symbol: str) -> Optional[Dict]:
+        """Current indicator values for a symbol, backfilling on first use"""
+        state = self._states.get(symbol) or self.backfill(symbol)
+        if state is None:
+            return None
+
+        with self._lock:
+            values = state.indicators.peek(state.pending_price)
+            as_of = state.pending_date or state.last_bar_date
+            return {
+                "symbol": symbol,
+                "as_of": as_of.isoformat() if as_of else None,
+                "price": state.pending_price or state.indicators.last_close,
+                "bars": state.indicators.count,
+                "provisional": state.pending_price is not None,
+                "indicators": values,
+            }
+
+    def backfill(self, symbol: str) -> Optional[_SymbolIndicators]:
+        """Load a symbol's state from daily history with the vectorized path"""
+        with self._symbol_lock(symbol):
+            if symbol in self._states:
+                return self._states[symbol]
+
+            try:
+                history = self.history_loader(symbol)
+            except Exception as e:
+                logger.error(f"Error loading history for indicators of {symbol}: {e}")
+                return None
+            if not history or not history.get("close"):
+                return None
+
+            dates = [date.fromisoformat(str(d)[:10]) for d in history["date"]]
+            closes = np.asarray(history["close"], dtype=float)
+
+            state = _SymbolIndicators()
+            if dates[-1] >= self._today():
+                # Today's bar is still forming
+                state.pending_price, state.pending_date = float(closes[-1]), dates[-1]
+                dates, closes = dates[:-1], closes[:-1]
+            state.indicators.load(closes)
+            state.last_bar_date = dates[-1] if dates else None
+
+            with self._lock:
+                self._states[symbol] = state
+            self.backfills += 1
+            return state
+
+    def on_quote(self, symbol: str, quote: Dict):
+        """Move the forming bar of an already backfilled symbol to a new quote"""
+        state = self._states.get(symbol)
+        if state is None or not quote or quote.get("current_price") is None:
+            return
+
+        day = self._trading_day(quote)
+        if day is None:
+            return
+
+        with self._lock:
+            if state.last_bar_date is not None and day <= state.last_bar_date:
+                return
+            if state.pending_date is not None and day > state.pending_date:
+                state.indicators.update(state.pending_price)
+                state.last_bar_date = state.pending_date
+            state.pending_price = float(quote["current_price"])
+            state.pending_date = day
+            self.quotes += 1
+
+    def on_quotes(self, quotes: Dict[str, Dict]):
+        for symbol, quote in quotes.items():
+            self.on_quote(symbol, quote)
+
+    def stats(self) -> Dict:
+        return {
+            "symbols": len(self._states),
+            "backfills": self.backfills,
+            "quotes": self.quotes,
+        }
+
+    def _trading_day(self, quote: Dict) -> Optional[date]:
+        """Day of the bar a quote belongs to, None outside business days"""
+        trading_day = quote.get("trading_day")
+        if trading_day:
+            return date.fromisoformat(str(trading_day)[:10])
+
+        timestamp = quote.get("timestamp") or datetime.now()
+        if isinstance(timestamp, str):
+            timestamp = datetime.fromisoformat(timestamp)
+        day = timestamp.date()
+        return day if np.is_busday(day) else None
+
+    def _symbol_lock(self, symbol: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks[symbol]
@@ -0,0 +1,58 @@
+import logging
+import threading
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicTask:
+    """Runs a function on a fixed interval in a daemon thread"""
+
+    def __init__(
+        self,
+        name: str,
+        interval: float,
+        func: Callable[[], None],
+        initial_delay: float = 0.0,
+    ):
+        self.name = name
+        self.interval = interval
+        self.func = func
+        self.initial_delay = initial_delay
+        self.run_count = 0
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "PeriodicTask":
+        """Start the background thread (no-op if already running)"""
+        if self._thread and self._thread.is_alive():
+            return self
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name=self.name)
+        self._thread.daemon = True
+        self._thread.start()
+        logger.info(f"Started periodic task {self.name} every {self.interval}s")
+        return self
+
+    def stop(self, timeout: Optional[float] = None):
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout)
+
+    def is_running(self) -> bool:
+        return bool(self._thread and self._thread.is_alive())
+
+    def _run(self):
+        if self._stop_event.wait(self.initial_delay):
+            return
+
+        while True:
+            try:
+                self.func()
+            except Exception as e:
+                logger.error(f"Error in periodic task {self.name}: {e}")
+            self.run_count += 1
+
+            if self._stop_event.wait(self.interval):
+                return
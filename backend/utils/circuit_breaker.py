@@ -0,0 +1,136 @@
+import logging
+import threading
+import time
+from typing import Dict, Optional
+
+from utils.config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    """Per-provider circuit breaker driven by call outcomes
+
+    After ``failure_threshold`` consecutive failures the breaker opens and
+    callers skip the provider for ``cooldown`` seconds. It then half-opens
+    and lets a single probe call through: success closes it, failure opens
+    it for another cooldown. A probe that never reports back is abandoned
+    after one cooldown so the breaker cannot get stuck half-open.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 3,
+        cooldown: float = 60.0,
+        clock=time.monotonic,
+    ):
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown = cooldown
+        self._clock = clock
+        self._lock = threading.Lock()
+
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self.probe_started_at: Optional[float] = None
+
+        self.successes = 0
+        self.failures = 0
+        self.rejected = 0
+        self.times_opened = 0
+
+    def allow(self) -> bool:
+        """Whether a call to the provider should be attempted now"""
+        with self._lock:
+            now = self._clock()
+
+            if self.state == self.CLOSED:
+                return True
+
+            if self.state == self.OPEN:
+                if now - self.opened_at < self.cooldown:
+                    self.rejected += 1
+                    return False
+                self.state = self.HALF_OPEN
+                self.probe_started_at = now
+                logger.info(f"Circuit {self.name} half-open, sending probe")
+                return True
+
+            # Half-open: one probe at a time
+            if now - self.probe_started_at < self.cooldown:
+                self.rejected += 1
+                return False
+            self.probe_started_at = now
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self.successes += 1
+            self.consecutive_failures = 0
+            if self.state != self.CLOSED:
+                logger.info(f"Circuit {self.name} closed")
+            self.state = self.CLOSED
+            self.opened_at = None
+            self.probe_started_at = None
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self.consecutive_failures += 1
+            if (
+                self.state == self.HALF_OPEN
+                or self.consecutive_failures >= self.failure_threshold
+            ):
+                if self.state != self.OPEN:
+                    self.times_opened += 1
+                    logger.warning(
+                        f"Circuit {self.name} opened after "
+                        f"{self.consecutive_failures} consecutive failures"
+                    )
+                self.state = self.OPEN
+                self.opened_at = self._clock()
+                self.probe_started_at = None
+
+    def stats(self) -> Dict:
+        with self._lock:
+            retry_in = 0.0
+            if self.state == self.OPEN:
+                retry_in = max(0.0, self.cooldown - (self._clock() - self.opened_at))
+            return {
+                "state": self.state,
+                "consecutive_failures": self.consecutive_failures,
+                "retry_in_seconds": round(retry_in, 1),
+                "successes": self.successes,
+                "failures": self.failures,
+                "rejected": self.rejected,
+                "times_opened": self.times_opened,
+            }
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(name: str) -> CircuitBreaker:
+    """Get the process-wide circuit breaker for a provider"""
+    with _breakers_lock:
+        if name not in _breakers:
+            _breakers[name] = CircuitBreaker(
+                name,
+                failure_threshold=Config.CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+                cooldown=Config.CIRCUIT_BREAKER_COOLDOWN,
+            )
+        return _breakers[name]
+
+
+def get_circuit_breaker_stats() -> Dict[str, Dict]:
+    """State of every circuit breaker created so far"""
+    with _breakers_lock:
+        breakers = dict(_breakers)
+    return {name: breaker.stats() for name, breaker in breakers.items()}
@@ -24,17 +24,130 @@ class Config:
     )
     OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
-    # API URLs
-    ALPHA_VANTAGE_BASE_URL = "https://www.alphavantage.co/query"
-    NEWS_API_BASE_URL = "https://newsapi.org/v2"
+    # API URLs (overridable, e.g. to point at a local stub server)
+    ALPHA_VANTAGE_BASE_URL = os.getenv(
+        "ALPHA_VANTAGE_BASE_URL", "https://www.alphavantage.co/query"
+    )
+    NEWS_API_BASE_URL = os.getenv("NEWS_API_BASE_URL", "https://newsapi.org/v2")
     TWITTER_API_BASE_URL = "https://api.twitter.com/2"
     POLYGON_BASE_URL = "https://api.polygon.io"
 
+    # RSS feeds for financial news (comma-separated override)
+    RSS_FEEDS = os.getenv(
+        "RSS_FEEDS",
+        "https://feeds.finance.yahoo.com/rss/2.0/headline,"
+        "https://www.marketwatch.com/rss/topstories,"
+        "https://feeds.bloomberg.com/markets/news.rss,"
+        "https://www.cnbc.com/id/100003114/device/rss/rss.html,"
+        "https://feeds.reuters.com/news/wealth",
+    ).split(",")
+    # Feeds are fetched concurrently: per-request timeout and overall deadline
+    RSS_FETCH_WORKERS = int(os.getenv("RSS_FETCH_WORKERS", 8))
+    RSS_FEED_TIMEOUT = float(os.getenv("RSS_FEED_TIMEOUT", 5))
+    RSS_FETCH_DEADLINE = float(os.getenv("RSS_FETCH_DEADLINE", 8))
+
+    # Cross-source article dedup: SimHash bits apart still counted as the
+    # same story, and articles remembered per symbol against re-storing
+    ARTICLE_DEDUP_DISTANCE = int(os.getenv("ARTICLE_DEDUP_DISTANCE", 3))
+    ARTICLE_DEDUP_SIZE = int(os.getenv("ARTICLE_DEDUP_SIZE", 2000))
+
+    # Shared HTTP client (connection pool per host, keep-alive, retries)
+    HTTP_POOL_CONNECTIONS = int(os.getenv("HTTP_POOL_CONNECTIONS", 10))
+    HTTP_POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", 10))
+    HTTP_MAX_RETRIES = int(os.getenv("HTTP_MAX_RETRIES", 2))
+    HTTP_BACKOFF_FACTOR = float(os.getenv("HTTP_BACKOFF_FACTOR", 0.3))
+    HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", 10))
+
     # Data Update Intervals (in seconds)
     STOCK_DATA_UPDATE_INTERVAL = int(os.getenv("STOCK_UPDATE_INTERVAL", 60))
     NEWS_UPDATE_INTERVAL = int(os.getenv("NEWS_UPDATE_INTERVAL", 300))
     SENTIMENT_UPDATE_INTERVAL = int(os.getenv("SENTIMENT_UPDATE_INTERVAL", 180))
 
+    # Symbols whose news is collected concurrently by the sentiment refresher
+    SENTIMENT_REFRESH_WORKERS = int(os.getenv("SENTIMENT_REFRESH_WORKERS", 8))
+
+    # Half-life (seconds) of an article's weight in the per-symbol sentiment
+    SENTIMENT_HALF_LIFE = float(os.getenv("SENTIMENT_HALF_LIFE", 21600))
+
+    # Memoized sentiment scores kept in memory (backed by SQLite)
+    SENTIMENT_MEMO_SIZE = int(os.getenv("SENTIMENT_MEMO_SIZE", 10000))
+
+    # Process pool for scoring large article batches (<= 1 disables it)
+    SENTIMENT_POOL_WORKERS = int(
+        os.getenv("SENTIMENT_POOL_WORKERS", min(4, os.cpu_count() or 1))
+    )
+    SENTIMENT_POOL_MIN_BATCH = int(os.getenv("SENTIMENT_POOL_MIN_BATCH", 64))
+    # Whitespace tokenizer instead of NLTK word_tokenize (same tokens, no punkt)
+    SENTIMENT_FAST_TOKENIZER = (
+        os.getenv("SENTIMENT_FAST_TOKENIZER", "False").lower() == "true"
+    )
+    # NLTK data is read from local nltk_data dirs (NLTK_DATA); download
+    # missing packages during warm-up only when enabled
+    NLTK_DOWNLOAD_MISSING = (
+        os.getenv("NLTK_DOWNLOAD_MISSING", "False").lower() == "true"
+    )
+
+    # Batch quote fetching
+    QUOTE_BATCH_SIZE = int(os.getenv("QUOTE_BATCH_SIZE", 50))
+    QUOTE_FETCH_WORKERS = int(os.getenv("QUOTE_FETCH_WORKERS", 4))
+    # Yahoo answers one ticker per request: parallel requests per batch
+    QUOTE_DOWNLOAD_THREADS = int(os.getenv("QUOTE_DOWNLOAD_THREADS", 8))
+
+    # Single-quote provider chain: overall budget and hedging to the fallback
+    YAHOO_TIMEOUT = float(os.getenv("YAHOO_TIMEOUT", 10))
+    QUOTE_LATENCY_BUDGET = float(os.getenv("QUOTE_LATENCY_BUDGET", 5.0))
+    QUOTE_HEDGE_PERCENTILE = float(os.getenv("QUOTE_HEDGE_PERCENTILE", 95))
+    QUOTE_HEDGE_DEFAULT_DELAY = float(os.getenv("QUOTE_HEDGE_DEFAULT_DELAY", 1.0))
+    # Threads per provider; hedge delays use latency from the last window
+    QUOTE_HEDGE_WORKERS = int(os.getenv("QUOTE_HEDGE_WORKERS", 8))
+    QUOTE_LATENCY_WINDOW = float(os.getenv("QUOTE_LATENCY_WINDOW", 300))
+
+    # Quote cache (entries live for one stock data update interval)
+    QUOTE_CACHE_TTL = int(os.getenv("QUOTE_CACHE_TTL", STOCK_DATA_UPDATE_INTERVAL))
+    QUOTE_CACHE_MAX_SIZE = int(os.getenv("QUOTE_CACHE_MAX_SIZE", 5000))
+
+    # Fundamentals (market cap, P/E) refresh schedule
+    FUNDAMENTALS_REFRESH_INTERVAL = int(
+        os.getenv("FUNDAMENTALS_REFRESH_INTERVAL", 3600)
+    )
+    FUNDAMENTALS_MAX_AGE = int(os.getenv("FUNDAMENTALS_MAX_AGE", 86400))
+
+    # Local daily bar store: how long the still-open day's bar is reused
+    BAR_STORE_TODAY_TTL = int(
+        os.getenv("BAR_STORE_TODAY_TTL", STOCK_DATA_UPDATE_INTERVAL)
+    )
+
+    # Market data provider: "yahoo" or "synthetic" (offline, for load testing)
+    MARKET_DATA_PROVIDER = os.getenv("MARKET_DATA_PROVIDER", "yahoo").lower()
+
+    # Synthetic market engine
+    SYNTHETIC_SEED = (
+        int(os.getenv("SYNTHETIC_SEED")) if os.getenv("SYNTHETIC_SEED") else None
+    )
+    SYNTHETIC_TICK_SECONDS = float(os.getenv("SYNTHETIC_TICK_SECONDS", 10))
+    SYNTHETIC_SYMBOL_COUNT = int(os.getenv("SYNTHETIC_SYMBOL_COUNT", 0))
+    SYNTHETIC_REPLAY_RATE = float(os.getenv("SYNTHETIC_REPLAY_RATE", 0))
+
+    # Market overview (index snapshot refreshed in the background)
+    MARKET_OVERVIEW_INDICES = os.getenv(
+        "MARKET_OVERVIEW_INDICES", "^GSPC,^DJI,^IXIC"
+    ).split(",")
+    MARKET_OVERVIEW_REFRESH_INTERVAL = int(
+        os.getenv("MARKET_OVERVIEW_REFRESH_INTERVAL", STOCK_DATA_UPDATE_INTERVAL)
+    )
+
+    # In-memory price history per symbol (ring buffer of recent samples)
+    PRICE_HISTORY_CAPACITY = int(os.getenv("PRICE_HISTORY_CAPACITY", 360))
+
+    # Technical indicators: days of daily history loaded per symbol
+    INDICATOR_BACKFILL_DAYS = int(os.getenv("INDICATOR_BACKFILL_DAYS", 180))
+
+    # Intraday bars built from polled quotes, aligned to the exchange's clock
+    MARKET_TIMEZONE = os.getenv("MARKET_TIMEZONE", "America/New_York")
+    INTRADAY_MAX_BARS = int(os.getenv("INTRADAY_MAX_BARS", 500))
+    INTRADAY_FLUSH_BATCH_SIZE = int(os.getenv("INTRADAY_FLUSH_BATCH_SIZE", 200))
+    INTRADAY_FLUSH_INTERVAL = int(os.getenv("INTRADAY_FLUSH_INTERVAL", 60))
+
     # Default Stock Symbols
     DEFAULT_STOCKS = os.getenv(
         "DEFAULT_STOCKS", "AAPL,GOOGL,MSFT,AMZN,TSLA,META,NVDA,NFLX"
@@ -51,8 +164,20 @@ class Config:
     )
     LOG_FILE = os.getenv("LOG_FILE", "logs/app.log")
 
-    # Rate Limiting
+    # Rate Limiting (token bucket per provider, shared across threads)
     MAX_REQUESTS_PER_MINUTE = 60
+    ALPHA_VANTAGE_REQUESTS_PER_MINUTE = int(
+        os.getenv("ALPHA_VANTAGE_REQUESTS_PER_MINUTE", 5)
+    )
+    NEWS_API_REQUESTS_PER_MINUTE = int(os.getenv("NEWS_API_REQUESTS_PER_MINUTE", 30))
+    # Longest a request-path caller waits for a token before giving up
+    RATE_LIMIT_MAX_WAIT = float(os.getenv("RATE_LIMIT_MAX_WAIT", 2.0))
+
+    # Circuit breakers: skip a provider after consecutive failures
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD = int(
+        os.getenv("CIRCUIT_BREAKER_FAILURE_THRESHOLD", 3)
+    )
+    CIRCUIT_BREAKER_COOLDOWN = float(os.getenv("CIRCUIT_BREAKER_COOLDOWN", 60))
 
     @staticmethod
     def get_api_key(service):
@@ -65,6 +190,15 @@ class Config:
         }
         return keys.get(service, None)
 
+    @staticmethod
+    def get_rate_limit(service):
+        """Get the requests-per-minute budget for a specific service"""
+        limits = {
+            "alpha_vantage": Config.ALPHA_VANTAGE_REQUESTS_PER_MINUTE,
+            "news_api": Config.NEWS_API_REQUESTS_PER_MINUTE,
+        }
+        return limits.get(service, Config.MAX_REQUESTS_PER_MINUTE)
+
     @staticmethod
     def validate_config():
         """Validate configuration settings"""
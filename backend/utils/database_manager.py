@@ -121,6 +121,69 @@ class DatabaseManager:
                 )
             """)
 
+            # Fundamentals table (slow-moving per-symbol values)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS fundamentals (
+                    symbol TEXT PRIMARY KEY,
+                    market_cap REAL,
+                    pe_ratio REAL,
+                    updated_at DATETIME NOT NULL
+                )
+            """)
+
+            # Daily OHLCV bars (local historical store)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS daily_bars (
+                    symbol TEXT NOT NULL,
+                    date TEXT NOT NULL,
+                    open REAL,
+                    high REAL,
+                    low REAL,
+                    close REAL,
+                    volume INTEGER,
+                    PRIMARY KEY (symbol, date)
+                ) WITHOUT ROWID
+            """)
+
+            # Date ranges already fetched into daily_bars
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS bar_coverage (
+                    symbol TEXT NOT NULL,
+                    start_date TEXT NOT NULL,
+                    end_date TEXT NOT NULL,
+                    PRIMARY KEY (symbol, start_date)
+                )
+            """)
+
+            # Memoized sentiment scores keyed by normalized text hash
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS sentiment_cache (
+                    text_hash TEXT PRIMARY KEY,
+                    compound REAL,
+                    positive REAL,
+                    negative REAL,
+                    neutral REAL,
+                    textblob_polarity REAL,
+                    created_at DATETIME NOT NULL
+                ) WITHOUT ROWID
+            """)
+
+            # Daily sentiment rollup, maintained on every sentiment_data insert
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS sentiment_daily (
+                    symbol TEXT NOT NULL,
+                    day DATE NOT NULL,
+                    count INTEGER NOT NULL,
+                    compound_sum REAL NOT NULL,
+                    compound_min REAL NOT NULL,
+                    compound_max REAL NOT NULL,
+                    positive_sum REAL NOT NULL,
+                    negative_sum REAL NOT NULL,
+                    neutral_sum REAL NOT NULL,
+                    PRIMARY KEY (symbol, day)
+                ) WITHOUT ROWID
+            """)
+
             # Create indexes for better performance
             cursor.execute(
                 "CREATE INDEX IF NOT EXISTS idx_stock_symbol_timestamp ON stock_data(symbol, timestamp)"
@@ -160,17 +223,27 @@ class DatabaseManager:
             )
             conn.commit()
 
-    def insert_sentiment_data(self, symbol, sentiment_data):
-        """Insert sentiment data into database"""
+    def insert_stock_data_batch(self, rows):
+        """Insert many stock data rows in one transaction
+
+        Rows are (symbol, timestamp, open, close, high, low, volume, change_percent).
+        """
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute(
+            cursor.executemany(
                 """
-                INSERT INTO sentiment_data (symbol, timestamp, source, content, 
-                                          sentiment_score, sentiment_label, compound_score,
-                                          positive_score, negative_score, neutral_score)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                INSERT INTO stock_data (symbol, timestamp, open_price, close_price, 
+                                      high_price, low_price, volume, change_percent)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
             """,
+                rows,
+            )
+            conn.commit()
+
+    def insert_sentiment_data(self, symbol, sentiment_data):
+        """Insert sentiment data into database"""
+        self.insert_sentiment_data_batch(
+            [
                 (
                     symbol,
                     sentiment_data["timestamp"],
@@ -182,7 +255,61 @@ class DatabaseManager:
                     sentiment_data["positive_score"],
                     sentiment_data["negative_score"],
                     sentiment_data["neutral_score"],
-                ),
+                )
+            ]
+        )
+
+    def insert_sentiment_data_batch(self, rows):
+        """Insert many sentiment rows and fold them into sentiment_daily
+
+        Rows are (symbol, timestamp, source, content, sentiment_score,
+        sentiment_label, compound, positive, negative, neutral); the rollup
+        day is the date part of the timestamp. Both writes share one
+        transaction.
+        """
+        rollup = {}
+        for row in rows:
+            symbol, timestamp = row[0], row[1]
+            compound, positive, negative, neutral = row[6:10]
+            key = (symbol, str(timestamp)[:10])
+            if key not in rollup:
+                rollup[key] = [0, 0.0, compound, compound, 0.0, 0.0, 0.0]
+            day = rollup[key]
+            day[0] += 1
+            day[1] += compound
+            day[2] = min(day[2], compound)
+            day[3] = max(day[3], compound)
+            day[4] += positive
+            day[5] += negative
+            day[6] += neutral
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(
+                """
+                INSERT INTO sentiment_data (symbol, timestamp, source, content, 
+                                          sentiment_score, sentiment_label, compound_score,
+                                          positive_score, negative_score, neutral_score)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+                rows,
+            )
+            cursor.executemany(
+                """
+                INSERT INTO sentiment_daily (symbol, day, count, compound_sum,
+                                           compound_min, compound_max, positive_sum,
+                                           negative_sum, neutral_sum)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (symbol, day) DO UPDATE SET
+                    count = count + excluded.count,
+                    compound_sum = compound_sum + excluded.compound_sum,
+                    compound_min = MIN(compound_min, excluded.compound_min),
+                    compound_max = MAX(compound_max, excluded.compound_max),
+                    positive_sum = positive_sum + excluded.positive_sum,
+                    negative_sum = negative_sum + excluded.negative_sum,
+                    neutral_sum = neutral_sum + excluded.neutral_sum
+            """,
+                [(*key, *day) for key, day in rollup.items()],
             )
             conn.commit()
 
@@ -234,17 +361,100 @@ class DatabaseManager:
 
             return pd.read_sql_query(query, conn, params=(symbol,))
 
+    def upsert_daily_bars(self, symbol, bars):
+        """Insert or replace daily bars (DataFrame with date/open/high/low/close/volume)"""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(
+                """
+                INSERT OR REPLACE INTO daily_bars (symbol, date, open, high, low, close, volume)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+                [
+                    (symbol, str(d), float(o), float(h), float(l), float(c), int(v))
+                    for d, o, h, l, c, v in bars.itertuples(index=False, name=None)
+                ],
+            )
+            conn.commit()
+
+    def get_daily_bars(self, symbol, start_date, end_date):
+        """Get daily bars for a symbol within an inclusive date range"""
+        with self.get_connection() as conn:
+            query = """
+                SELECT date, open, high, low, close, volume
+                FROM daily_bars
+                WHERE symbol = ? AND date BETWEEN ? AND ?
+                ORDER BY date
+            """
+            return pd.read_sql_query(query, conn, params=(symbol, start_date, end_date))
+
+    def get_bar_coverage(self, symbol):
+        """Get the date ranges already stored for a symbol"""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT start_date, end_date FROM bar_coverage
+                WHERE symbol = ?
+                ORDER BY start_date
+            """,
+                (symbol,),
+            )
+            return cursor.fetchall()
+
+    def replace_bar_coverage(self, symbol, ranges):
+        """Replace the stored date ranges for a symbol"""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM bar_coverage WHERE symbol = ?", (symbol,))
+            cursor.executemany(
+                "INSERT INTO bar_coverage (symbol, start_date, end_date) VALUES (?, ?, ?)",
+                [(symbol, start, end) for start, end in ranges],
+            )
+            conn.commit()
+
     def get_sentiment_history(self, symbol, days=7):
-        """Get sentiment history for a stock"""
+        """Get daily sentiment history for a stock (from the daily rollup)"""
         with self.get_connection() as conn:
             query = """
-                SELECT timestamp, compound_score, positive_score, negative_score, neutral_score
-                FROM sentiment_data 
-                WHERE symbol = ? AND timestamp >= datetime('now', '-{} days')
-                ORDER BY timestamp
-            """.format(days)
+                SELECT day AS timestamp,
+                       compound_sum / count AS compound_score,
+                       positive_sum / count AS positive_score,
+                       negative_sum / count AS negative_score,
+                       neutral_sum / count AS neutral_score
+                FROM sentiment_daily
+                WHERE symbol = ? AND day >= date('now', ?)
+                ORDER BY day
+            """
+            return pd.read_sql_query(query, conn, params=(symbol, f"-{days} days"))
 
-            return pd.read_sql_query(query, conn, params=(symbol,))
+    def get_sentiment_daily(self, symbol, days=7):
+        """Get per-day sentiment rollups for the last ``days`` days, oldest first"""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT day, count, compound_sum, compound_min, compound_max,
+                       positive_sum, negative_sum, neutral_sum
+                FROM sentiment_daily
+                WHERE symbol = ? AND day >= date('now', ?)
+                ORDER BY day
+            """,
+                (symbol, f"-{days} days"),
+            )
+            return [
+                {
+                    "date": row[0],
+                    "count": row[1],
+                    "compound_score": row[2] / row[1],
+                    "compound_min": row[3],
+                    "compound_max": row[4],
+                    "positive_score": row[5] / row[1],
+                    "negative_score": row[6] / row[1],
+                    "neutral_score": row[7] / row[1],
+                }
+                for row in cursor.fetchall()
+            ]
 
     def get_model_performance(self, model_name=None):
         """Get model performance metrics"""
@@ -339,6 +549,23 @@ class DatabaseManager:
             )
             conn.commit()
 
+    def insert_news_articles(self, rows):
+        """Insert many news articles in one transaction
+
+        Rows are (symbol, title, url, source, published_date, content, sentiment_score).
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(
+                """
+                INSERT INTO news_articles (symbol, title, url, source, published_date, 
+                                         content, sentiment_score)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+                rows,
+            )
+            conn.commit()
+
     def get_recent_news(self, symbol, limit=10):
         """Get recent news for a stock"""
         with self.get_connection() as conn:
@@ -370,12 +597,99 @@ class DatabaseManager:
                 WHERE timestamp < datetime('now', '-{} days')
             """.format(days))
 
+            # Daily sentiment rollups are kept for a year (long-range charts)
+            cursor.execute("""
+                DELETE FROM sentiment_daily
+                WHERE day < date('now', '-{} days')
+            """.format(max(days, 366)))
+
             # Clean up old predictions
             cursor.execute("""
                 DELETE FROM predictions 
                 WHERE timestamp < datetime('now', '-{} days')
             """.format(days))
 
+            # Clean up old memoized sentiment scores
+            cursor.execute("""
+                DELETE FROM sentiment_cache
+                WHERE created_at < datetime('now', '-{} days')
+            """.format(days))
+
+            conn.commit()
+
+    def upsert_fundamentals(self, rows):
+        """Insert or replace fundamentals for several symbols"""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(
+                """
+                INSERT OR REPLACE INTO fundamentals (symbol, market_cap, pe_ratio, updated_at)
+                VALUES (?, ?, ?, ?)
+            """,
+                [
+                    (
+                        row["symbol"],
+                        row["market_cap"],
+                        row["pe_ratio"],
+                        row["updated_at"],
+                    )
+                    for row in rows
+                ],
+            )
+            conn.commit()
+
+    def get_fundamentals(self):
+        """Get persisted fundamentals for all symbols"""
+        with self.get_connection() as conn:
+            query = """
+                SELECT symbol, market_cap, pe_ratio, updated_at
+                FROM fundamentals
+            """
+            return pd.read_sql_query(query, conn).to_dict("records")
+
+    def get_sentiment_cache(self, text_hashes):
+        """Get memoized sentiment scores for the given text hashes"""
+        if not text_hashes:
+            return {}
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            placeholders = ",".join("?" * len(text_hashes))
+            cursor.execute(
+                f"""
+                SELECT text_hash, compound, positive, negative, neutral, textblob_polarity
+                FROM sentiment_cache
+                WHERE text_hash IN ({placeholders})
+            """,
+                list(text_hashes),
+            )
+            return {
+                row[0]: {
+                    "compound": row[1],
+                    "positive": row[2],
+                    "negative": row[3],
+                    "neutral": row[4],
+                    "textblob_polarity": row[5],
+                }
+                for row in cursor.fetchall()
+            }
+
+    def upsert_sentiment_cache(self, rows):
+        """Insert or replace memoized sentiment scores
+
+        Rows are (text_hash, compound, positive, negative, neutral,
+        textblob_polarity, created_at).
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(
+                """
+                INSERT OR REPLACE INTO sentiment_cache (text_hash, compound, positive,
+                                                      negative, neutral, textblob_polarity,
+                                                      created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+                rows,
+            )
             conn.commit()
 
     def get_database_stats(self):
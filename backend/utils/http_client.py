@@ -0,0 +1,88 @@
+import threading
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from utils.config import Config
+
+# 429 is deliberately not retried: it means our own budget is spent
+RETRY_STATUSES = (500, 502, 503, 504)
+
+
+class HttpClient:
+    """Shared HTTP client with pooled keep-alive connections and retries
+
+    One ``requests.Session`` holds a connection pool per host, so repeated
+    calls to the same API reuse an open TCP/TLS connection instead of
+    paying a new handshake every time. Idempotent requests that fail with a
+    connection error or a 5xx response are retried with exponential backoff.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        max_retries: int = 2,
+        backoff_factor: float = 0.3,
+        timeout: float = 10,
+    ):
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = "realtime-ml-stock-dashboard"
+
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=frozenset(["GET", "HEAD"]),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=retry,
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self.request_count = 0
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict] = None,
+        timeout: Optional[float] = None,
+    ) -> requests.Response:
+        with self._lock:
+            self.request_count += 1
+        return self.session.get(
+            url,
+            params=params,
+            headers=headers,
+            timeout=timeout if timeout is not None else self.timeout,
+        )
+
+    def close(self):
+        self.session.close()
+
+
+_client: Optional[HttpClient] = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """Get the process-wide HTTP client configured from Config"""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = HttpClient(
+                pool_connections=Config.HTTP_POOL_CONNECTIONS,
+                pool_maxsize=Config.HTTP_POOL_MAXSIZE,
+                max_retries=Config.HTTP_MAX_RETRIES,
+                backoff_factor=Config.HTTP_BACKOFF_FACTOR,
+                timeout=Config.HTTP_TIMEOUT,
+            )
+        return _client
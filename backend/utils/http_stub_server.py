@@ -0,0 +1,110 @@
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Tuple, Union
+from urllib.parse import parse_qs, urlsplit
+
+# A route answers with (status, headers, body) or computes it from the request
+Response = Tuple[int, Dict[str, str], Union[bytes, str]]
+Route = Union[Response, Callable[["StubRequest"], Response]]
+
+
+class StubRequest:
+    """A request received by the stub server"""
+
+    def __init__(self, method: str, path: str, headers: Dict[str, str]):
+        parts = urlsplit(path)
+        self.method = method
+        self.path = parts.path
+        self.query = {k: v[0] for k, v in parse_qs(parts.query).items()}
+        self.headers = headers
+
+
+class StubHTTPServer:
+    """Local HTTP/1.1 keep-alive server with canned responses
+
+    Test double for the provider APIs: point a base URL (e.g.
+    ``ALPHA_VANTAGE_BASE_URL``) at ``server.url`` and register routes by
+    path. Every request is recorded, and ``connections`` counts accepted
+    TCP connections so connection reuse can be checked.
+
+        with StubHTTPServer({"/query": (200, {}, '{"Global Quote": {}}')}) as server:
+            client.get(server.url + "/query")
+    """
+
+    def __init__(self, routes: Dict[str, Route] = None, latency: float = 0.0):
+        self.routes = dict(routes or {})
+        self.latency = latency
+        self.requests = []
+        self.connections = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StubHTTPServer":
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="stub-http-server"
+        )
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "StubHTTPServer":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _handler_class(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                # Headers and body go out in separate writes; avoid Nagle delays
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                with stub._lock:
+                    stub.connections += 1
+
+            def do_GET(self):
+                request = StubRequest("GET", self.path, dict(self.headers))
+                with stub._lock:
+                    stub.requests.append(request)
+
+                route = stub.routes.get(request.path)
+                if route is None:
+                    status, headers, body = 404, {}, b"not found"
+                elif callable(route):
+                    status, headers, body = route(request)
+                else:
+                    status, headers, body = route
+
+                if stub.latency:
+                    threading.Event().wait(stub.latency)
+
+                if isinstance(body, str):
+                    body = body.encode("utf-8")
+
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
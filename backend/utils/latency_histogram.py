@@ -0,0 +1,125 @@
+import bisect
+import threading
+import time
+from typing import Dict, List, Optional
+
+
+def _bucket_bounds(low: float = 0.001, high: float = 120.0, growth: float = 1.15):
+    bounds = []
+    value = low
+    while value < high:
+        bounds.append(value)
+        value *= growth
+    bounds.append(high)
+    return bounds
+
+
+class _Generation:
+    """Bucket counts for the samples recorded in one window"""
+
+    def __init__(self, buckets: int):
+        self.counts = [0] * buckets
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+
+class LatencyHistogram:
+    """Thread-safe log-bucketed latency histogram (seconds)
+
+    Buckets grow geometrically by 15%, so percentiles are accurate to within
+    one bucket width while memory stays constant however many samples are
+    recorded. With ``window`` set only recent samples count: they are kept
+    in two generations that rotate every ``window`` seconds, so statistics
+    always cover between one and two windows of history.
+    """
+
+    def __init__(
+        self,
+        bounds: List[float] = None,
+        window: Optional[float] = None,
+        clock=time.monotonic,
+    ):
+        self.bounds = bounds or _bucket_bounds()
+        self.window = window
+        self._clock = clock
+        self._current = _Generation(len(self.bounds) + 1)
+        self._previous = _Generation(len(self.bounds) + 1)
+        self._rotated_at = clock()
+        self._lock = threading.Lock()
+
+    @property
+    def count(self) -> int:
+        with self._lock:
+            self._rotate()
+            return self._current.count + self._previous.count
+
+    @property
+    def max(self) -> float:
+        with self._lock:
+            self._rotate()
+            return max(self._current.max, self._previous.max)
+
+    def record(self, seconds: float):
+        index = bisect.bisect_left(self.bounds, seconds)
+        with self._lock:
+            self._rotate()
+            current = self._current
+            current.counts[index] += 1
+            current.count += 1
+            current.total += seconds
+            current.max = max(current.max, seconds)
+
+    def percentile(self, p: float) -> float:
+        """Upper bound of the bucket containing the p-th percentile"""
+        with self._lock:
+            self._rotate()
+            return self._percentile(p)
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            self._rotate()
+            count = self._current.count + self._previous.count
+            total = self._current.total + self._previous.total
+            return {
+                "count": count,
+                "window_seconds": self.window,
+                "mean": round(total / count, 4) if count else 0.0,
+                "p50": round(self._percentile(50), 4),
+                "p90": round(self._percentile(90), 4),
+                "p95": round(self._percentile(95), 4),
+                "p99": round(self._percentile(99), 4),
+                "max": round(max(self._current.max, self._previous.max), 4),
+            }
+
+    def _percentile(self, p: float) -> float:
+        current, previous = self._current, self._previous
+        count = current.count + previous.count
+        if count == 0:
+            return 0.0
+        highest = max(current.max, previous.max)
+        target = max(1, round(count * p / 100.0))
+        seen = 0
+        for index, bucket_count in enumerate(current.counts):
+            seen += bucket_count + previous.counts[index]
+            if seen >= target:
+                if index < len(self.bounds):
+                    return min(self.bounds[index], highest)
+                return highest
+        return highest
+
+    def _rotate(self):
+        if self.window is None:
+            return
+        now = self._clock()
+        elapsed = now - self._rotated_at
+        if elapsed < self.window:
+            return
+        buckets = len(self.bounds) + 1
+        if elapsed < 2 * self.window:
+            self._previous = self._current
+        else:
+            # After two quiet windows nothing recorded is recent any more
+            self._previous = _Generation(buckets)
+        self._current = _Generation(buckets)
+        self._rotated_at = now
@@ -0,0 +1,97 @@
+import logging
+import threading
+from typing import Dict, Iterable, List, Optional
+
+from utils.config import Config
+
+logger = logging.getLogger(__name__)
+
+# NLTK data packages used by sentiment scoring and where nltk.data.find looks
+# for them (word_tokenize needs punkt_tab on NLTK >= 3.8.2, punkt before)
+NLTK_RESOURCES = {
+    "punkt": "tokenizers/punkt",
+    "punkt_tab": "tokenizers/punkt_tab",
+    "stopwords": "corpora/stopwords",
+    "wordnet": "corpora/wordnet",
+}
+
+
+class NltkResources:
+    """Offline-first lookup of NLTK data packages
+
+    Availability is checked in the local nltk_data directories (including
+    zipped packages) and cached. Nothing is downloaded on import or on first
+    use: missing packages are only fetched by ``ensure``, and only when
+    ``download`` is set.
+    """
+
+    def __init__(self, download: bool = False):
+        self.download = download
+        self._available: Dict[str, bool] = {}
+        self._lock = threading.Lock()
+
+    def available(self, name: str) -> bool:
+        """Whether a package is installed locally (never downloads)"""
+        with self._lock:
+            if name not in self._available:
+                self._available[name] = self._find(name)
+            return self._available[name]
+
+    def ensure(self, names: Iterable[str] = NLTK_RESOURCES) -> Dict[str, bool]:
+        """Check packages, downloading missing ones if allowed"""
+        status = {}
+        for name in names:
+            found = self.available(name)
+            if not found and self.download:
+                found = self._download(name)
+                with self._lock:
+                    self._available[name] = found
+            status[name] = found
+
+        missing = [name for name, found in status.items() if not found]
+        if missing:
+            logger.warning(f"NLTK data not installed: {', '.join(missing)}")
+        return status
+
+    def missing(self, names: Iterable[str] = NLTK_RESOURCES) -> List[str]:
+        return [name for name in names if not self.available(name)]
+
+    def stats(self) -> Dict:
+        with self._lock:
+            checked = dict(self._available)
+        return {"download": self.download, "available": checked}
+
+    def _find(self, name: str) -> bool:
+        import nltk.data
+
+        path = NLTK_RESOURCES.get(name, name)
+        for candidate in (path, f"{path}.zip"):
+            try:
+                nltk.data.find(candidate)
+                return True
+            except LookupError:
+                continue
+        return False
+
+    def _download(self, name: str) -> bool:
+        import nltk
+
+        try:
+            if nltk.download(name, quiet=True, raise_on_error=True):
+                return self._find(name)
+        except Exception as e:
+            logger.warning(f"Could not download NLTK data {name}: {e}")
+        return False
+
+
+_resources: Optional[NltkResources] = None
+_resources_lock = threading.Lock()
+
+
+def get_nltk_resources() -> NltkResources:
+    """Get the process-wide NLTK resource manager, configured from Config"""
+    global _resources
+    with _resources_lock:
+        if _resources is None:
+            _resources = NltkResources(download=Config.NLTK_DOWNLOAD_MISSING)
+        return _resources
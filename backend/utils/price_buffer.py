@@ -0,0 +1,132 @@
+import threading
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+Window = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+class PriceRingBuffer:
+    """Fixed-capacity ring of (timestamp, price, volume) samples for one symbol
+
+    Samples live in preallocated NumPy arrays: epoch milliseconds as int64,
+    price as float64 and volume as int64, 24 bytes per sample per copy.
+    Every sample is written twice, at ``i`` and ``i + capacity``, so the
+    most recent ``n`` samples are always one contiguous slice and
+    ``window`` can return read-only views without copying or wrapping.
+
+    Views share memory with the buffer: a slot is overwritten once
+    ``capacity`` newer samples have been appended, so copy a window that
+    has to outlive the next few appends.
+    """
+
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._timestamps = np.zeros(2 * capacity, dtype=np.int64)
+        self._prices = np.zeros(2 * capacity, dtype=np.float64)
+        self._volumes = np.zeros(2 * capacity, dtype=np.int64)
+        self._count = 0
+
+    def __len__(self) -> int:
+        return min(self._count, self.capacity)
+
+    @property
+    def last_timestamp(self) -> Optional[int]:
+        if not self._count:
+            return None
+        return int(self._timestamps[(self._count - 1) % self.capacity])
+
+    def append(self, timestamp_ms: int, price: float, volume: int):
+        """Add one sample in O(1), overwriting the oldest when full"""
+        i = self._count % self.capacity
+        j = i + self.capacity
+        self._timestamps[i] = self._timestamps[j] = timestamp_ms
+        self._prices[i] = self._prices[j] = price
+        self._volumes[i] = self._volumes[j] = volume
+        self._count += 1
+
+    def window(self, n: Optional[int] = None) -> Window:
+        """Views of the last ``n`` samples (all held samples by default), oldest first"""
+        size = len(self)
+        n = size if n is None else max(0, min(n, size))
+        end = (self._count - 1) % self.capacity + self.capacity + 1 if size else 0
+        views = (
+            self._timestamps[end - n : end],
+            self._prices[end - n : end],
+            self._volumes[end - n : end],
+        )
+        for view in views:
+            view.flags.writeable = False
+        return views
+
+    @property
+    def nbytes(self) -> int:
+        return self._timestamps.nbytes + self._prices.nbytes + self._volumes.nbytes
+
+
+class PriceHistory:
+    """Recent price history for many symbols, one ring buffer each
+
+    Quotes are appended as they are fetched; samples that do not advance a
+    symbol's timestamp (e.g. the same cached quote seen twice) are skipped.
+    """
+
+    def __init__(self, capacity: int = 360):
+        self.capacity = capacity
+        self._buffers: Dict[str, PriceRingBuffer] = {}
+        self._lock = threading.Lock()
+
+    def append(self, symbol: str, timestamp, price: float, volume: int = 0) -> bool:
+        """Append a sample; returns False if it is not newer than the last one"""
+        if isinstance(timestamp, datetime):
+            timestamp = int(timestamp.timestamp() * 1000)
+
+        with self._lock:
+            buffer = self._buffers.get(symbol)
+            if buffer is None:
+                buffer = self._buffers[symbol] = PriceRingBuffer(self.capacity)
+            elif (
+                buffer.last_timestamp is not None and timestamp <= buffer.last_timestamp
+            ):
+                return False
+            buffer.append(timestamp, price, volume)
+            return True
+
+    def append_quote(self, symbol: str, quote: Dict) -> bool:
+        if not quote or quote.get("current_price") is None:
+            return False
+        return self.append(
+            symbol,
+            quote.get("timestamp") or datetime.now(),
+            float(quote["current_price"]),
+            int(quote.get("volume") or 0),
+        )
+
+    def append_quotes(self, quotes: Dict[str, Dict]):
+        for symbol, quote in quotes.items():
+            self.append_quote(symbol, quote)
+
+    def window(self, symbol: str, n: Optional[int] = None) -> Optional[Window]:
+        """Zero-copy (timestamps_ms, prices, volumes) views, or None if unknown"""
+        with self._lock:
+            buffer = self._buffers.get(symbol)
+            return buffer.window(n) if buffer is not None else None
+
+    def prices(self, symbol: str, n: Optional[int] = None) -> np.ndarray:
+        window = self.window(symbol, n)
+        return window[1] if window is not None else np.empty(0)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._buffers
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "symbols": len(self._buffers),
+                "capacity": self.capacity,
+                "samples": sum(len(b) for b in self._buffers.values()),
+                "bytes": sum(b.nbytes for b in self._buffers.values()),
+            }
@@ -0,0 +1,156 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, List
+
+
+class _Flight:
+    """An upstream load in progress that other callers can wait on"""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class QuoteCache:
+    """Thread-safe TTL cache with LRU eviction and single-flight loading
+
+    Concurrent misses for the same key are collapsed: the first caller loads
+    the value and every other caller waits for that result instead of issuing
+    its own upstream request.
+    """
+
+    def __init__(self, ttl: float, max_size: int = 1000, clock=time.monotonic):
+        self.ttl = ttl
+        self.max_size = max(1, max_size)
+        self._clock = clock
+        self._entries = OrderedDict()  # key -> (expires_at, value)
+        self._flights = {}
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default=None):
+        """Return a fresh cached value without loading"""
+        with self._lock:
+            entry = self._lookup(key)
+            if entry is None:
+                return default
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any):
+        """Store a value and evict the least recently used entries"""
+        with self._lock:
+            self._store(key, value)
+
+    def invalidate(self, key: Hashable):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def get_or_load(self, key: Hashable, loader: Callable[[Hashable], Any]):
+        """Return the cached value for key, loading it once on a miss"""
+        values = self.get_or_load_many([key], lambda keys: {keys[0]: loader(keys[0])})
+        return values[key]
+
+    def get_or_load_many(
+        self,
+        keys: Iterable[Hashable],
+        loader: Callable[[List[Hashable]], Dict[Hashable, Any]],
+    ) -> Dict[Hashable, Any]:
+        """Return values for all keys, loading only the missing ones
+
+        ``loader`` receives the keys this caller is responsible for and must
+        return a dict with a value for each of them. Keys already being loaded
+        by another thread are waited on rather than loaded again.
+        """
+        results = {}
+        owned = []
+        waiting = {}
+
+        with self._lock:
+            for key in dict.fromkeys(keys):
+                entry = self._lookup(key)
+                if entry is not None:
+                    self.hits += 1
+                    results[key] = entry[1]
+                elif key in self._flights:
+                    self.coalesced += 1
+                    waiting[key] = self._flights[key]
+                else:
+                    self.misses += 1
+                    self._flights[key] = _Flight()
+                    owned.append(key)
+
+        if owned:
+            try:
+                loaded = loader(owned)
+            except Exception as e:
+                self._finish(owned, {}, e)
+                raise
+            self._finish(owned, loaded, None)
+
+            for key in owned:
+                if key not in loaded:
+                    raise KeyError(key)
+                results[key] = loaded[key]
+
+        for key, flight in waiting.items():
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            results[key] = flight.value
+
+        return results
+
+    def stats(self) -> Dict:
+        """Cache counters for monitoring"""
+        with self._lock:
+            lookups = self.hits + self.misses + self.coalesced
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "evictions": self.evictions,
+                "hit_rate": (
+                    round((self.hits + self.coalesced) / lookups, 3) if lookups else 0.0
+                ),
+            }
+
+    def _finish(self, keys, loaded, error):
+        with self._lock:
+            for key in keys:
+                flight = self._flights.pop(key)
+                if error is None and key in loaded:
+                    self._store(key, loaded[key])
+                    flight.value = loaded[key]
+                else:
+                    flight.error = error or KeyError(key)
+                flight.event.set()
+
+    def _lookup(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= self._clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _store(self, key, value):
+        self._entries[key] = (self._clock() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
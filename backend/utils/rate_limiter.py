@@ -0,0 +1,101 @@
+import threading
+import time
+from typing import Dict, Optional
+
+from utils.config import Config
+
+
+class TokenBucket:
+    """Thread-safe token bucket rate limiter
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``.
+    A caller that finds the bucket empty reserves its token and sleeps until
+    it becomes available, provided that happens before its deadline;
+    otherwise it is refused immediately without consuming anything.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        rate: float,
+        capacity: float,
+        clock=time.monotonic,
+        sleep=time.sleep,
+    ):
+        self.name = name
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+        self.acquired = 0
+        self.throttled = 0
+        self.waited = 0
+        self.waited_seconds = 0.0
+
+    def acquire(self, tokens: float = 1, timeout: Optional[float] = 0.0) -> bool:
+        """Take tokens, waiting at most ``timeout`` seconds
+
+        ``timeout=0`` fails fast, ``timeout=None`` waits as long as needed.
+        Returns False if the tokens cannot be had within the deadline.
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+
+            wait = max(0.0, (tokens - self._tokens) / self.rate)
+            if timeout is not None and wait > timeout:
+                self.throttled += 1
+                return False
+
+            self._tokens -= tokens
+            self.acquired += 1
+            if wait > 0:
+                self.waited += 1
+                self.waited_seconds += wait
+
+        if wait > 0:
+            self._sleep(wait)
+        return True
+
+    def stats(self) -> Dict:
+        with self._lock:
+            elapsed = self._clock() - self._updated
+            available = min(self.capacity, self._tokens + elapsed * self.rate)
+            return {
+                "requests_per_minute": round(self.rate * 60, 3),
+                "capacity": self.capacity,
+                "available_tokens": round(available, 3),
+                "acquired": self.acquired,
+                "throttled": self.throttled,
+                "waited": self.waited,
+                "waited_seconds": round(self.waited_seconds, 3),
+            }
+
+
+_limiters: Dict[str, TokenBucket] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(service: str) -> TokenBucket:
+    """Get the process-wide limiter for a provider, sized from Config"""
+    with _limiters_lock:
+        if service not in _limiters:
+            per_minute = Config.get_rate_limit(service)
+            _limiters[service] = TokenBucket(
+                service, rate=per_minute / 60.0, capacity=max(1, per_minute)
+            )
+        return _limiters[service]
+
+
+def get_rate_limiter_stats() -> Dict[str, Dict]:
+    """Metrics for every limiter created so far"""
+    with _limiters_lock:
+        limiters = dict(_limiters)
+    return {name: limiter.stats() for name, limiter in limiters.items()}
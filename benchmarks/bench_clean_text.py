@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Benchmark SentimentScorer.clean_text per article: the original pipeline
+(re.sub with pattern strings, word_tokenize, uncached lemmatizer) against
+the precompiled/lemma-cached pipeline with word_tokenize and with the fast
+tokenizer. Articles are the fixture feed plus generated headlines.
+
+Stages that need NLTK data (punkt for word_tokenize, wordnet for the
+lemmatizer) are skipped when the data is not installed; the tokenizers are
+then compared with NLTK's Treebank tokenizer, which word_tokenize applies
+to each sentence.
+
+Usage: python benchmarks/bench_clean_text.py [--articles 5000] [--repeat 3]
+"""
+
+import argparse
+import logging
+import os
+import re
+import sys
+import time
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "backend"))
+
+from bench_sentiment_pool import make_articles
+from data_collectors.feed_cache import parse_feed
+from data_collectors.sentiment_scorer import (
+    HTML_TAG_RE,
+    NON_ALPHA_RE,
+    URL_RE,
+    SentimentScorer,
+    fast_tokenize,
+)
+from nltk.stem import WordNetLemmatizer
+from nltk.tokenize import NLTKWordTokenizer, word_tokenize
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "market_news.xml")
+
+
+def legacy_strip(text):
+    """Regex stage of the original clean_text (patterns compiled per call)"""
+    text = re.sub(r"<[^>]+>", "", text)
+    text = re.sub(
+        r"http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+",
+        "",
+        text,
+    )
+    text = re.sub(r"[^a-zA-Z\s]", "", text)
+    return text.lower()
+
+
+def compiled_strip(text):
+    return NON_ALPHA_RE.sub("", URL_RE.sub("", HTML_TAG_RE.sub("", text))).lower()
+
+
+def legacy_clean_text(text, lemmatizer, stop_words):
+    """clean_text as it was before precompiled patterns and the lemma cache"""
+    tokens = word_tokenize(legacy_strip(text))
+    tokens = [
+        lemmatizer.lemmatize(token)
+        for token in tokens
+        if token not in stop_words and len(token) > 2
+    ]
+    return " ".join(tokens)
+
+
+def available(func):
+    try:
+        func()
+        return True
+    except LookupError:
+        return False
+
+
+def per_article_us(func, articles, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in articles:
+            func(text)
+        best = min(best, time.perf_counter() - start)
+    return best / len(articles) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--articles", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    # Missing NLTK data would otherwise log one error per article
+    logging.disable(logging.ERROR)
+
+    with open(FIXTURE, "rb") as f:
+        feed = parse_feed(FIXTURE, f.read())
+    fixture = [f"{e['title']} <p>{e['description']}</p>" for e in feed.entries]
+    articles = fixture + make_articles(args.articles - len(fixture))
+
+    has_punkt = available(lambda: word_tokenize("Stocks rose."))
+    has_wordnet = available(lambda: WordNetLemmatizer().lemmatize("stocks"))
+    print(f"{len(articles)} articles; punkt={has_punkt} wordnet={has_wordnet}")
+
+    stripped = [compiled_strip(text) for text in articles]
+    treebank = NLTKWordTokenizer().tokenize
+    same = sum(fast_tokenize(text) == treebank(text) for text in stripped)
+    print(f"fast tokens == Treebank tokens: {same}/{len(stripped)}")
+
+    print("\nstage                          us/article")
+    rows = [
+        ("regex, pattern strings", legacy_strip, articles),
+        ("regex, precompiled", compiled_strip, articles),
+        ("tokenize, Treebank", treebank, stripped),
+        ("tokenize, fast", fast_tokenize, stripped),
+    ]
+    if has_punkt:
+        rows.insert(2, ("tokenize, word_tokenize", word_tokenize, stripped))
+    if has_wordnet:
+        tokens = [token for text in stripped for token in fast_tokenize(text)]
+        lemmatizer = WordNetLemmatizer()
+        warm = SentimentScorer()
+        warm.warm_up()
+        cached = warm._lemmatize
+        scale = len(tokens) / len(stripped)
+        rows.append(
+            ("lemmatize, uncached", lambda t: lemmatizer.lemmatize(t), tokens, scale)
+        )
+        rows.append(("lemmatize, lru_cache", cached, tokens, scale))
+    for name, func, data, *scale in rows:
+        cost = per_article_us(func, data, args.repeat) * (scale[0] if scale else 1)
+        print(f"{name:30s} {cost:10.2f}")
+
+    scorer = SentimentScorer()
+    fast_scorer = SentimentScorer(fast_tokenizer=True)
+    scorer.warm_up()
+    fast_scorer.warm_up()
+    lemmatizer = WordNetLemmatizer()
+
+    print("\nclean_text                     us/article")
+    for name, func in [
+        ("original", lambda t: legacy_clean_text(t, lemmatizer, scorer.stop_words)),
+        ("precompiled + lemma cache", scorer.clean_text),
+        ("  + fast tokenizer", fast_scorer.clean_text),
+    ]:
+        if name == "original" and not (has_punkt and has_wordnet):
+            print(f"{name:30s} {'n/a (NLTK data missing)':>10s}")
+            continue
+        print(f"{name:30s} {per_article_us(func, articles, args.repeat):10.2f}")
+
+    if has_punkt and has_wordnet:
+        same = sum(
+            legacy_clean_text(t, lemmatizer, scorer.stop_words)
+            == scorer.clean_text(t)
+            == fast_scorer.clean_text(t)
+            for t in articles
+        )
+        print(f"identical output: {same}/{len(articles)}")
+    else:
+        print(f"(NLTK data missing; scorer runs with {scorer.stats()})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Benchmark RSS news collection for the default symbols against a local stub
+server serving fixture feeds with ETag/Last-Modified support: the previous
+per-symbol feedparser.parse(url) downloads versus the shared FeedCache, both
+within one update interval and revalidating on every read (304 responses).
+
+Usage: python benchmarks/bench_feed_cache.py [--passes 3] [--latency 0.02]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import feedparser
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "backend"))
+
+from data_collectors.news_sentiment_collector import NewsSentimentCollector
+from utils.config import Config
+from utils.http_client import HttpClient
+from utils.http_stub_server import StubHTTPServer
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "market_news.xml")
+ETAG = '"market-news-1"'
+LAST_MODIFIED = "Fri, 16 Oct 2026 13:00:00 GMT"
+
+
+def feed_route(body):
+    def route(request):
+        if request.headers.get("If-None-Match") == ETAG:
+            return 304, {"ETag": ETAG}, b""
+        headers = {
+            "Content-Type": "application/rss+xml",
+            "ETag": ETAG,
+            "Last-Modified": LAST_MODIFIED,
+        }
+        return 200, headers, body
+
+    return route
+
+
+def legacy_rss_news(feed_urls, keywords):
+    """Previous _get_rss_news: download and parse every feed for the symbol"""
+    articles = []
+    for feed_url in feed_urls:
+        feed = feedparser.parse(feed_url)
+        for entry in feed.entries[:5]:
+            content = (entry.get("title", "") + " " + entry.get("summary", "")).lower()
+            if any(keyword.lower() in content for keyword in keywords):
+                articles.append(entry.get("link", ""))
+    return articles
+
+
+def run(label, server, func, symbols, passes):
+    requests_before = len(server.requests)
+    start = time.perf_counter()
+    found = 0
+    for _ in range(passes):
+        for symbol in symbols:
+            found += len(func(symbol))
+    elapsed = time.perf_counter() - start
+    print(
+        f"{label:28s} {elapsed * 1000:8.1f} ms  "
+        f"{len(server.requests) - requests_before:4d} requests  {found} articles"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--passes", type=int, default=3)
+    parser.add_argument("--latency", type=float, default=0.02)
+    args = parser.parse_args()
+
+    with open(FIXTURE, "rb") as f:
+        body = f.read()
+
+    routes = {"/feed1.xml": feed_route(body), "/feed2.xml": feed_route(body)}
+    symbols = Config.DEFAULT_STOCKS
+
+    with StubHTTPServer(routes, latency=args.latency) as server:
+        feed_urls = [server.url + path for path in routes]
+        collector = NewsSentimentCollector(http_client=HttpClient())
+        collector.rss_feeds = feed_urls
+
+        print(f"{len(symbols)} symbols x {args.passes} passes, 2 feeds")
+        run(
+            "feedparser per symbol",
+            server,
+            lambda s: legacy_rss_news(feed_urls, collector.stock_keywords.get(s, [s])),
+            symbols,
+            args.passes,
+        )
+
+        run("FeedCache", server, collector._get_rss_news, symbols, args.passes)
+
+        collector.feed_cache.max_age = 0
+        run(
+            "FeedCache revalidating",
+            server,
+            collector._get_rss_news,
+            symbols,
+            args.passes,
+        )
+        print(f"Feed cache: {collector.get_feed_cache_stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Benchmark the quote path with fundamentals fetched per quote (previous
+behaviour: history + ticker.info on every call) against the cached
+fundamentals path. Runs offline against a stubbed provider.
+
+Usage: python benchmarks/bench_fundamentals.py [--quotes 20]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "backend"))
+
+from data_collectors.quote_providers import QuoteProvider
+from data_collectors.stock_data_collector import StockDataCollector
+
+
+class StubProvider(QuoteProvider):
+    """Mimics Yahoo: a light history call and a slow, heavy info call"""
+
+    name = "stub"
+
+    def __init__(self, history_latency=0.05, info_latency=0.4, info_fields=150):
+        self.history_latency = history_latency
+        self.info_latency = info_latency
+        self.info = {f"field_{i}": "x" * 40 for i in range(info_fields)}
+        self.info.update({"marketCap": 2.5e12, "trailingPE": 28.4})
+        self.bytes_sent = 0
+
+    def fetch_quotes(self, symbols):
+        time.sleep(self.history_latency)
+        quotes = {
+            symbol: {
+                "symbol": symbol,
+                "current_price": 190.0,
+                "open_price": 188.0,
+                "high_price": 191.0,
+                "low_price": 187.5,
+                "volume": 52000000,
+                "change": 1.2,
+                "change_percent": 0.63,
+                "timestamp": datetime.now().isoformat(),
+                "source": self.name,
+            }
+            for symbol in symbols
+        }
+        self.bytes_sent += len(json.dumps(quotes))
+        return quotes
+
+    def fetch_fundamentals(self, symbol):
+        time.sleep(self.info_latency)
+        self.bytes_sent += len(json.dumps(self.info))
+        return {
+            "market_cap": self.info["marketCap"],
+            "pe_ratio": self.info["trailingPE"],
+        }
+
+
+def legacy_quote(provider, symbol):
+    """Previous _get_yahoo_data shape: history and info on every quote"""
+    data = provider.fetch_quotes([symbol])[symbol]
+    fundamentals = provider.fetch_fundamentals(symbol)
+    data["market_cap"] = fundamentals["market_cap"]
+    data["pe_ratio"] = fundamentals["pe_ratio"]
+    return data
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--quotes", type=int, default=20)
+    args = parser.parse_args()
+
+    provider = StubProvider()
+    start = time.perf_counter()
+    for _ in range(args.quotes):
+        legacy_quote(provider, "AAPL")
+    legacy_time = time.perf_counter() - start
+    legacy_bytes = provider.bytes_sent
+
+    provider = StubProvider()
+    collector = StockDataCollector(quote_provider=provider)
+    collector.fundamentals.refresh(["AAPL"])
+    provider.bytes_sent = 0
+
+    start = time.perf_counter()
+    for _ in range(args.quotes):
+        data = collector._get_yahoo_data("AAPL")
+    cached_time = time.perf_counter() - start
+    cached_bytes = provider.bytes_sent
+
+    assert data["market_cap"] == provider.info["marketCap"]
+
+    print(f"Quotes: {args.quotes}")
+    print(
+        f"Per-quote info: {legacy_time / args.quotes * 1000:8.1f} ms/quote  "
+        f"{legacy_bytes / args.quotes:8.0f} bytes/quote"
+    )
+    print(
+        f"Cached info:    {cached_time / args.quotes * 1000:8.1f} ms/quote  "
+        f"{cached_bytes / args.quotes:8.0f} bytes/quote"
+    )
+    print(f"Latency reduction: {legacy_time / cached_time:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
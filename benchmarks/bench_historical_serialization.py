@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark /api/historical serialization for 10 years of daily bars:
+the previous iterrows() row building, the vectorized row format and the
+columnar format, each including JSON encoding of the result.
+
+Usage: python benchmarks/bench_historical_serialization.py [--years 10]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import date, timedelta
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "backend"))
+
+import pandas as pd
+from data_collectors.bar_store import bars_to_columns, bars_to_rows
+from data_collectors.synthetic_market import SyntheticMarket
+
+
+def legacy_rows(hist):
+    """Previous get_historical_data conversion of the Yahoo DataFrame"""
+    historical_data = []
+    for day, row in hist.iterrows():
+        historical_data.append(
+            {
+                "date": day.strftime("%Y-%m-%d"),
+                "open": float(row["Open"]),
+                "high": float(row["High"]),
+                "low": float(row["Low"]),
+                "close": float(row["Close"]),
+                "volume": int(row["Volume"]),
+            }
+        )
+    return historical_data
+
+
+def timed(func, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        payload = json.dumps(func())
+        best = min(best, time.perf_counter() - start)
+    return best, len(payload)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--years", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    end = date.today()
+    bars = SyntheticMarket(seed=7).daily_bars(
+        "AAPL", end - timedelta(days=365 * args.years), end
+    )
+
+    # Same bars in the shape yfinance returns them
+    hist = pd.DataFrame(
+        {
+            "Open": bars["open"].to_numpy(),
+            "High": bars["high"].to_numpy(),
+            "Low": bars["low"].to_numpy(),
+            "Close": bars["close"].to_numpy(),
+            "Volume": bars["volume"].to_numpy(),
+        },
+        index=pd.to_datetime(bars["date"]),
+    )
+
+    results = [
+        ("iterrows rows", *timed(lambda: legacy_rows(hist), args.repeat)),
+        ("vectorized rows", *timed(lambda: bars_to_rows(bars), args.repeat)),
+        ("columns", *timed(lambda: bars_to_columns(bars), args.repeat)),
+    ]
+
+    print(f"{len(bars)} daily bars ({args.years} years), best of {args.repeat}")
+    baseline = results[0][1]
+    for name, seconds, size in results:
+        print(
+            f"{name:16s} {seconds * 1000:8.2f} ms  {size / 1024:8.1f} KiB  "
+            f"{baseline / seconds:6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
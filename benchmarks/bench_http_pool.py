@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Benchmark bare requests.get against the pooled HttpClient using a local
+keep-alive stub server, and run Alpha Vantage quotes through the stub.
+Plain HTTP on localhost, so this only shows the TCP connect share of the
+saving; TLS handshakes to real providers cost considerably more.
+
+Usage: python benchmarks/bench_http_pool.py [--requests 200]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import requests
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "backend"))
+
+from data_collectors.stock_data_collector import StockDataCollector
+from utils.http_client import HttpClient
+from utils.http_stub_server import StubHTTPServer
+
+GLOBAL_QUOTE = {
+    "Global Quote": {
+        "01. symbol": "AAPL",
+        "02. open": "189.10",
+        "03. high": "191.00",
+        "04. low": "188.20",
+        "05. price": "190.40",
+        "06. volume": "52000000",
+        "09. change": "1.30",
+        "10. change percent": "0.6874%",
+    }
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    routes = {"/query": (200, {"Content-Type": "application/json"}, "{}")}
+
+    with StubHTTPServer(routes) as server:
+        start = time.perf_counter()
+        for _ in range(args.requests):
+            requests.get(server.url + "/query", timeout=5)
+        bare_time = time.perf_counter() - start
+        bare_connections = server.connections
+
+    with StubHTTPServer(routes) as server:
+        client = HttpClient()
+        start = time.perf_counter()
+        for _ in range(args.requests):
+            client.get(server.url + "/query")
+        pooled_time = time.perf_counter() - start
+        pooled_connections = server.connections
+
+    print(f"Requests: {args.requests}")
+    print(
+        f"Bare requests.get: {bare_time / args.requests * 1000:7.3f} ms/request  "
+        f"{bare_connections} connections"
+    )
+    print(
+        f"Pooled client:     {pooled_time / args.requests * 1000:7.3f} ms/request  "
+        f"{pooled_connections} connections"
+    )
+
+    quote_route = (200, {"Content-Type": "application/json"}, json.dumps(GLOBAL_QUOTE))
+    with StubHTTPServer({"/query": quote_route}) as server:
+        collector = StockDataCollector(http_client=HttpClient())
+        collector.config.ALPHA_VANTAGE_BASE_URL = server.url + "/query"
+        data = collector._get_alpha_vantage_data("AAPL")
+        print(f"Alpha Vantage via stub: AAPL @ {data['current_price']}")
+        print(f"Stub saw query: {server.requests[-1].query}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Benchmark the market-wide sentiment overview against a local stub server
+(five RSS feeds and the News API, each answering after a fixed latency):
+the previous serial loop, which re-fetched every feed for every symbol,
+versus one parallel refresh_market_sentiment, versus serving the snapshot.
+
+Usage: python benchmarks/bench_market_sentiment.py [--latency 0.2]
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+
+# Keep scoring in process; the pool is benchmarked separately
+os.environ.setdefault("SENTIMENT_POOL_WORKERS", "1")
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "backend"))
+
+import numpy as np
+from data_collectors.news_sentiment_collector import NewsSentimentCollector
+from utils.http_client import HttpClient
+from utils.http_stub_server import StubHTTPServer
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "market_news.xml")
+
+
+def news_api_route(request):
+    query = request.query.get("q", "")
+    articles = [
+        {
+            "title": f"{query.split(' OR ')[0].title()} shares rally on upbeat outlook",
+            "description": f"Analysts raised targets after strong results ({query}).",
+            "url": f"http://127.0.0.1/newsapi/{abs(hash(query))}",
+            "source": {"name": "Stub Wire"},
+            "publishedAt": "2026-10-16T12:00:00Z",
+        }
+    ]
+    return 200, {"Content-Type": "application/json"}, json.dumps({"articles": articles})
+
+
+def make_collector(server, feeds, feed_max_age=None):
+    collector = NewsSentimentCollector(http_client=HttpClient())
+    collector.news_api_key = "bench"
+    collector.config.NEWS_API_BASE_URL = server.url
+    collector.rss_feeds = feeds
+    if feed_max_age is not None:
+        collector.feed_cache.max_age = feed_max_age
+    collector.scorer.warm_up()
+    return collector
+
+
+def serial_overview(collector, symbols):
+    """The previous get_market_sentiment_overview loop"""
+    sentiments = {
+        symbol: collector.get_sentiment_for_stock(symbol) for symbol in symbols
+    }
+    return float(np.mean([s["compound_score"] for s in sentiments.values()]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--latency", type=float, default=0.2)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    with open(FIXTURE, "rb") as f:
+        body = f.read()
+
+    routes = {
+        f"/feed{i}.xml": (200, {"Content-Type": "application/rss+xml"}, body)
+        for i in range(5)
+    }
+    routes["/everything"] = news_api_route
+
+    with StubHTTPServer(routes, latency=args.latency) as server:
+        feeds = [server.url + path for path in routes if path.endswith(".xml")]
+        print(f"{len(feeds)} feeds + News API, {args.latency} s latency each")
+
+        # Old behaviour: every symbol went back to every feed
+        collector = make_collector(server, feeds, feed_max_age=0)
+        symbols = list(collector.config.DEFAULT_STOCKS)
+        requests_before = len(server.requests)
+        start = time.perf_counter()
+        average = serial_overview(collector, symbols)
+        elapsed = time.perf_counter() - start
+        print(
+            f"serial       {elapsed * 1000:8.1f} ms  "
+            f"{len(server.requests) - requests_before:3d} requests  "
+            f"avg {average:+.3f}"
+        )
+
+        collector = make_collector(server, feeds)
+        requests_before = len(server.requests)
+        start = time.perf_counter()
+        collector.refresh_market_sentiment()
+        elapsed = time.perf_counter() - start
+        snapshot = collector.get_market_sentiment_overview()
+        print(
+            f"parallel     {elapsed * 1000:8.1f} ms  "
+            f"{len(server.requests) - requests_before:3d} requests  "
+            f"avg {snapshot['average_compound_score']:+.3f}"
+        )
+
+        calls = 10000
+        start = time.perf_counter()
+        for _ in range(calls):
+            collector.get_market_sentiment_overview()
+        elapsed = time.perf_counter() - start
+        print(f"snapshot     {elapsed / calls * 1e6:8.1f} us per request")
+
+
+if __name__ == "__main__":
+    main()
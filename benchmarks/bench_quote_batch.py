@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark sequential vs batched quote fetching against a stub provider.
+Runs fully offline: the stub sleeps to mimic provider round-trip latency.
+Like Yahoo it answers one ticker per request, so a batch only saves time
+through the requests it runs in parallel (--threads).
+
+Usage: python benchmarks/bench_quote_batch.py [--symbols 40] [--latency 0.2]
+       [--threads 8]
+"""
+
+import argparse
+import math
+import os
+import sys
+import time
+from datetime import datetime
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "backend"))
+
+from data_collectors.quote_providers import QuoteProvider
+from data_collectors.stock_data_collector import StockDataCollector
+
+
+class LatencyStubProvider(QuoteProvider):
+    """Quote provider that answers from memory after an artificial delay
+
+    Every ticker costs one round trip of ``latency``; up to ``max_threads``
+    of them are in flight at once, as in the threaded Yahoo download.
+    """
+
+    name = "stub"
+
+    def __init__(self, latency: float, max_threads: int = 8):
+        self.latency = latency
+        self.max_threads = max(1, max_threads)
+        self.calls = 0
+        self.requests = 0
+
+    def fetch_quotes(self, symbols):
+        self.calls += 1
+        self.requests += len(symbols)
+        time.sleep(self.latency * math.ceil(len(symbols) / self.max_threads))
+        return {
+            symbol: {
+                "symbol": symbol,
+                "current_price": 100.0,
+                "open_price": 99.0,
+                "high_price": 101.0,
+                "low_price": 98.0,
+                "volume": 1000000,
+                "change": 1.0,
+                "change_percent": 1.0,
+                "timestamp": datetime.now(),
+                "source": self.name,
+            }
+            for symbol in symbols
+        }
+
+
+def run_sequential(provider, symbols):
+    """Previous behaviour: one provider call per symbol plus a 0.1s pause"""
+    results = {}
+    for symbol in symbols:
+        results.update(provider.fetch_quotes([symbol]))
+        time.sleep(0.1)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--symbols", type=int, default=40)
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    symbols = [f"SYM{i:04d}" for i in range(args.symbols)]
+
+    provider = LatencyStubProvider(args.latency, args.threads)
+    start = time.perf_counter()
+    run_sequential(provider, symbols)
+    sequential_time = time.perf_counter() - start
+    sequential_calls = provider.calls
+
+    provider = LatencyStubProvider(args.latency, args.threads)
+    collector = StockDataCollector(quote_provider=provider)
+    start = time.perf_counter()
+    quotes = collector.get_current_data_batch(symbols)
+    batch_time = time.perf_counter() - start
+
+    assert len(quotes) == len(symbols)
+
+    print(
+        f"Symbols: {len(symbols)}  latency per request: {args.latency:.3f}s  "
+        f"threads: {args.threads}"
+    )
+    print(f"Sequential: {sequential_time:8.3f}s  ({sequential_calls} provider calls)")
+    print(
+        f"Batched:    {batch_time:8.3f}s  ({provider.calls} provider calls, "
+        f"{provider.requests} requests)"
+    )
+    print(f"Speed-up:   {sequential_time / batch_time:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
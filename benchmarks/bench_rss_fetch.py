@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Benchmark cold RSS news collection over five feeds with different latencies
+(one of them slower than the fetch deadline) from a local stub server:
+fetching the feeds one after another versus FeedCache.get_many with a
+per-feed timeout and a global deadline.
+
+Usage: python benchmarks/bench_rss_fetch.py [--deadline 0.5] [--slow 2.0]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "backend"))
+
+from data_collectors.feed_cache import FeedCache
+from utils.http_client import HttpClient
+from utils.http_stub_server import StubHTTPServer
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "market_news.xml")
+
+
+def slow_route(body, latency):
+    def route(request):
+        time.sleep(latency)
+        return 200, {"Content-Type": "application/rss+xml"}, body
+
+    return route
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--deadline", type=float, default=0.5)
+    parser.add_argument("--slow", type=float, default=2.0)
+    args = parser.parse_args()
+
+    with open(FIXTURE, "rb") as f:
+        body = f.read()
+
+    latencies = [0.05, 0.1, 0.2, 0.3, args.slow]
+    routes = {
+        f"/feed{i}.xml": slow_route(body, latency)
+        for i, latency in enumerate(latencies)
+    }
+
+    with StubHTTPServer(routes) as server:
+        urls = [server.url + path for path in routes]
+        print(f"feed latencies {latencies} s, deadline {args.deadline} s")
+
+        cache = FeedCache(HttpClient(), max_age=0)
+        start = time.perf_counter()
+        feeds = [cache.get(url) for url in urls]
+        elapsed = time.perf_counter() - start
+        print(f"sequential  {elapsed * 1000:8.1f} ms  {len(feeds)} feeds")
+
+        cache = FeedCache(HttpClient(), max_age=0, workers=len(urls))
+        start = time.perf_counter()
+        feeds = cache.get_many(urls, timeout=args.slow * 2, deadline=args.deadline)
+        elapsed = time.perf_counter() - start
+        print(f"get_many    {elapsed * 1000:8.1f} ms  {len(feeds)} feeds on time")
+        print(f"Feed cache: {cache.stats()}")
+
+
+if __name__ == "__main__":
+    main()
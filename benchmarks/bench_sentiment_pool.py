@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmark sentiment scoring throughput (articles/second) in process and on
+SentimentProcessPool with 1, 2, 4 and 8 workers. Pools are started and
+warmed before timing, as they are in a long-running server; the memo is
+bypassed so every article is really scored.
+
+Usage: python benchmarks/bench_sentiment_pool.py [--articles 2000]
+"""
+
+import argparse
+import logging
+import os
+import random
+import sys
+import time
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "backend"))
+
+from data_collectors.sentiment_scorer import SentimentProcessPool, SentimentScorer
+
+SUBJECTS = ["Apple", "Nvidia", "Tesla", "Microsoft", "Amazon", "Netflix", "Meta"]
+VERBS = ["beats", "misses", "raises", "cuts", "slashes", "boosts", "warns on"]
+OBJECTS = ["earnings", "guidance", "margins", "outlook", "dividend", "forecasts"]
+TAILS = [
+    "as investors cheer strong demand",
+    "amid fears of a slowdown",
+    "after a disappointing quarter",
+    "while analysts upgrade the stock",
+    "despite supply chain problems",
+    "on record cloud growth",
+]
+
+
+def make_articles(count, seed=1):
+    rng = random.Random(seed)
+    return [
+        f"{rng.choice(SUBJECTS)} {rng.choice(VERBS)} {rng.choice(OBJECTS)} "
+        f"{rng.choice(TAILS)} ({i}). {rng.choice(SUBJECTS)} shares moved "
+        f"{rng.choice(['sharply', 'slightly', 'little'])} in early trading."
+        for i in range(count)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--articles", type=int, default=2000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    # Missing NLTK data would otherwise log one error per article
+    logging.disable(logging.ERROR)
+
+    articles = make_articles(args.articles)
+    print(f"{args.articles} articles, {os.cpu_count()} CPUs")
+
+    scorer = SentimentScorer()
+    scorer.score_many(articles[:8])  # warm up like the pool workers
+
+    start = time.perf_counter()
+    scorer.score_many(articles)
+    baseline = args.articles / (time.perf_counter() - start)
+    print(f"in process      {baseline:9.1f} articles/s")
+
+    for workers in args.workers:
+        pool = SentimentProcessPool(workers).start()
+        pool.score_many(articles[: workers * 8])  # start and warm every worker
+
+        start = time.perf_counter()
+        pool.score_many(articles)
+        rate = args.articles / (time.perf_counter() - start)
+        pool.close()
+        print(f"{workers} worker(s)    {rate:9.1f} articles/s  {rate / baseline:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""Shared pytest fixtures for the repository tests"""
+
+import os
+import sys
+
+import pytest
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "backend"))
+
+from utils.database_manager import DatabaseManager
+
+
+class FakeClock:
+    """Stand-in for time.monotonic that only moves when told to"""
+
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def db_manager(tmp_path):
+    """DatabaseManager on an initialized throwaway SQLite file"""
+    manager = DatabaseManager(str(tmp_path / "stock_market.db"))
+    manager.initialize_database()
+    return manager
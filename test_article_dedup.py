@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Tests for URL canonicalization and SimHash near-duplicate detection.
+"""
+
+import os
+import sys
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "backend"))
+
+from data_collectors.article_dedup import (
+    ArticleDeduplicator,
+    SimHashIndex,
+    canonical_url,
+    simhash,
+    strip_source,
+    url_key,
+)
+
+WIRE_STORY = (
+    "Apple reported record quarterly revenue on Thursday as iPhone sales "
+    "beat analyst expectations across every region."
+)
+
+
+def article(title, url="", source=None, description=""):
+    return {"title": title, "url": url, "source": source, "description": description}
+
+
+def test_canonical_url_drops_tracking_and_fragment():
+    url = "HTTPS://Example.com/markets/apple/?utm_source=x&b=2&gclid=abc&a=1#top"
+
+    assert canonical_url(url) == "https://example.com/markets/apple?a=1&b=2"
+    assert canonical_url("") == ""
+
+
+def test_url_key_ignores_scheme_and_www():
+    assert url_key("http://www.example.com/a") == url_key("https://example.com/a/")
+
+
+def test_strip_source_only_removes_matching_suffix():
+    assert strip_source("Apple beats - Reuters", "reuters") == "Apple beats"
+    assert strip_source("Apple beats - Reuters", "Bloomberg") == "Apple beats - Reuters"
+    assert strip_source("Apple beats | MarketWatch", None) == (
+        "Apple beats | MarketWatch"
+    )
+
+
+def test_simhash_is_close_for_near_duplicates():
+    first = simhash("Apple shares jump after record iPhone sales quarter")
+    retitled = simhash("Apple shares jump after a record iPhone sales quarter")
+    unrelated = simhash("Oil prices slide as OPEC signals higher output")
+
+    assert simhash("") == 0
+    assert (first ^ retitled).bit_count() <= 3
+    assert (first ^ unrelated).bit_count() > 3
+
+
+def test_index_finds_within_distance_and_forgets_removed():
+    index = SimHashIndex(max_distance=3)
+    index.add(1, 0b1011)
+
+    assert index.find(0b1011 ^ 0b111) == 1
+    assert index.find(0b1011 ^ 0b1111) is None
+
+    index.remove(1)
+    assert index.find(0b1011) is None
+    assert len(index) == 0
+
+
+def test_filter_drops_url_and_title_duplicates():
+    dedup = ArticleDeduplicator()
+    articles = [
+        article("Apple beats estimates", "https://a.com/x?utm_medium=rss"),
+        article("Completely different headline", "https://www.a.com/x"),
+        article("Apple beats estimates - Reuters", "https://b.com/y", "Reuters"),
+        article("Oil slides on supply glut", "https://c.com/z"),
+    ]
+
+    unique = dedup.filter(articles)
+
+    assert [a["url"] for a in unique] == [
+        "https://a.com/x?utm_medium=rss",
+        "https://c.com/z",
+    ]
+    assert dedup.stats()["dropped"] == 2
+
+
+def test_filter_matches_long_descriptions_only():
+    dedup = ArticleDeduplicator()
+    dedup.filter([article("Apple posts record revenue", description=WIRE_STORY)])
+
+    assert dedup.seen(article("iPhone maker tops forecasts", description=WIRE_STORY))
+    assert not dedup.seen(article("iPhone maker tops forecasts", description="Apple"))
+
+
+def test_seen_does_not_remember():
+    dedup = ArticleDeduplicator()
+
+    assert not dedup.seen(article("Apple beats estimates"))
+    assert not dedup.seen(article("Apple beats estimates"))
+    assert len(dedup) == 0
+
+
+def test_oldest_entries_are_forgotten():
+    dedup = ArticleDeduplicator(max_size=2)
+    dedup.filter(
+        [
+            article("Apple beats estimates", "https://a.com/1"),
+            article("Oil slides on supply glut", "https://a.com/2"),
+            article("Fed holds rates steady", "https://a.com/3"),
+        ]
+    )
+
+    assert len(dedup) == 2
+    assert not dedup.seen(article("Apple beats estimates", "https://a.com/1"))
+    assert dedup.seen(article("Fed holds rates steady"))
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Tests for the local daily bar store and its gap-filling.
+"""
+
+import os
+import sys
+from datetime import date, timedelta
+
+import pandas as pd
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "backend"))
+
+from data_collectors.bar_store import BarStore, subtract_ranges
+
+TODAY = date(2026, 10, 16)
+
+
+class StubBarFetcher:
+    """Returns one bar per business day and records every requested range"""
+
+    def __init__(self):
+        self.ranges = []
+
+    def __call__(self, symbol, start, end):
+        self.ranges.append((start, end))
+        days = pd.bdate_range(start, end)
+        return pd.DataFrame(
+            {
+                "date": days.strftime("%Y-%m-%d"),
+                "open": 100.0,
+                "high": 101.0,
+                "low": 99.0,
+                "close": 100.5,
+                "volume": 1000,
+            }
+        )
+
+
+def make_store(db_manager, today_ttl=60):
+    fetcher = StubBarFetcher()
+    store = BarStore(db_manager, fetcher, today_ttl=today_ttl, today=lambda: TODAY)
+    return store, fetcher
+
+
+def test_subtract_ranges():
+    d = date(2026, 10, 1)
+    covered = [(d + timedelta(days=2), d + timedelta(days=4))]
+
+    assert subtract_ranges(d, d + timedelta(days=6), covered) == [
+        (d, d + timedelta(days=1)),
+        (d + timedelta(days=5), d + timedelta(days=6)),
+    ]
+    assert subtract_ranges(d + timedelta(days=2), d + timedelta(days=3), covered) == []
+
+
+def test_closed_days_are_fetched_once(db_manager):
+    store, fetcher = make_store(db_manager)
+    start, end = date(2026, 9, 1), date(2026, 9, 30)
+
+    first = store.get_bars("AAPL", start, end)
+    second = store.get_bars("AAPL", start, end)
+
+    assert fetcher.ranges == [(start, end)]
+    assert len(first) == len(pd.bdate_range(start, end))
+    pd.testing.assert_frame_equal(first, second)
+
+
+def test_only_gaps_go_upstream(db_manager):
+    store, fetcher = make_store(db_manager)
+    store.get_bars("AAPL", date(2026, 9, 10), date(2026, 9, 20))
+
+    bars = store.get_bars("AAPL", date(2026, 9, 1), date(2026, 9, 30))
+
+    assert fetcher.ranges[1:] == [
+        (date(2026, 9, 1), date(2026, 9, 9)),
+        (date(2026, 9, 21), date(2026, 9, 30)),
+    ]
+    assert bars["date"].tolist() == list(
+        pd.bdate_range("2026-09-01", "2026-09-30").strftime("%Y-%m-%d")
+    )
+
+
+def test_open_day_is_refetched_after_its_ttl(db_manager):
+    store, fetcher = make_store(db_manager, today_ttl=60)
+    store.get_bars("AAPL", date(2026, 10, 1), TODAY)
+    store.get_bars("AAPL", date(2026, 10, 1), TODAY)
+    assert fetcher.ranges == [(date(2026, 10, 1), TODAY)]
+
+    store.today_ttl = 0
+    store.get_bars("AAPL", date(2026, 10, 1), TODAY)
+    assert fetcher.ranges[1:] == [(TODAY, TODAY)]
+
+
+def test_empty_answers_cover_short_ranges_only(db_manager):
+    store, _ = make_store(db_manager)
+    store.fetcher = lambda symbol, start, end: pd.DataFrame()
+
+    # A weekend: nothing to fetch next time
+    store.get_bars("AAPL", date(2026, 10, 10), date(2026, 10, 11))
+    assert store.missing_ranges("AAPL", date(2026, 10, 10), date(2026, 10, 11)) == []
+
+    # A month of nothing looks like an outage and is fetched again
+    store.get_bars("AAPL", date(2026, 8, 1), date(2026, 8, 31))
+    assert store.missing_ranges("AAPL", date(2026, 8, 1), date(2026, 8, 31)) == [
+        (date(2026, 8, 1), date(2026, 8, 31))
+    ]
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Tests for the circuit breaker's closed, open and half-open transitions.
+"""
+
+import os
+import sys
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "backend"))
+
+from utils.circuit_breaker import CircuitBreaker
+
+
+def make_breaker(clock):
+    return CircuitBreaker("test", failure_threshold=3, cooldown=10, clock=clock)
+
+
+def trip(breaker):
+    for _ in range(breaker.failure_threshold):
+        assert breaker.allow()
+        breaker.record_failure()
+
+
+def test_opens_after_consecutive_failures(clock):
+    breaker = make_breaker(clock)
+
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.times_opened == 1
+
+
+def test_open_breaker_rejects_until_cooldown(clock):
+    breaker = make_breaker(clock)
+    trip(breaker)
+
+    clock.now = 9.9
+    assert not breaker.allow()
+    assert breaker.rejected == 1
+    assert breaker.stats()["retry_in_seconds"] == 0.1
+
+
+def test_half_open_lets_one_probe_through(clock):
+    breaker = make_breaker(clock)
+    trip(breaker)
+
+    clock.now = 10.0
+    assert breaker.allow()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.allow()
+
+    # A probe that never reports back is abandoned after a cooldown
+    clock.now = 20.0
+    assert breaker.allow()
+
+
+def test_successful_probe_closes(clock):
+    breaker = make_breaker(clock)
+    trip(breaker)
+
+    clock.now = 10.0
+    assert breaker.allow()
+    breaker.record_success()
+
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.consecutive_failures == 0
+    assert breaker.allow()
+
+
+def test_failed_probe_reopens_for_another_cooldown(clock):
+    breaker = make_breaker(clock)
+    trip(breaker)
+
+    clock.now = 10.0
+    assert breaker.allow()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.times_opened == 2
+    clock.now = 19.9
+    assert not breaker.allow()
+    clock.now = 20.0
+    assert breaker.allow()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared RSS feed cache and its conditional GETs.
+"""
+
+import os
+import sys
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "backend"))
+
+from data_collectors.feed_cache import FeedCache
+from utils.http_client import HttpClient
+from utils.http_stub_server import StubHTTPServer
+
+
+def rss(*titles):
+    items = "".join(
+        f"<item><title>{title}</title><link>http://example.com/{i}</link>"
+        f"<description>About {title}</description></item>"
+        for i, title in enumerate(titles)
+    )
+    return (
+        '<?xml version="1.0"?><rss version="2.0"><channel>'
+        f"<title>Stub News</title>{items}</channel></rss>"
+    )
+
+
+class Feed:
+    """Feed route honouring If-None-Match, like a well-behaved publisher"""
+
+    def __init__(self, *titles):
+        self.body = rss(*titles)
+        self.etag = '"v1"'
+        self.status = 200
+
+    def update(self, *titles):
+        self.body = rss(*titles)
+        self.etag = '"v2"'
+
+    def __call__(self, request):
+        if self.status != 200:
+            return self.status, {}, "unavailable"
+        if request.headers.get("If-None-Match") == self.etag:
+            return 304, {"ETag": self.etag}, ""
+        headers = {
+            "Content-Type": "application/rss+xml",
+            "ETag": self.etag,
+            "Last-Modified": "Fri, 16 Oct 2026 12:00:00 GMT",
+        }
+        return 200, headers, self.body
+
+
+def test_feed_is_fetched_once_per_max_age(clock):
+    feed = Feed("Apple shares rally")
+    with StubHTTPServer({"/feed.xml": feed}) as server:
+        cache = FeedCache(HttpClient(max_retries=0), max_age=300, clock=clock)
+        url = server.url + "/feed.xml"
+
+        first = cache.get(url)
+        clock.now = 299
+        second = cache.get(url)
+
+        assert len(server.requests) == 1
+        assert second is first
+        assert (
+            first.entries[0]["content"] == "apple shares rally about apple shares rally"
+        )
+        assert cache.stats()["hits"] == 1
+
+
+def test_unchanged_feed_is_revalidated_without_reparsing(clock):
+    feed = Feed("Apple shares rally")
+    with StubHTTPServer({"/feed.xml": feed}) as server:
+        cache = FeedCache(HttpClient(max_retries=0), max_age=300, clock=clock)
+        url = server.url + "/feed.xml"
+        first = cache.get(url)
+
+        clock.now = 300
+        second = cache.get(url)
+
+        revalidation = server.requests[1]
+        assert revalidation.headers["If-None-Match"] == '"v1"'
+        assert revalidation.headers["If-Modified-Since"].startswith("Fri, 16 Oct")
+        assert second is first
+        assert cache.not_modified == 1
+
+        # Fresh again after the 304
+        clock.now = 500
+        cache.get(url)
+        assert len(server.requests) == 2
+
+
+def test_changed_feed_replaces_entries(clock):
+    feed = Feed("Apple shares rally")
+    with StubHTTPServer({"/feed.xml": feed}) as server:
+        cache = FeedCache(HttpClient(max_retries=0), max_age=300, clock=clock)
+        url = server.url + "/feed.xml"
+        cache.get(url)
+
+        feed.update("Microsoft earnings beat", "Nvidia slides")
+        clock.now = 300
+
+        titles = [entry["title"] for entry in cache.get(url).entries]
+        assert titles == ["Microsoft earnings beat", "Nvidia slides"]
+
+
+def test_failed_refresh_keeps_last_good_copy(clock):
+    feed = Feed("Apple shares rally")
+    with StubHTTPServer({"/feed.xml": feed}) as server:
+        cache = FeedCache(HttpClient(max_retries=0), max_age=300, clock=clock)
+        url = server.url + "/feed.xml"
+        first = cache.get(url)
+
+        feed.status = 503
+        clock.now = 300
+
+        assert cache.get(url) is first
+        assert cache.errors == 1
+
+
+def test_get_many_returns_parsed_feeds_in_request_order(clock):
+    routes = {"/a.xml": Feed("Apple"), "/b.xml": Feed("Tesla"), "/c.xml": Feed("Meta")}
+    routes["/b.xml"].status = 500
+    with StubHTTPServer(routes) as server:
+        cache = FeedCache(HttpClient(max_retries=0), clock=clock)
+        urls = [server.url + path for path in routes]
+
+        feeds = cache.get_many(urls, timeout=5, deadline=5)
+
+        assert list(feeds) == [urls[0], urls[2]]
+        assert feeds[urls[2]].entries[0]["title"] == "Meta"
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Tests for the fundamentals store kept off the quote hot path.
+"""
+
+import os
+import sys
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "backend"))
+
+from data_collectors.fundamentals_store import FundamentalsStore
+
+
+class StubFetcher:
+    def __init__(self, values=None, failing=()):
+        self.values = values or {}
+        self.failing = set(failing)
+        self.calls = []
+
+    def __call__(self, symbol):
+        self.calls.append(symbol)
+        if symbol in self.failing:
+            raise RuntimeError("upstream down")
+        return self.values.get(symbol)
+
+
+def test_refresh_fetches_tracked_symbols_once_per_max_age():
+    fetcher = StubFetcher({"AAPL": {"market_cap": 3e12, "pe_ratio": 30.0}})
+    store = FundamentalsStore(fetcher, max_age=3600)
+
+    assert store.get("AAPL") == {}
+    assert store.refresh() == 1
+    assert store.refresh() == 0
+    assert fetcher.calls == ["AAPL"]
+
+    assert store.refresh(force=True) == 1
+    assert fetcher.calls == ["AAPL", "AAPL"]
+
+
+def test_quotes_get_cached_values_without_fetching():
+    fetcher = StubFetcher({"AAPL": {"market_cap": 3e12, "pe_ratio": None}})
+    store = FundamentalsStore(fetcher)
+    store.refresh(["AAPL"])
+
+    quote = store.merge_into({"symbol": "AAPL", "current_price": 100.0})
+
+    assert quote["market_cap"] == 3e12
+    assert quote["pe_ratio"] == 0
+    assert fetcher.calls == ["AAPL"]
+
+
+def test_failed_and_empty_fetches_are_skipped_and_retried():
+    fetcher = StubFetcher({"MSFT": {"market_cap": 2e12, "pe_ratio": 25.0}}, {"AAPL"})
+    store = FundamentalsStore(fetcher)
+
+    assert store.refresh(["AAPL", "MSFT", "NVDA"]) == 1
+    assert store.refresh() == 0
+    assert fetcher.calls.count("AAPL") == 2
+    assert fetcher.calls.count("NVDA") == 2
+
+
+def test_values_persist_across_stores(db_manager):
+    fetcher = StubFetcher({"AAPL": {"market_cap": 3e12, "pe_ratio": 30.0}})
+    FundamentalsStore(fetcher, db_manager=db_manager).refresh(["AAPL"])
+
+    restarted = FundamentalsStore(StubFetcher(), db_manager=db_manager, max_age=3600)
+    restarted.load()
+
+    assert restarted.get("AAPL") == {"market_cap": 3e12, "pe_ratio": 30.0}
+    # Loaded values are fresh, so nothing is fetched again
+    assert restarted.refresh() == 0
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Tests for the intraday bar aggregator fed from polled quotes.
+"""
+
+import os
+import sys
+from datetime import datetime, timezone
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "backend"))
+
+from data_collectors.intraday_bars import IntradayBarAggregator
+
+
+def utc(hour, minute, second=0):
+    return datetime(2026, 10, 16, hour, minute, second, tzinfo=timezone.utc)
+
+
+def sample(timestamp, price, volume):
+    return {"current_price": price, "volume": volume, "timestamp": timestamp}
+
+
+def local(timestamp):
+    return datetime.fromtimestamp(timestamp.timestamp()).isoformat()
+
+
+def test_minute_bars_fold_ohlc_and_volume_deltas():
+    bars = IntradayBarAggregator()
+    for second, price, volume in [(5, 10.0, 100), (20, 12.0, 150), (40, 9.0, 175)]:
+        bars.add_quote("AAPL", sample(utc(14, 30, second), price, volume))
+    bars.add_quote("AAPL", sample(utc(14, 31, 1), 11.0, 180))
+
+    finished, current = bars.get_bars("AAPL", "1m")
+    assert finished["timestamp"] == local(utc(14, 30))
+    assert (finished["open"], finished["high"], finished["low"]) == (10.0, 12.0, 9.0)
+    assert (finished["close"], finished["volume"]) == (9.0, 75)
+    assert current["volume"] == 5
+
+
+def test_repeated_and_late_samples_are_ignored():
+    bars = IntradayBarAggregator()
+    bars.add_quote("AAPL", sample(utc(14, 30, 5), 10.0, 100))
+    bars.add_quote("AAPL", sample(utc(14, 30, 5), 99.0, 100))
+    bars.add_quote("AAPL", sample(utc(14, 29, 59), 99.0, 100))
+
+    assert bars.get_bars("AAPL", "1m")[0]["high"] == 10.0
+    assert bars.stats()["samples"] == 1
+
+
+def test_hourly_bars_follow_exchange_local_hour():
+    # India is UTC+5:30: 09:40 and 10:20 UTC are both in the 15:00 local hour
+    bars = IntradayBarAggregator(timezone="Asia/Kolkata")
+    bars.add_quote("RELIANCE", sample(utc(9, 40), 10.0, 0))
+    bars.add_quote("RELIANCE", sample(utc(10, 20), 11.0, 0))
+    bars.add_quote("RELIANCE", sample(utc(10, 30), 12.0, 0))
+
+    hourly = bars.get_bars("RELIANCE", "1h")
+    assert [bar["timestamp"] for bar in hourly] == [
+        local(utc(9, 30)),
+        local(utc(10, 30)),
+    ]
+    assert hourly[0]["close"] == 11.0
+
+
+def test_finished_minute_bars_are_flushed_in_one_batch():
+    class Recorder:
+        def __init__(self):
+            self.batches = []
+
+        def insert_stock_data_batch(self, rows):
+            self.batches.append(rows)
+
+    db = Recorder()
+    bars = IntradayBarAggregator(db, flush_batch_size=100)
+    bars.add_quote("AAPL", sample(utc(14, 30), 10.0, 0))
+    bars.add_quote("AAPL", sample(utc(14, 31), 11.0, 0))
+    bars.seal(now=utc(14, 33))
+
+    assert bars.flush() == 2
+    assert len(db.batches) == 1
+    assert bars.flush() == 0
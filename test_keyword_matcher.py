@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Tests for the single-pass keyword matcher that tags articles with symbols.
+"""
+
+import os
+import sys
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "backend"))
+
+from data_collectors.keyword_matcher import KeywordMatcher
+
+KEYWORDS = {
+    "AAPL": ["apple", "iphone", "ios", "tim cook"],
+    "MSFT": ["microsoft", "windows", "azure"],
+    "TSLA": ["tesla", "ev", "model 3", "electric vehicle"],
+    "NVDA": ["nvidia", "gpu"],
+}
+
+
+def test_keywords_match_whole_words_only():
+    matcher = KeywordMatcher(KEYWORDS)
+
+    assert matcher.match("Every analyst expects applesauce") == set()
+    assert matcher.match("EV makers rally; Apple flat") == {"TSLA", "AAPL"}
+
+
+def test_phrases_match_consecutive_tokens():
+    matcher = KeywordMatcher(KEYWORDS)
+
+    assert matcher.match("Tim Cook unveils a new Mac") == {"AAPL"}
+    assert matcher.match("Tim Hortons and cook-offs") == set()
+    assert matcher.match("Tesla Model 3 deliveries") == {"TSLA"}
+    assert matcher.match("Electric-vehicle sales climb") == {"TSLA"}
+
+
+def test_keywords_match_their_plural():
+    matcher = KeywordMatcher(KEYWORDS)
+
+    assert matcher.match("iPhones sold out") == {"AAPL"}
+    assert matcher.match("Data centres buy more GPUs") == {"NVDA"}
+    assert matcher.match("Electric vehicles gain share") == {"TSLA"}
+
+
+def test_text_is_not_folded_into_other_keywords():
+    matcher = KeywordMatcher(KEYWORDS)
+
+    # "windows" is an MSFT keyword, the singular is an ordinary word
+    assert matcher.match("Shop window displays get festive") == set()
+    assert matcher.match("Windows update ships") == {"MSFT"}
+    assert matcher.match("Window of opportunity for iOS") == {"AAPL"}
+
+
+def test_added_symbols_bump_version():
+    matcher = KeywordMatcher(KEYWORDS)
+    version = matcher.version
+
+    matcher.add("AMD", ["amd", "ryzen"])
+
+    assert "AMD" in matcher
+    assert matcher.version == version + 1
+    assert matcher.match("Ryzen chips and Nvidia GPUs") == {"AMD", "NVDA"}
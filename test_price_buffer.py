@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Tests for the price ring buffer and per-symbol price history.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "backend"))
+
+from utils.price_buffer import PriceHistory, PriceRingBuffer
+
+
+def filled(capacity, count):
+    buffer = PriceRingBuffer(capacity)
+    for i in range(count):
+        buffer.append(1000 + i, 100.0 + i, 10 * i)
+    return buffer
+
+
+def test_window_before_buffer_is_full():
+    buffer = filled(4, 3)
+
+    timestamps, prices, volumes = buffer.window()
+    assert timestamps.tolist() == [1000, 1001, 1002]
+    assert prices.tolist() == [100.0, 101.0, 102.0]
+    assert volumes.tolist() == [0, 10, 20]
+
+
+@pytest.mark.parametrize("count", [4, 5, 7, 8, 9, 23])
+def test_window_across_wraparound(count):
+    buffer = filled(4, count)
+    expected = list(range(count - 4, count))
+
+    timestamps, prices, volumes = buffer.window()
+    assert len(buffer) == 4
+    assert timestamps.tolist() == [1000 + i for i in expected]
+    assert prices.tolist() == [100.0 + i for i in expected]
+    assert volumes.tolist() == [10 * i for i in expected]
+    assert buffer.last_timestamp == 1000 + count - 1
+
+    for n in range(5):
+        timestamps, _, _ = buffer.window(n)
+        assert timestamps.tolist() == [1000 + i for i in expected[4 - n :]]
+
+
+def test_window_is_clipped_and_read_only():
+    buffer = filled(4, 6)
+
+    assert len(buffer.window(100)[0]) == 4
+    assert len(PriceRingBuffer(4).window()[1]) == 0
+
+    prices = buffer.window()[1]
+    assert not prices.flags.writeable
+    with pytest.raises(ValueError):
+        prices[0] = 0.0
+    assert np.shares_memory(prices, buffer.window()[1])
+
+
+def test_history_skips_samples_that_do_not_advance():
+    history = PriceHistory(capacity=4)
+
+    assert history.append("AAPL", 1000, 100.0)
+    assert not history.append("AAPL", 1000, 101.0)
+    assert not history.append("AAPL", 999, 99.0)
+    assert history.append("AAPL", 1001, 102.0)
+    assert history.append("MSFT", 1000, 300.0)
+    assert history.prices("AAPL").tolist() == [100.0, 102.0]
+    assert history.window("NVDA") is None
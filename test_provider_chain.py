@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Tests for the hedged provider chain and its sliding latency histogram.
+"""
+
+import os
+import sys
+import threading
+import time
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "backend"))
+
+from data_collectors.provider_chain import HedgedProviderChain, ProviderSkipped
+from utils.latency_histogram import LatencyHistogram
+
+
+def quote(source):
+    return lambda symbol: {"symbol": symbol, "source": source}
+
+
+def slow(seconds, source):
+    def provider(symbol):
+        time.sleep(seconds)
+        return {"symbol": symbol, "source": source}
+
+    return provider
+
+
+def test_fast_primary_wins_without_hedging():
+    chain = HedgedProviderChain([("primary", quote("primary")), ("fallback", None)])
+
+    assert chain.fetch("AAPL")["source"] == "primary"
+    assert chain.hedges == 0
+    assert chain.histograms["primary"].count == 1
+
+
+def test_slow_primary_is_hedged_after_its_delay():
+    chain = HedgedProviderChain(
+        [("primary", slow(1.0, "primary")), ("fallback", quote("fallback"))],
+        default_hedge_delay=0.05,
+    )
+
+    start = time.monotonic()
+    assert chain.fetch("AAPL")["source"] == "fallback"
+    assert time.monotonic() - start < 0.5
+    assert chain.hedges == 1
+
+
+def test_skipped_calls_are_counted_but_not_timed():
+    def skipped(symbol):
+        raise ProviderSkipped("circuit open")
+
+    chain = HedgedProviderChain([("primary", skipped), ("fallback", quote("fb"))])
+
+    assert chain.fetch("AAPL")["source"] == "fb"
+    assert chain.skipped["primary"] == 1
+    assert chain.histograms["primary"].count == 0
+
+
+def test_abandoned_fallback_calls_do_not_block_primaries():
+    release = threading.Event()
+    answers = {"primary": None}
+
+    def primary(symbol):
+        return answers["primary"]
+
+    def stuck(symbol):
+        release.wait(5)
+        return None
+
+    chain = HedgedProviderChain(
+        [("primary", primary), ("fallback", stuck)], workers=1, budget=0.1
+    )
+    try:
+        assert chain.fetch("AAPL") is None
+        assert chain.abandoned == 1
+
+        # The stuck fallback owns its only worker; primaries still run
+        answers["primary"] = {"symbol": "MSFT"}
+        assert chain.fetch("MSFT") == {"symbol": "MSFT"}
+
+        # and the busy fallback is passed over instead of queued
+        answers["primary"] = None
+        start = time.monotonic()
+        assert chain.fetch("NVDA") is None
+        assert time.monotonic() - start < 0.1
+        assert chain.saturated["fallback"] == 1
+    finally:
+        release.set()
+
+
+def test_histogram_only_keeps_recent_samples(clock):
+    histogram = LatencyHistogram(window=60, clock=clock)
+    for _ in range(10):
+        histogram.record(2.0)
+
+    clock.now = 59.0
+    histogram.record(0.1)
+    assert histogram.count == 11
+    assert histogram.percentile(50) >= 2.0
+
+    # Samples age out one to two windows after they were recorded
+    clock.now = 61.0
+    for _ in range(10):
+        histogram.record(0.1)
+    clock.now = 121.0
+    assert histogram.count == 10
+    assert histogram.max == 0.1
+
+    clock.now = 300.0
+    assert histogram.count == 0
+    assert histogram.percentile(95) == 0.0
+
+
+def test_histogram_without_window_keeps_everything(clock):
+    histogram = LatencyHistogram(clock=clock)
+    histogram.record(1.0)
+
+    clock.now = 1e6
+    assert histogram.count == 1
+    assert histogram.snapshot()["max"] == 1.0
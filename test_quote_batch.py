@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Tests for batched quote fetching through the stock data collector.
+"""
+
+import os
+import sys
+from datetime import datetime
+
+import pandas as pd
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "backend"))
+
+from data_collectors import quote_providers
+from data_collectors.quote_providers import QuoteProvider, YahooQuoteProvider
+from data_collectors.stock_data_collector import StockDataCollector
+
+
+class StubProvider(QuoteProvider):
+    """Quotes every symbol it knows, records each batch it is asked for"""
+
+    name = "test_batch_stub"
+
+    def __init__(self, unknown=()):
+        self.unknown = set(unknown)
+        self.batches = []
+
+    def fetch_quotes(self, symbols):
+        self.batches.append(list(symbols))
+        return {
+            symbol: {
+                "symbol": symbol,
+                "current_price": 100.0 + i,
+                "volume": 1000,
+                "timestamp": datetime(2026, 10, 16, 15, 30),
+                "source": self.name,
+            }
+            for i, symbol in enumerate(symbols)
+            if symbol not in self.unknown
+        }
+
+
+def make_collector(provider, batch_size=3):
+    collector = StockDataCollector(quote_provider=provider)
+    collector.config.MARKET_DATA_PROVIDER = "yahoo"
+    collector.quote_batch_size = batch_size
+    collector._get_alpha_vantage_data = lambda symbol: None
+    return collector
+
+
+def test_symbols_are_fetched_in_chunks():
+    provider = StubProvider()
+    collector = make_collector(provider)
+    symbols = [f"SYM{i}" for i in range(7)]
+
+    quotes = collector.get_current_data_batch(symbols + ["SYM0"])
+
+    assert sorted(map(len, provider.batches)) == [1, 3, 3]
+    assert sorted(sum(provider.batches, [])) == symbols
+    assert list(quotes) == symbols
+    assert all(quote["source"] == provider.name for quote in quotes.values())
+
+
+def test_fresh_quotes_are_served_from_cache():
+    provider = StubProvider()
+    collector = make_collector(provider)
+
+    collector.get_current_data_batch(["AAPL", "MSFT"])
+    collector.get_current_data_batch(["MSFT", "NVDA"])
+
+    assert provider.batches == [["AAPL", "MSFT"], ["NVDA"]]
+
+
+def test_unquoted_symbols_fall_back_and_are_not_recorded():
+    provider = StubProvider(unknown={"ZZZZ"})
+    collector = make_collector(provider)
+
+    quotes = collector.get_current_data_batch(["AAPL", "ZZZZ"])
+
+    assert quotes["AAPL"]["source"] == provider.name
+    assert quotes["ZZZZ"]["source"] == "simulated"
+    assert "AAPL" in collector.price_history
+    assert "ZZZZ" not in collector.price_history
+
+
+def test_yahoo_downloads_tickers_on_bounded_threads(monkeypatch):
+    calls = []
+
+    def download(**kwargs):
+        calls.append(kwargs)
+        return pd.DataFrame()
+
+    monkeypatch.setattr(quote_providers.yf, "download", download)
+    provider = YahooQuoteProvider(max_threads=4)
+
+    assert provider.fetch_quotes(["AAPL", "MSFT"]) == {}
+    assert provider.fetch_quotes([f"SYM{i}" for i in range(10)]) == {}
+
+    assert [call["threads"] for call in calls] == [2, 4]
+    assert calls[0]["tickers"] == "AAPL MSFT"
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Tests for the quote cache: single-flight loading, TTL expiry and LRU eviction.
+"""
+
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "backend"))
+
+from utils.quote_cache import QuoteCache
+
+
+def wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out waiting for condition"
+        time.sleep(0.001)
+
+
+def test_concurrent_misses_are_loaded_once():
+    cache = QuoteCache(ttl=60)
+    release = threading.Event()
+    calls = []
+
+    def loader(keys):
+        calls.append(list(keys))
+        release.wait(5)
+        return {key: f"{key}-quote" for key in keys}
+
+    results = {}
+    first = threading.Thread(
+        target=lambda: results.update(first=cache.get_or_load_many(["AAPL"], loader))
+    )
+    first.start()
+    wait_until(lambda: calls)
+
+    second = threading.Thread(
+        target=lambda: results.update(
+            second=cache.get_or_load_many(["AAPL", "MSFT"], loader)
+        )
+    )
+    second.start()
+    wait_until(lambda: cache.coalesced == 1 and len(calls) == 2)
+    release.set()
+    first.join(5)
+    second.join(5)
+
+    # The second caller only loaded the key nobody else was loading
+    assert calls == [["AAPL"], ["MSFT"]]
+    assert results["first"] == {"AAPL": "AAPL-quote"}
+    assert results["second"] == {"AAPL": "AAPL-quote", "MSFT": "MSFT-quote"}
+    assert cache.get("AAPL") == "AAPL-quote"
+    assert cache.stats()["misses"] == 2
+
+
+def test_loader_error_reaches_every_waiter_and_is_not_cached():
+    cache = QuoteCache(ttl=60)
+    started = threading.Event()
+    release = threading.Event()
+
+    def failing_loader(keys):
+        started.set()
+        release.wait(5)
+        raise RuntimeError("upstream down")
+
+    errors = []
+
+    def call():
+        try:
+            cache.get_or_load_many(["AAPL"], failing_loader)
+        except RuntimeError as e:
+            errors.append(e)
+
+    owner = threading.Thread(target=call)
+    owner.start()
+    started.wait(5)
+    waiter = threading.Thread(target=call)
+    waiter.start()
+    wait_until(lambda: cache.coalesced == 1)
+    release.set()
+    owner.join(5)
+    waiter.join(5)
+
+    assert len(errors) == 2
+    assert all(str(e) == "upstream down" for e in errors)
+
+    # The failure is not remembered: the next caller loads again
+    assert cache.get_or_load("AAPL", lambda key: 1.0) == 1.0
+
+
+def test_key_missing_from_loader_result_raises():
+    cache = QuoteCache(ttl=60)
+
+    with pytest.raises(KeyError):
+        cache.get_or_load_many(["AAPL", "MSFT"], lambda keys: {"AAPL": 1.0})
+
+    assert cache.get("AAPL") == 1.0
+    assert cache.get("MSFT") is None
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = QuoteCache(ttl=10, clock=clock)
+    cache.set("AAPL", 1.0)
+
+    clock.now = 9.9
+    assert cache.get("AAPL") == 1.0
+
+    clock.now = 10.0
+    assert cache.get("AAPL") is None
+    assert cache.stats()["size"] == 0
+
+    loads = []
+    cache.get_or_load("AAPL", lambda key: loads.append(key) or 2.0)
+    assert loads == ["AAPL"]
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = QuoteCache(ttl=60, max_size=2)
+    cache.set("AAPL", 1.0)
+    cache.set("MSFT", 2.0)
+
+    # Reading AAPL makes MSFT the least recently used
+    assert cache.get("AAPL") == 1.0
+    cache.set("NVDA", 3.0)
+
+    assert cache.get("MSFT") is None
+    assert cache.get("AAPL") == 1.0
+    assert cache.get("NVDA") == 3.0
+    assert cache.evictions == 1
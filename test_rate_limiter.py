@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Tests for the token bucket rate limiter: waiting versus failing fast.
+"""
+
+import os
+import sys
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "backend"))
+
+from utils.rate_limiter import TokenBucket
+
+
+def make_bucket(clock, rate=1.0, capacity=2):
+    sleeps = []
+    bucket = TokenBucket("test", rate, capacity, clock=clock, sleep=sleeps.append)
+    return bucket, sleeps
+
+
+def test_burst_up_to_capacity_without_waiting(clock):
+    bucket, sleeps = make_bucket(clock, capacity=2)
+
+    assert bucket.acquire()
+    assert bucket.acquire()
+    assert sleeps == []
+    assert bucket.acquired == 2
+
+
+def test_fail_fast_when_empty_consumes_nothing(clock):
+    bucket, sleeps = make_bucket(clock, capacity=1)
+    assert bucket.acquire()
+
+    assert not bucket.acquire(timeout=0)
+    assert bucket.throttled == 1
+    assert sleeps == []
+
+    # The refused call did not reserve a token
+    clock.now = 1.0
+    assert bucket.acquire(timeout=0)
+
+
+def test_waits_for_refill_within_timeout(clock):
+    bucket, sleeps = make_bucket(clock, rate=2.0, capacity=1)
+    assert bucket.acquire()
+
+    assert bucket.acquire(timeout=1.0)
+    assert sleeps == [0.5]
+    assert bucket.waited == 1
+    assert bucket.stats()["waited_seconds"] == 0.5
+
+
+def test_refuses_when_wait_exceeds_timeout(clock):
+    bucket, sleeps = make_bucket(clock, rate=0.5, capacity=1)
+    assert bucket.acquire()
+
+    assert not bucket.acquire(timeout=1.0)
+    assert sleeps == []
+
+    # No deadline: waits as long as needed
+    assert bucket.acquire(timeout=None)
+    assert sleeps == [2.0]
+
+
+def test_tokens_refill_up_to_capacity(clock):
+    bucket, _ = make_bucket(clock, rate=1.0, capacity=2)
+    assert bucket.acquire()
+    assert bucket.acquire()
+
+    clock.now = 100.0
+    assert bucket.stats()["available_tokens"] == 2
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Tests for the time-decayed per-symbol sentiment accumulator.
+"""
+
+import os
+import sys
+from datetime import datetime, timezone
+
+import pytest
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "backend"))
+
+from data_collectors.sentiment_accumulator import (
+    SentimentAccumulator,
+    published_timestamp,
+)
+
+HALF_LIFE = 3600
+
+
+def scores(compound):
+    return {"compound": compound, "positive": 0.5, "negative": 0.1, "neutral": 0.4}
+
+
+@pytest.fixture
+def accumulator(clock):
+    clock.now = 100_000.0
+    return SentimentAccumulator(half_life=HALF_LIFE, clock=clock)
+
+
+def test_published_timestamp_parses_iso_and_rfc822():
+    expected = datetime(2024, 3, 1, 12, tzinfo=timezone.utc).timestamp()
+
+    assert published_timestamp("2024-03-01T12:00:00Z", 0) == expected
+    assert published_timestamp("Fri, 01 Mar 2024 12:00:00 GMT", 0) == expected
+    assert published_timestamp("2024-03-01T12:00:00", 0) == expected
+    assert published_timestamp("yesterday", 7.0) == 7.0
+    assert published_timestamp(None, 7.0) == 7.0
+
+
+def test_unknown_symbol_has_no_averages(accumulator):
+    assert accumulator.get("AAPL") is None
+    assert "AAPL" not in accumulator
+
+
+def test_older_articles_count_less(accumulator, clock):
+    accumulator.add("AAPL", scores(1.0), clock.now)
+    accumulator.add("AAPL", scores(-1.0), clock.now - HALF_LIFE)
+
+    result = accumulator.get("AAPL")
+
+    # Weights 1 and 0.5: (1 - 0.5) / 1.5
+    assert result["compound"] == pytest.approx(1 / 3)
+    assert result["positive"] == pytest.approx(0.5)
+    assert result["weight"] == pytest.approx(1.5)
+    assert result["count"] == 2
+
+
+def test_arrival_order_does_not_matter(clock):
+    articles = [
+        (scores(0.8), clock.now - 2 * HALF_LIFE),
+        (scores(-0.2), clock.now),
+        (scores(0.1), clock.now - HALF_LIFE),
+    ]
+    forward = SentimentAccumulator(half_life=HALF_LIFE, clock=clock)
+    backward = SentimentAccumulator(half_life=HALF_LIFE, clock=clock)
+
+    forward.add_many("AAPL", articles)
+    backward.add_many("AAPL", reversed(articles))
+
+    assert forward.get("AAPL")["compound"] == pytest.approx(
+        backward.get("AAPL")["compound"]
+    )
+
+
+def test_weight_decays_but_averages_hold(accumulator, clock):
+    accumulator.add("AAPL", scores(0.6), clock.now)
+    before = accumulator.get("AAPL")
+
+    clock.now += 2 * HALF_LIFE
+    after = accumulator.get("AAPL")
+
+    assert after["compound"] == pytest.approx(before["compound"])
+    assert after["weight"] == pytest.approx(before["weight"] / 4)
+
+
+def test_future_articles_are_clamped_to_now(accumulator, clock):
+    accumulator.add("AAPL", scores(0.4), clock.now + 3600)
+
+    result = accumulator.get("AAPL")
+
+    assert result["as_of"] == clock.now
+    assert result["weight"] == pytest.approx(1.0)
+
+
+def test_stats_counts_symbols_and_articles(accumulator, clock):
+    accumulator.add_many("AAPL", [(scores(0.1), clock.now)] * 3)
+    accumulator.add("MSFT", scores(0.2), clock.now)
+
+    assert accumulator.stats() == {
+        "symbols": 2,
+        "articles": 4,
+        "half_life": HALF_LIFE,
+    }
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Tests for memoized sentiment scores and their SQLite backing.
+"""
+
+import os
+import sys
+import threading
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "backend"))
+
+from data_collectors.sentiment_memo import SCORE_FIELDS, SentimentMemo
+
+
+class CountingScorer:
+    def __init__(self):
+        self.texts = []
+        self._lock = threading.Lock()
+
+    def __call__(self, text):
+        with self._lock:
+            self.texts.append(text)
+        return {field: len(text) / 100 for field in SCORE_FIELDS}
+
+
+def test_normalized_text_is_scored_once():
+    scorer = CountingScorer()
+    memo = SentimentMemo(scorer)
+
+    first = memo.get_or_score("Apple shares rally")
+    second = memo.get_or_score("  apple SHARES   rally ")
+
+    assert scorer.texts == ["Apple shares rally"]
+    assert first == second
+    assert memo.stats()["hits"] == 1
+
+
+def test_version_change_rescores():
+    scorer = CountingScorer()
+    pipeline = {"version": "fast"}
+    memo = SentimentMemo(scorer, version=lambda: pipeline["version"])
+
+    memo.get_or_score("Apple shares rally")
+    pipeline["version"] = "nltk"
+    memo.get_or_score("Apple shares rally")
+
+    assert len(scorer.texts) == 2
+
+
+def test_unscorable_texts_are_not_memoized():
+    calls = []
+
+    def batch_scorer(texts):
+        calls.append(texts)
+        return [None for _ in texts]
+
+    memo = SentimentMemo(None, batch_scorer=batch_scorer)
+
+    assert memo.get_or_score_many(["a", "b", "a"]) == [None, None, None]
+    assert memo.get_or_score("a") is None
+    assert calls == [["a", "b"], ["a"]]
+
+
+def test_scores_survive_a_restart(db_manager):
+    SentimentMemo(CountingScorer(), db_manager=db_manager).get_or_score("Apple up")
+
+    scorer = CountingScorer()
+    restarted = SentimentMemo(scorer, db_manager=db_manager)
+
+    assert restarted.get_or_score("Apple up")["compound"] == 0.08
+    assert scorer.texts == []
+    assert restarted.stats()["db_hits"] == 1
+
+
+def test_counters_add_up_under_concurrency():
+    memo = SentimentMemo(CountingScorer())
+
+    def score(worker):
+        for i in range(200):
+            memo.get_or_score_many([f"worker {worker} headline {i}"] * 2)
+
+    threads = [threading.Thread(target=score, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = memo.stats()
+    assert stats["misses"] == 8 * 200
+    assert stats["hits"] == 0
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Tests for the synthetic market used offline and for load testing.
+"""
+
+import os
+import sys
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "backend"))
+
+from data_collectors.fundamentals_store import FundamentalsStore
+from data_collectors.synthetic_market import SyntheticMarket, SyntheticQuoteProvider
+
+
+class Calendar:
+    def __init__(self, day):
+        self.day = day
+
+    def __call__(self):
+        return self.day
+
+
+def test_same_seed_gives_same_market():
+    first = SyntheticMarket(seed=1).simulate_paths(["AAPL", "MSFT"], 50)
+    second = SyntheticMarket(seed=1).simulate_paths(["AAPL", "MSFT"], 50)
+
+    assert first.shape == (2, 50)
+    np.testing.assert_array_equal(first, second)
+
+
+def test_change_is_measured_against_previous_close():
+    calendar = Calendar(date(2026, 10, 15))
+    market = SyntheticMarket(seed=1, today=calendar)
+
+    for _ in range(20):
+        quote = market.quotes(["AAPL"])["AAPL"]
+    assert quote["change"] == round(quote["current_price"] - 150.0, 2)
+
+    # The next day opens at the last price, which becomes the previous close
+    last_price = quote["current_price"]
+    calendar.day += timedelta(days=1)
+    quote = market.quotes(["AAPL"], advance=False)["AAPL"]
+
+    assert quote["change"] == 0.0
+    assert quote["open_price"] == quote["high_price"] == last_price
+    assert quote["low_price"] == last_price
+
+    quote = market.quotes(["AAPL"])["AAPL"]
+    assert abs(quote["change"] - (quote["current_price"] - last_price)) < 0.011
+
+
+def test_daily_bars_do_not_depend_on_requested_range():
+    market = SyntheticMarket(seed=3)
+    today = date.today()
+
+    long = market.daily_bars("AAPL", today - timedelta(days=120), today)
+    short = market.daily_bars("AAPL", today - timedelta(days=20), today)
+
+    pd.testing.assert_frame_equal(long.tail(len(short)).reset_index(drop=True), short)
+    assert (long["low"] <= long[["open", "close"]].min(axis=1)).all()
+    assert (long["high"] >= long[["open", "close"]].max(axis=1)).all()
+
+
+def test_unfetched_fundamentals_keep_synthetic_values():
+    provider = SyntheticQuoteProvider(SyntheticMarket(seed=1))
+    store = FundamentalsStore(lambda symbol: None)
+
+    quote = store.merge_into(provider.fetch_quotes(["AAPL"])["AAPL"])
+
+    assert quote["market_cap"] > 0
+    assert quote["pe_ratio"] > 0
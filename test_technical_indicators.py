@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Tests for the streaming technical indicators against the batch computation.
+"""
+
+import os
+import sys
+from datetime import date, datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add backend to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "backend"))
+
+from data_collectors.quote_providers import QuoteProvider
+from data_collectors.stock_data_collector import StockDataCollector
+from ml_models.technical_indicators import IndicatorEngine, IndicatorSet
+
+
+def random_walk(n=120, seed=7):
+    rng = np.random.default_rng(seed)
+    return 100 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+
+
+def streamed(closes):
+    indicators = IndicatorSet()
+    for close in closes:
+        indicators.update(close)
+    return indicators
+
+
+def assert_same_values(actual, expected):
+    assert actual.keys() == expected.keys()
+    for name, value in expected.items():
+        if value is None:
+            assert actual[name] is None, name
+        else:
+            assert actual[name] == pytest.approx(value, abs=1e-3), name
+
+
+@pytest.mark.parametrize("n", [1, 15, 30, 34, 120])
+def test_streaming_updates_match_batch_load(n):
+    closes = random_walk(n)
+    batch = IndicatorSet()
+    batch.load(closes)
+
+    assert_same_values(streamed(closes).peek(), batch.peek())
+
+
+def test_peek_matches_committing_the_price():
+    closes = random_walk()
+    indicators = IndicatorSet()
+    indicators.load(closes[:-1])
+
+    assert_same_values(indicators.peek(closes[-1]), streamed(closes).peek())
+
+
+def test_values_match_pandas():
+    closes = random_walk()
+    series = pd.Series(closes)
+    values = streamed(closes).peek()
+
+    assert values["sma_20"] == pytest.approx(series.rolling(20).mean().iloc[-1])
+    assert values["sma_50"] == pytest.approx(series.rolling(50).mean().iloc[-1])
+    assert values["ema_12"] == pytest.approx(
+        series.ewm(span=12, adjust=False).mean().iloc[-1]
+    )
+    middle = series.rolling(20).mean().iloc[-1]
+    std = series.rolling(20).std(ddof=0).iloc[-1]
+    assert values["bollinger_upper"] == pytest.approx(middle + 2 * std, abs=1e-3)
+
+
+def test_values_are_none_until_enough_bars():
+    values = streamed(random_walk(10)).peek()
+
+    assert values["sma_20"] is None
+    assert values["rsi_14"] is None
+    assert values["macd"] is None
+    assert values["bollinger_middle"] is None
+
+
+def test_engine_commits_bar_on_new_trading_day_only():
+    # Friday 2026-10-16 is the last closed bar
+    days = pd.bdate_range(end="2026-10-16", periods=60)
+    closes = random_walk(60)
+    history = {"date": [d.date().isoformat() for d in days], "close": closes.tolist()}
+    engine = IndicatorEngine(lambda symbol: history, today=lambda: date(2026, 10, 17))
+
+    assert engine.get("AAPL")["bars"] == 60
+
+    # Weekend polls without a trading day do not open a bar
+    engine.on_quote("AAPL", {"current_price": 1.0, "timestamp": datetime(2026, 10, 17)})
+    engine.on_quote("AAPL", {"current_price": 1.0, "timestamp": datetime(2026, 10, 18)})
+    assert engine.get("AAPL")["provisional"] is False
+
+    engine.on_quote("AAPL", {"current_price": 101.0, "trading_day": "2026-10-19"})
+    engine.on_quote("AAPL", {"current_price": 102.0, "trading_day": "2026-10-19"})
+    result = engine.get("AAPL")
+    assert result["bars"] == 60
+    assert result["price"] == 102.0
+    assert result["as_of"] == "2026-10-19"
+
+    engine.on_quote("AAPL", {"current_price": 103.0, "trading_day": "2026-10-20"})
+    assert engine.get("AAPL")["bars"] == 61
+    assert_same_values(
+        engine.get("AAPL")["indicators"],
+        streamed(np.append(closes, [102.0, 103.0])).peek(),
+    )
+
+
+def test_symbol_without_recorded_history_is_not_backfilled():
+    histories = {"AAPL": None}
+    engine = IndicatorEngine(lambda symbol: histories[symbol])
+
+    assert engine.get("AAPL") is None
+    engine.on_quote("AAPL", {"current_price": 101.0, "trading_day": "2026-10-19"})
+    assert engine.stats()["symbols"] == 0
+
+    # Retried once the provider has bars
+    days = pd.bdate_range(end="2026-10-16", periods=30)
+    histories["AAPL"] = {
+        "date": [d.date().isoformat() for d in days],
+        "close": random_walk(30).tolist(),
+    }
+    assert engine.get("AAPL")["bars"] == 30
+
+
+def test_collector_history_for_indicators_is_never_simulated():
+    class NoBarsProvider(QuoteProvider):
+        name = "test_no_bars"
+
+        def fetch_daily_bars(self, symbol, start, end):
+            return pd.DataFrame()
+
+    collector = StockDataCollector(quote_provider=NoBarsProvider())
+
+    assert collector.get_recorded_history("AAPL", 30) is None
+    # The chart endpoint still gets simulated bars
+    assert collector.get_historical_data("AAPL", 30, layout="columns")["close"]